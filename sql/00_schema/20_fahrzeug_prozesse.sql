@@ -0,0 +1,58 @@
+-- Prozess-Tabelle, tagesweise partitioniert auf created_at.
+-- Alle Lesepfade filtern auf created_at (Dashboard: 30/7 Tage, Fahrzeug-Historie:
+-- @cutoff) - dadurch liest BigQuery nur die betroffenen Partitionen.
+--
+-- Clustering: status zuerst, da fast jede Dashboard-Abfrage auf den Status filtert
+-- (offen/abgeschlossen, Warteschlange); danach prozess_typ, bearbeiter, fin.
+-- Das Clustering einer bestehenden Tabelle lässt sich ohne Umbau ändern und gilt
+-- dann für neu geschriebene Daten:
+--   bq update --clustering_fields=status,prozess_typ,bearbeiter,fin \
+--     ra-autohaus-tracker:autohaus.fahrzeug_prozesse
+--
+-- Tabellen aus scripts/legacy/setup_bigquery.sh haben keine Spalte zusatz_daten,
+-- die der Service beim Insert mitschreibt. Das ALTER TABLE am Ende dieser Datei
+-- ergänzt sie (idempotent); vor dem Umbau unten muss es gelaufen sein, sonst
+-- übernimmt AS SELECT * die Spalte nicht:
+--   ALTER TABLE `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+--     ADD COLUMN IF NOT EXISTS zusatz_daten STRING;
+--
+-- Partitionierung lässt sich nicht per ALTER TABLE ändern. Eine bestehende,
+-- anders partitionierte Tabelle einmalig umbauen:
+--   CREATE TABLE `ra-autohaus-tracker.autohaus.fahrzeug_prozesse_neu`
+--   PARTITION BY DATE(created_at)
+--   CLUSTER BY status, prozess_typ, bearbeiter, fin
+--   AS SELECT * FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`;
+-- danach alte Tabelle löschen und fahrzeug_prozesse_neu umbenennen
+-- (ALTER TABLE ... RENAME TO fahrzeug_prozesse).
+CREATE TABLE IF NOT EXISTS `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` (
+  prozess_id STRING NOT NULL,
+  fin STRING NOT NULL,
+  prozess_typ STRING NOT NULL,
+  status STRING NOT NULL,
+  bearbeiter STRING,
+  prioritaet INT64 DEFAULT 5,
+  anlieferung_datum DATE,
+  start_timestamp DATETIME,
+  ende_timestamp DATETIME,
+  dauer_minuten INT64,
+  sla_tage INT64,
+  sla_deadline_datum DATE,
+  tage_bis_sla_deadline INT64,
+  standzeit_tage INT64,
+  datenquelle STRING DEFAULT 'api',
+  notizen STRING,
+  zusatz_daten STRING,
+  erstellt_am DATETIME DEFAULT CURRENT_DATETIME(),
+  aktualisiert_am DATETIME DEFAULT CURRENT_DATETIME(),
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP(),
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP()
+)
+PARTITION BY DATE(created_at)
+CLUSTER BY status, prozess_typ, bearbeiter, fin
+OPTIONS(
+  description="Fahrzeugprozesse mit SLA-Informationen (partitioniert auf created_at)"
+);
+
+-- Bestehende (Legacy-)Tabellen um zusatz_daten ergänzen
+ALTER TABLE `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+  ADD COLUMN IF NOT EXISTS zusatz_daten STRING;
@@ -0,0 +1,31 @@
+-- Vorberechneter JOIN Prozesse + Stammdaten für get_fahrzeuge_mit_prozessen.
+-- Clustering auf den beiden Filterspalten (prozess_typ, status) sorgt dafür,
+-- dass BigQuery bei gefilterten Abfragen nur die passenden Blöcke liest.
+-- Partitionierung folgt der Basistabelle fahrzeug_prozesse (DATE(created_at)).
+CREATE OR REPLACE MATERIALIZED VIEW `ra-autohaus-tracker.autohaus.mv_fahrzeuge_prozesse_current`
+PARTITION BY DATE(created_at)
+CLUSTER BY prozess_typ, status
+OPTIONS (
+  enable_refresh = true,
+  refresh_interval_minutes = 30
+)
+AS
+SELECT
+  p.fin,
+  s.marke,
+  s.modell,
+  s.antriebsart,
+  s.farbe,
+  s.baujahr,
+  p.prozess_id,
+  p.prozess_typ,
+  p.status,
+  p.bearbeiter,
+  p.prioritaet,
+  p.standzeit_tage,
+  p.tage_bis_sla_deadline,
+  p.created_at,
+  p.updated_at
+FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` AS p
+LEFT JOIN `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` AS s
+  ON p.fin = s.fin;
@@ -0,0 +1,13 @@
+-- Aktive Fahrzeug-Stammdaten für Punktabfragen per FIN (get_fahrzeug_stamm).
+-- Der aktiv-Filter ist vorberechnet, Clustering auf fin reduziert die
+-- Abfrage auf wenige Blöcke statt eines Scans der ganzen Tabelle.
+CREATE OR REPLACE MATERIALIZED VIEW `ra-autohaus-tracker.autohaus.mv_fahrzeuge_stamm_aktiv`
+CLUSTER BY fin
+OPTIONS (
+  enable_refresh = true,
+  refresh_interval_minutes = 30
+)
+AS
+SELECT *
+FROM `ra-autohaus-tracker.autohaus.fahrzeuge_stamm`
+WHERE aktiv = TRUE;
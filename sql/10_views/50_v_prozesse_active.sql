@@ -0,0 +1,43 @@
+-- Offene Prozesse (ende_timestamp IS NULL) mit Fahrzeug-Stammdaten vorverknüpft.
+-- Dashboard-Abfragen (Warteschlangen, SLA-Übersicht, Workload) lesen nur noch
+-- diese kleine, bereits gejointe Menge statt Prozesse + Stamm bei jedem Aufruf
+-- zu verknüpfen.
+-- sla_kategorie wird beim Refresh berechnet (gleiche Grenzen wie die
+-- SLA-Übersicht); Clustering darauf lässt SLA-Abfragen nur die Blöcke der
+-- gesuchten Kategorie lesen.
+CREATE OR REPLACE MATERIALIZED VIEW `ra-autohaus-tracker.autohaus.v_prozesse_active`
+PARTITION BY DATE(created_at)
+CLUSTER BY sla_kategorie, status, prozess_typ
+OPTIONS (
+  enable_refresh = true,
+  refresh_interval_minutes = 5
+)
+AS
+SELECT
+  p.prozess_id,
+  p.fin,
+  p.prozess_typ,
+  p.status,
+  p.bearbeiter,
+  p.prioritaet,
+  p.start_timestamp,
+  p.standzeit_tage,
+  p.sla_deadline_datum,
+  p.tage_bis_sla_deadline,
+  CASE
+    WHEN p.tage_bis_sla_deadline < 0 THEN 'critical'
+    WHEN p.tage_bis_sla_deadline <= 1 THEN 'warning'
+    WHEN p.tage_bis_sla_deadline IS NOT NULL THEN 'ok'
+  END AS sla_kategorie,
+  p.created_at,
+  p.updated_at,
+  s.marke,
+  s.modell,
+  s.antriebsart,
+  s.farbe,
+  s.baujahr,
+  s.ek_netto
+FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` AS p
+LEFT JOIN `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` AS s
+  ON p.fin = s.fin
+WHERE p.ende_timestamp IS NULL;
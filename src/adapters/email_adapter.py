@@ -9,6 +9,10 @@ from models.integration import EmailInput, UnifiedProcessData
 
 logger = logging.getLogger(__name__)
 
+# HTML-Erkennung und Tag-Entfernung ohne Kopie des (ggf. mehrere MB großen) Bodys per lower()
+_HTML_RE = re.compile(r'<html[\s>]', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class EmailAdapter:
     """Konvertiert E-Mail-Daten zu einheitlichem Format"""
@@ -42,15 +46,14 @@ class EmailAdapter:
         parsed_data = {}
         
         # HTML entfernen falls vorhanden
-        if '<html>' in body.lower():
+        if _HTML_RE.search(body):
             try:
                 from bs4 import BeautifulSoup
                 soup = BeautifulSoup(body, 'html.parser')
                 body = soup.get_text()
             except ImportError:
                 # BeautifulSoup nicht verfügbar - einfaches HTML-Tag-Entfernen
-                import re
-                body = re.sub(r'<[^>]+>', '', body)
+                body = _TAG_RE.sub('', body)
         
         # Alle Patterns anwenden
         for field_name, pattern in self.patterns.items():
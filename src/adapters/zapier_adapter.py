@@ -5,6 +5,7 @@ import logging
 
 # Absolute Imports für Module
 from models.integration import ZapierInput, UnifiedProcessData
+from core.utils import normalize_fin
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,9 @@ class ZapierAdapter:
             if not status: missing.append("status")
             raise ValueError(f"Missing required fields: {missing}")
         
+        # FIN aus Formularfeldern vereinheitlichen (Kleinschreibung, Leerzeichen, Bindestriche)
+        fin = normalize_fin(fin)
+        
         # Datum konvertieren falls vorhanden
         datum_erstzulassung = None
         if zapier_input.datum_erstzulassung:
@@ -2,7 +2,8 @@
 """Dashboard API Routes"""
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
 import logging
 
 from src.services.dashboard_service import DashboardService
@@ -10,7 +11,8 @@ from src.core.dependencies import get_dashboard_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+# orjson serialisiert große Dashboard-Antworten deutlich schneller und datetime direkt
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"], default_response_class=ORJSONResponse)
 
 @router.get("/kpis")
 async def get_kpis(
@@ -38,11 +40,29 @@ async def get_warteschlangen(
         logger.error(f"Warteschlangen Abruf Fehler: {e}")
         raise HTTPException(status_code=500, detail="Warteschlangen konnten nicht abgerufen werden")
 
+@router.get("/all")
+async def get_dashboard_all(
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """
+    Kompletter Dashboard-Stand (KPIs, Warteschlangen, SLA, Workload) in einem Request
+    """
+    try:
+        return await dashboard_service.get_dashboard_snapshot()
+    except Exception as e:
+        logger.error(f"Dashboard Snapshot Fehler: {e}")
+        raise HTTPException(status_code=500, detail="Dashboard konnte nicht abgerufen werden")
+
 @router.get("/health")
-async def dashboard_health():
+async def dashboard_health(
+    dashboard_service: Optional[DashboardService] = Depends(get_dashboard_service)
+):
     """Dashboard Service Gesundheitscheck"""
+    if dashboard_service is None:
+        logger.warning("Dashboard Service nicht verfügbar")
     return {
         "service": "DashboardService",
-        "status": "healthy",
-        "endpoints": ["/dashboard/kpis", "/dashboard/warteschlangen"]
-    }
\ No newline at end of file
+        "status": "healthy" if dashboard_service else "unavailable",
+        "endpoints": ["/dashboard/kpis", "/dashboard/warteschlangen", "/dashboard/all"],
+        "cache": dashboard_service.get_cache_stats() if dashboard_service else "unavailable"
+    }
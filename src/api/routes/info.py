@@ -1,39 +1,46 @@
 # src/api/routes/info.py
 """Info API Routes für System-Informationen"""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from typing import Dict, Any
 
+import orjson
+
 from src.services.info_service import InfoService
 
 router = APIRouter(prefix="/info", tags=["System Info"])
 
+# Die Info-Inhalte sind statisch: Routes liefern die beim Import serialisierten JSON-Bytes
+
 @router.get("/prozesse")
 async def get_prozesse_info():
     """
     Info über alle verfügbaren Prozesse
     """
-    return InfoService.get_prozesse_info()
+    return Response(content=InfoService.get_prozesse_info_json(), media_type="application/json")
 
 @router.get("/bearbeiter")
 async def get_bearbeiter_info():
     """
     Info über alle Bearbeiter
     """
-    return InfoService.get_bearbeiter_info()
+    return Response(content=InfoService.get_bearbeiter_info_json(), media_type="application/json")
 
 @router.get("/system")
 async def get_system_info():
     """
     System-Konfiguration und Einstellungen
     """
-    return InfoService.get_system_config()
+    return Response(content=InfoService.get_system_config_json(), media_type="application/json")
+
+# Health-Antwort ist ebenfalls konstant
+_INFO_HEALTH_JSON = orjson.dumps({
+    "service": "InfoService",
+    "status": "healthy", 
+    "endpoints": ["/info/prozesse", "/info/bearbeiter", "/info/system"]
+})
 
 @router.get("/health")
 async def info_health():
     """Info Service Gesundheitscheck"""
-    return {
-        "service": "InfoService",
-        "status": "healthy", 
-        "endpoints": ["/info/prozesse", "/info/bearbeiter", "/info/system"]
-    }
\ No newline at end of file
+    return Response(content=_INFO_HEALTH_JSON, media_type="application/json")
\ No newline at end of file
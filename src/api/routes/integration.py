@@ -5,9 +5,13 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+import orjson
 from fastapi import APIRouter, Request, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
+from src.core.mappings import BEARBEITER_ALIASES, PROZESS_ALIASES
+from src.core.utils import now_iso
+
 # Import für bereits vorhandene Services
 try:
     from src.services.process_service import ProcessService
@@ -48,15 +52,11 @@ class FlowersEmailData(BaseModel):
     email_subject: Optional[str] = Field(None, description="E-Mail Betreff")
     timestamp: Optional[str] = Field(None, description="Zeitstempel")
 
-# Prozess-Mapping (aus ursprünglicher main.py)
-PROZESS_MAPPING = {
-    "gwa": "Aufbereitung",
-    "garage": "Werkstatt", 
-    "photos": "Foto",
-    "sales": "Verkauf",
-    "purchase": "Einkauf",
-    "delivery": "Anlieferung"
-}
+# Prozess-Mapping (aus ursprünglicher main.py) - gemeinsame Tabelle aus src.core.mappings
+PROZESS_MAPPING = PROZESS_ALIASES
+
+# Hinweis für unvollständige Flexible-Webhooks
+_ERWARTETE_FELDER = ["fin/fahrzeug_fin", "prozess/prozess_name", "status/neuer_status"]
 
 def normalize_prozess_typ(prozess: str) -> str:
     """Normalisiert Prozess-Typen aus verschiedenen Quellen"""
@@ -75,16 +75,18 @@ async def save_to_bigquery(data: Dict[str, Any], source: str) -> bool:
             return False
         bq_client = bq_service.client
         
-        # Event-Daten für BigQuery vorbereiten
+        # Event-Daten für BigQuery vorbereiten (ein Zeitstempel für created_at und updated_at)
+        jetzt = datetime.now().isoformat()
         event_data = {
             "fin": data.get("fin"),
             "prozess_typ": data.get("prozess_typ"),
             "status": data.get("status"),
             "bearbeiter": data.get("bearbeiter"),
             "datenquelle": source,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "zusatz_daten": data.get("zusatz_daten", {})
+            "created_at": jetzt,
+            "updated_at": jetzt,
+            # Spalte ist STRING - Zusatzdaten als JSON-Text schreiben
+            "zusatz_daten": orjson.dumps(data.get("zusatz_daten") or {}, default=str).decode()
         }
         
         # In BigQuery einfügen - KORRIGIERT für autohaus Dataset
@@ -97,7 +99,7 @@ async def save_to_bigquery(data: Dict[str, Any], source: str) -> bool:
             logger.error(f"BigQuery Insert Fehler: {errors}")
             return False
             
-        logger.info(f"Daten erfolgreich in BigQuery gespeichert: {data.get('fin')}")
+        logger.info("Daten erfolgreich in BigQuery gespeichert: %s", data.get('fin'))
         return True
         
     except Exception as e:
@@ -153,7 +155,7 @@ async def zapier_webhook(
         # In Background Task speichern
         background_tasks.add_task(save_to_bigquery, event_data, "zapier_webhook")
         
-        logger.info(f"Zapier Webhook verarbeitet: {fin} -> {prozess} -> {status}")
+        logger.info("Zapier Webhook verarbeitet: %s -> %s -> %s", fin, prozess, status)
         
         return {
             "status": "success",
@@ -162,7 +164,7 @@ async def zapier_webhook(
             "prozess_typ": prozess,
             "status": status,
             "bearbeiter": bearbeiter,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except HTTPException:
@@ -181,7 +183,8 @@ async def zapier_flexible_webhook(
     """
     try:
         json_data = await request.json()
-        logger.info(f"Flexible Zapier Webhook: {json_data}")
+        # Payload erst formatieren, wenn INFO tatsächlich ausgegeben wird
+        logger.info("Flexible Zapier Webhook: %s", json_data)
         
         # FIN extrahieren (verschiedene mögliche Feldnamen)
         fin = (json_data.get('fahrzeug_fin') or 
@@ -204,7 +207,7 @@ async def zapier_flexible_webhook(
                 "status": "error",
                 "message": "Required fields missing (fin, prozess, status)",
                 "received_fields": list(json_data.keys()),
-                "expected_fields": ["fin/fahrzeug_fin", "prozess/prozess_name", "status/neuer_status"]
+                "expected_fields": _ERWARTETE_FELDER
             }
         
         # Normalisierte Verarbeitung
@@ -228,7 +231,7 @@ async def zapier_flexible_webhook(
         # In Background Task speichern
         background_tasks.add_task(save_to_bigquery, event_data, "zapier_flexible")
         
-        logger.info(f"Flexible Zapier Webhook verarbeitet: {fin} -> {prozess} -> {status}")
+        logger.info("Flexible Zapier Webhook verarbeitet: %s -> %s -> %s", fin, prozess, status)
         
         return {
             "status": "success",
@@ -251,25 +254,44 @@ async def zapier_flexible_webhook(
 # DEBUG & HEALTH ENDPOINTS
 # ================================
 
+# Debug- und Health-Inhalte sind statisch - einmal beim Import aufbauen statt pro Aufruf
+_DEBUG_MAPPINGS: Dict[str, Any] = {
+    "prozess_mapping": dict(PROZESS_MAPPING),
+    "bearbeiter_mapping": dict(BEARBEITER_ALIASES),
+    "supported_sources": ["zapier_webhook", "zapier_flexible", "flowers_email", "flowers_direct"],
+    "bigquery_config": {
+        "dataset": "autohaus",
+        "table": "fahrzeug_prozesse"
+    },
+    "example_zapier_data": {
+        "fahrzeug_fin": "WAUEXAMPLE123456",
+        "prozess_name": "gwa",
+        "neuer_status": "abgeschlossen",
+        "bearbeiter_name": "Thomas K."
+    }
+}
+
+_HEALTH_ENDPOINTS: Dict[str, Any] = {
+    "zapier": [
+        "/integration/zapier/webhook",
+        "/integration/zapier/flexible"
+    ],
+    "flowers": [
+        "/integration/email/webhook",
+        "/integration/flowers/webhook"
+    ],
+    "debug": [
+        "/integration/debug/mappings",
+        "/integration/health"
+    ]
+}
+
 @router.get("/debug/mappings")
 async def get_debug_mappings():
     """
     Debug-Endpoint für Prozess-Mappings
     """
-    return {
-        "prozess_mapping": PROZESS_MAPPING,
-        "supported_sources": ["zapier_webhook", "zapier_flexible", "flowers_email", "flowers_direct"],
-        "bigquery_config": {
-            "dataset": "autohaus",
-            "table": "fahrzeug_prozesse"
-        },
-        "example_zapier_data": {
-            "fahrzeug_fin": "WAUEXAMPLE123456",
-            "prozess_name": "gwa",
-            "neuer_status": "abgeschlossen",
-            "bearbeiter_name": "Thomas K."
-        }
-    }
+    return _DEBUG_MAPPINGS
 
 @router.get("/health")
 async def integration_health():
@@ -280,20 +302,7 @@ async def integration_health():
         "service": "IntegrationService",
         "status": "healthy",
         "bigquery_verfügbar": get_bigquery_client() is not None,
-        "endpoints": {
-            "zapier": [
-                "/integration/zapier/webhook",
-                "/integration/zapier/flexible"
-            ],
-            "flowers": [
-                "/integration/email/webhook",
-                "/integration/flowers/webhook"
-            ],
-            "debug": [
-                "/integration/debug/mappings",
-                "/integration/health"
-            ]
-        },
+        "endpoints": _HEALTH_ENDPOINTS,
         "prozess_mappings": len(PROZESS_MAPPING),
         "version": "2.0.0"
     }
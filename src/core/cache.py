@@ -0,0 +1,271 @@
+# src/core/cache.py - In-Process Cache für Abfrage-Ergebnisse
+"""TTL/LRU-Cache für teure Service-Abfragen (z.B. Dashboard-KPIs).
+
+Stufe 1 liegt im Prozess, optional teilt eine Redis-Stufe (REDIS_URL) die
+Ergebnisse zwischen mehreren Workern.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_client(url: str):
+    """Ein Redis-Client (Verbindungspool) je URL für alle Cache-Instanzen des Prozesses"""
+    return aioredis.from_url(url)
+
+
+class RedisCache:
+    """Zweite Cache-Stufe in Redis/Memorystore - Werte als orjson-Bytes mit Ablaufzeit.
+
+    Abgelegt werden nur JSON-native Werte, die unverändert zurückgelesen werden
+    (dict/list/str/int/float/bool/None). Werte mit z.B. datetime oder Tupeln bleiben
+    in Stufe 1, damit ein Redis-Treffer dieselben Typen liefert wie ein L1-Treffer.
+    """
+
+    def __init__(self, client, ttl: float = 300, prefix: str = "dash:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_env(cls, ttl: float = 300, prefix: str = "dash:") -> Optional["RedisCache"]:
+        """Redis-Stufe aus REDIS_URL anlegen (None wenn nicht konfiguriert/installiert)"""
+        url = os.getenv("REDIS_URL")
+        if not url:
+            return None
+        if aioredis is None or orjson is None:
+            logger.warning("REDIS_URL gesetzt, aber redis/orjson nicht installiert - nur In-Process Cache")
+            return None
+        return cls(_redis_client(url), ttl=ttl, prefix=prefix)
+
+    def _redis_key(self, key: Hashable) -> str:
+        return self.prefix + hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Wert lesen - Redis-Fehler gelten als Cache-Miss"""
+        try:
+            raw = await self.client.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"Redis Cache Lesefehler: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        """Wert schreiben - Redis-Fehler werden nur protokolliert"""
+        try:
+            raw = orjson.dumps(value)
+            verlustfrei = orjson.loads(raw) == value
+        except TypeError:
+            verlustfrei = False
+        if not verlustfrei:
+            logger.debug("Redis Cache: Wert nicht JSON-nativ, nur In-Process gecacht (%s)", key)
+            return
+        
+        try:
+            await self.client.set(self._redis_key(key), raw, ex=int(self.ttl))
+        except Exception as e:
+            logger.warning(f"Redis Cache Schreibfehler: {e}")
+
+    async def acquire(self, key: Hashable, timeout: float = 10) -> bool:
+        """Worker-übergreifende Ladesperre setzen (True wenn dieser Worker laden soll)"""
+        try:
+            return bool(await self.client.set(
+                self._redis_key(key) + ":lock", b"1", nx=True, ex=int(timeout)
+            ))
+        except Exception as e:
+            logger.warning(f"Redis Cache Sperrfehler: {e}")
+            return True
+
+    async def release(self, key: Hashable) -> None:
+        """Ladesperre wieder freigeben"""
+        try:
+            await self.client.delete(self._redis_key(key) + ":lock")
+        except Exception as e:
+            logger.warning(f"Redis Cache Sperrfehler: {e}")
+
+
+class QueryCache:
+    """Async-sicherer LRU-Cache mit TTL pro Eintrag.
+
+    Gleichzeitige Anfragen auf denselben Schlüssel warten auf eine gemeinsame
+    Ladeoperation (Pending-Eintrag), statt die Abfrage mehrfach auszulösen.
+    Jeder Aufrufer erhält eine eigene (tiefe) Kopie - Änderungen am Ergebnis
+    wirken sich nicht auf den Cache-Eintrag oder andere Aufrufer aus.
+    Mit l2 wird vor dem Laden in Redis nachgesehen; lädt bereits ein anderer
+    Worker, wird kurz auf dessen Ergebnis gewartet. Ohne Loader (Wert entsteht
+    beim Schreiben, z.B. "Fahrzeug existiert" nach einem MERGE) lesen und
+    schreiben lookup/store beide Stufen.
+    """
+
+    # Warten auf das Ergebnis eines anderen Workers: Anzahl Versuche x Intervall (Sekunden)
+    L2_WAIT_ATTEMPTS = 20
+    L2_WAIT_INTERVAL = 0.1
+
+    def __init__(self, maxsize: int = 256, l2: Optional[RedisCache] = None):
+        self.maxsize = maxsize
+        self.l2 = l2
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Wert aus dem Cache liefern oder über loader laden und ablegen"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(value)
+            del self._entries[key]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        task = asyncio.ensure_future(self._load(key, loader, cacheable))
+        self._pending[key] = task
+        try:
+            value = await asyncio.shield(task)
+        finally:
+            self._pending.pop(key, None)
+
+        if cacheable is None or cacheable(value):
+            self.set(key, value, ttl)
+
+        # set() legt eine Kopie ab, gleichzeitig Wartende kopieren selbst - Original gehört diesem Aufrufer
+        return value
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Wert aus Redis holen oder neu laden (und dort für andere Worker ablegen)"""
+        if self.l2 is None:
+            self.misses += 1
+            return await loader()
+
+        value = await self.l2.get(key)
+        if value is not None:
+            self.l2_hits += 1
+            return value
+
+        locked = await self.l2.acquire(key)
+        if not locked:
+            # Anderer Worker lädt bereits - auf dessen Ergebnis warten
+            for _ in range(self.L2_WAIT_ATTEMPTS):
+                await asyncio.sleep(self.L2_WAIT_INTERVAL)
+                value = await self.l2.get(key)
+                if value is not None:
+                    self.l2_hits += 1
+                    return value
+
+        try:
+            self.misses += 1
+            value = await loader()
+            if cacheable is None or cacheable(value):
+                await self.l2.set(key, value)
+            return value
+        finally:
+            if locked:
+                await self.l2.release(key)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Gültigen Wert aus Stufe 1 liefern ohne zu laden (None wenn nicht vorhanden/abgelaufen)"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+    
+    async def lookup(self, key: Hashable) -> Optional[Any]:
+        """Wert aus Stufe 1, sonst aus Redis liefern ohne zu laden (None wenn nicht vorhanden)"""
+        value = self.peek(key)
+        if value is not None or self.l2 is None:
+            return value
+        value = await self.l2.get(key)
+        if value is not None:
+            self.l2_hits += 1
+            self.set(key, value, self.l2.ttl)
+        return value
+
+    async def store(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Wert in Stufe 1 und (falls aktiv) in Redis ablegen"""
+        self.set(key, value, ttl)
+        if self.l2 is not None:
+            await self.l2.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Wert direkt in Stufe 1 ablegen (z.B. nach einem Schreibvorgang bekannter Zustand)"""
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Alle Einträge der Stufe 1 verwerfen"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Trefferstatistik je Stufe für Health-/Monitoring-Endpunkte"""
+        total = self.hits + self.l2_hits + self.misses
+        return {
+            "eintraege": len(self._entries),
+            "hits": self.hits,
+            "l2_aktiv": self.l2 is not None,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.l2_hits) / total, 3) if total else 0.0
+        }
+
+
+def cached_query(ttl: float, cacheable: Optional[Callable[[Any], bool]] = None):
+    """Decorator für async Service-Methoden: Ergebnis im QueryCache der Instanz (self._cache) ablegen.
+
+    Schlüssel ist Methodenname + Argumente; ohne self._cache wird direkt ausgeführt.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[QueryCache] = getattr(self, "_cache", None)
+            if cache is None:
+                return await func(self, *args, **kwargs)
+
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            return await cache.get_or_load(
+                key, lambda: func(self, *args, **kwargs), ttl, cacheable
+            )
+        return wrapper
+    return decorator
@@ -8,6 +8,7 @@ from src.services.vehicle_service import VehicleService
 from src.services.dashboard_service import DashboardService
 from src.services.process_service import ProcessService
 from src.services.info_service import InfoService
+from src.handlers.flowers_handler import FlowersHandler
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +18,19 @@ _vehicle_service: Optional[VehicleService] = None
 _dashboard_service: Optional[DashboardService] = None
 _process_service: Optional[ProcessService] = None
 _info_service: Optional[InfoService] = None
+_flowers_handler: Optional[FlowersHandler] = None
 
 def set_bigquery_service(bq_service: BigQueryService):
     """BigQuery Service für alle anderen Services setzen"""
-    global _bq_service, _vehicle_service, _dashboard_service, _process_service, _info_service
+    global _bq_service, _vehicle_service, _dashboard_service, _process_service, _info_service, _flowers_handler
     
     _bq_service = bq_service
+    _flowers_handler = FlowersHandler(bigquery_service=bq_service)
     
     # Alle anderen Services mit BigQueryService initialisieren
     _vehicle_service = VehicleService(bq_service=bq_service)
     _dashboard_service = DashboardService(bq_service=bq_service)
-    _process_service = ProcessService(bq_service=bq_service)
+    _process_service = ProcessService(bq_service=bq_service, flowers_handler=_flowers_handler)
     _info_service = InfoService()  # InfoService braucht keine BigQuery-Verbindung
     
     logger.info("✅ Alle Services mit BigQueryService initialisiert")
@@ -52,6 +55,10 @@ def get_info_service() -> Optional[InfoService]:
     """Info Service abrufen"""
     return _info_service
 
+def get_flowers_handler() -> Optional[FlowersHandler]:
+    """Flowers Handler abrufen"""
+    return _flowers_handler
+
 def get_services_health() -> dict:
     """Health Status aller Services"""
     return {
@@ -0,0 +1,57 @@
+# src/core/mappings.py - Gemeinsame Alias-Tabellen
+"""Schreibgeschützte Alias-Tabellen für Prozesse und Bearbeiter.
+
+Einmal beim Import angelegt und von Services und Routes gemeinsam genutzt,
+damit keine abweichenden Kopien entstehen.
+"""
+
+from types import MappingProxyType
+
+# Prozess-Begriffe (kleingeschrieben) -> einer der 6 Hauptprozesse.
+# Einzige Tabelle für Flowers (E-Mail/Webhook) und Zapier-Routes.
+PROZESS_ALIASES = MappingProxyType({
+    # 6 Standard-Hauptprozesse
+    "einkauf": "Einkauf",
+    "anlieferung": "Anlieferung",
+    "aufbereitung": "Aufbereitung",
+    "foto": "Foto",
+    "werkstatt": "Werkstatt",
+    "verkauf": "Verkauf",
+    
+    # Flowers-Legacy-Begriffe
+    "gwa": "Aufbereitung",
+    "garage": "Werkstatt",
+    "fotoshooting": "Foto",
+    "transport": "Anlieferung",
+    "ankauf": "Einkauf",
+    "(0) start fahrzeugaufbereitung": "Aufbereitung",
+    "(4.0) werkstattplanung": "Werkstatt",
+    "(1) da fahrzeuganlage": "Einkauf",
+    
+    # Zapier/Legacy main.py (englisch)
+    "photos": "Foto",
+    "sales": "Verkauf",
+    "purchase": "Einkauf",
+    "delivery": "Anlieferung"
+})
+
+# Bearbeiter-Kurzformen -> vollständiger Name
+BEARBEITER_ALIASES = MappingProxyType({
+    "Thomas K.": "Thomas Küfner",
+    "Max R.": "Maximilian Reinhardt",
+    "Hans M.": "Hans Müller",
+    "Anna K.": "Anna Klein",
+    "Thomas W.": "Thomas Weber",
+    "Stefan B.": "Stefan Becker",
+    "Mike S.": "Michael Schmidt",
+    "Jürgen": "Jürgen Hoffmann",
+    "Klaus": "Klaus Neumann",
+    "Sandra": "Sandra Richter",
+    "Alex": "Alexander König",
+})
+
+# Case-insensitiver Index: Kurzformen und vollständige Namen (kleingeschrieben) -> vollständiger Name
+BEARBEITER_INDEX = MappingProxyType({
+    **{name.lower(): name for name in BEARBEITER_ALIASES.values()},
+    **{alias.lower(): name for alias, name in BEARBEITER_ALIASES.items()},
+})
@@ -0,0 +1,58 @@
+# src/core/utils.py - Kleine gemeinsame Hilfsfunktionen
+"""Gemeinsame Hilfsfunktionen für Services und Routes"""
+
+import os
+import random
+import time
+from datetime import datetime
+
+# Auflösung des gecachten Zeitstempels in Sekunden
+_NOW_ISO_TTL = 0.25
+
+# [Zeitpunkt der Berechnung, formatierter Zeitstempel]
+_now_iso_cache = [0.0, ""]
+
+
+def now_iso() -> str:
+    """Aktueller Zeitstempel als ISO-String, höchstens _NOW_ISO_TTL Sekunden alt.
+
+    Für Antwort-Zeitstempel (Health, Info) - gleichzeitige Requests teilen sich
+    einen formatierten String. Nicht für gespeicherte Datensätze verwenden.
+    """
+    t = time.time()
+    if t - _now_iso_cache[0] > _NOW_ISO_TTL:
+        _now_iso_cache[1] = datetime.fromtimestamp(t).isoformat()
+        _now_iso_cache[0] = t
+    return _now_iso_cache[1]
+
+
+# Zufallsquelle für Prozess-IDs: einmal aus os.urandom geseedet statt ein Syscall pro ID.
+# Nach fork (gunicorn-Worker) neu seeden, sonst erzeugen alle Worker dieselbe Folge.
+_id_rng = random.Random(os.urandom(32))
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _id_rng.seed(os.urandom(32)))
+
+
+def new_process_id() -> str:
+    """Neue Prozess-ID: PROC_ + Millisekunden-Zeitstempel (hex) + 32 Zufallsbits.
+
+    Zeitlich sortierbar - neue Prozesse landen in BigQuery nah beieinander.
+    """
+    return f"PROC_{time.time_ns() // 1_000_000:011x}{_id_rng.getrandbits(32):08x}"
+
+
+# FIN-Normalisierung in einem Durchlauf: Kleinbuchstaben -> Großbuchstaben, Trennzeichen entfernen
+_FIN_TRANSLATE = str.maketrans({
+    **{c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"},
+    "-": None,
+    " ": None,
+})
+
+
+def normalize_fin(fin: str) -> str:
+    """FIN vereinheitlichen: Großschreibung, ohne Leerzeichen/Bindestriche (ein str.translate-Durchlauf).
+
+    Nur Standardbibliothek - auch von Adaptern importierbar, die ohne src-Paket laufen.
+    """
+    return fin.translate(_FIN_TRANSLATE)
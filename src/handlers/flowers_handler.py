@@ -1,14 +1,69 @@
 # src/handlers/flowers_handler.py
 import re
-import uuid
 import logging
+from types import MappingProxyType
 from datetime import datetime, date
 from typing import Dict, Optional, Any, List, Union
 from email.mime.text import MIMEText
-import json
+
+from src.core.mappings import PROZESS_ALIASES
+from src.core.utils import new_process_id, normalize_fin
+
+# RE2 (google-re2, in requirements.txt): lineare Laufzeit ohne Backtracking, gleiche search/finditer-API.
+# Fallback auf re nur für Umgebungen ohne das Wheel (z.B. lokale Tests) - die Patterns sind so
+# geschrieben, dass beide Engines dieselben Treffer liefern. Flags stehen inline im Pattern ((?i), (?m)).
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
 
 logger = logging.getLogger(__name__)
 
+# FIN-Muster einmalig kompilieren - case-insensitiv, damit der Text nicht kopiert/großgeschrieben werden muss
+_FIN_LABELED_RE = regex_engine.compile(r'(?i)FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17})')
+# Wortgrenze explizit statt \b (unter RE2 nur ASCII) - nur mit search() genutzt, Umgebung darf verbraucht werden
+_FIN_NAKED_RE = regex_engine.compile(r'(?i)(?:^|[^A-Za-zÄÖÜäöüß0-9_])([A-HJ-NPR-Z0-9]{17})(?:[^A-Za-zÄÖÜäöüß0-9_]|$)')
+
+# Prozesstyp-Mapping - gemeinsame Tabelle aus src.core.mappings (Schlüssel kleingeschrieben)
+PROCESS_MAPPING = PROZESS_ALIASES
+
+# Die 6 Hauptprozesse selbst - bereits normalisierte Eingaben unverändert durchreichen
+_HAUPTPROZESSE = frozenset(PROCESS_MAPPING.values())
+
+# Liste erlaubter Prozess-Begriffe für Fehlermeldungen - Schlüssel ändern sich nicht
+_ERLAUBTE_PROZESSE = str(list(PROCESS_MAPPING))
+
+# E-Mail-Patterns für Flowers
+# Keine \w/\b/\s/\d: unter RE2 nur ASCII, unter re Unicode. Explizite Klassen (inkl. Umlaute und
+# geschütztem Leerzeichen \xa0 aus HTML-Mails) und ASCII-FINs liefern mit beiden Engines dieselben Treffer.
+EMAIL_PATTERNS = MappingProxyType({
+    # Alte Patterns (behalten für bestehende E-Mail-Formate)
+    'prozess_gestartet': r'Fahrzeug[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+gestartet[ \t\r\n\f\v\xa0]+von[ \t\r\n\f\v\xa0]+(.+?)(?:\n|$)',
+    'prozess_abgeschlossen': r'Fahrzeug[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+abgeschlossen[ \t\r\n\f\v\xa0]+von[ \t\r\n\f\v\xa0]+(.+?)(?:\n|$)',
+    'warteschlange': r'Fahrzeug[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+wartet[ \t\r\n\f\v\xa0]+auf[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+Priorität[ \t\r\n\f\v\xa0]+([0-9]+)',
+    'transport_info': r'Transport:[ \t\r\n\f\v\xa0]+FIN[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+von[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+nach[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+am[ \t\r\n\f\v\xa0]+([0-9]{2}\.[0-9]{2}\.[0-9]{4})',
+    'aufbereitung_info': r'Aufbereitung:[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+zugewiesen[ \t\r\n\f\v\xa0]+an[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+am[ \t\r\n\f\v\xa0]+([0-9]{2}\.[0-9]{2}\.[0-9]{4})',
+    'werkstatt_info': r'GWA:[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+zugewiesen[ \t\r\n\f\v\xa0]+an[ \t\r\n\f\v\xa0]+(.+?)[ \t\r\n\f\v\xa0]+am[ \t\r\n\f\v\xa0]+([0-9]{2}\.[0-9]{2}\.[0-9]{4})',
+    'foto_info': r'Foto:[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+-[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+Qualität[ \t\r\n\f\v\xa0]+durch[ \t\r\n\f\v\xa0]+(.+)',
+    'status_update': r'Status:[ \t\r\n\f\v\xa0]+([A-Z0-9]{17})[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+->[ \t\r\n\f\v\xa0]+([A-Za-zÄÖÜäöüß0-9_]+)[ \t\r\n\f\v\xa0]+durch[ \t\r\n\f\v\xa0]+(.+)',
+
+    # NEUE PATTERNS für einfache E-Mail-Formate (Ihre Test-E-Mails)
+    'simple_process_started': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(gestartet|started).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17})',
+    'simple_process_completed': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(abgeschlossen|completed|fertig).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17})',
+    'simple_process_paused': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(pausiert|paused|gestoppt).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17})',
+    'simple_process_queued': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(warteschlange|queued|eingeplant).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17})',
+
+    # Erweiterte Patterns mit Bearbeiter-Information (falls verfügbar)
+    'simple_process_started_with_worker': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(gestartet|started).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17}).*?Bearbeiter:[ \t\r\n\f\v\xa0]*([^\n\r]+)',
+    'simple_process_completed_with_worker': r'([A-Za-zÄÖÜäöüß0-9_\- \t\r\n\f\v\xa0]+)[ \t\r\n\f\v\xa0]+(abgeschlossen|completed|fertig).*?FIN:[ \t\r\n\f\v\xa0]*([A-Z0-9]{15,17}).*?Bearbeiter:[ \t\r\n\f\v\xa0]*([^\n\r]+)',
+})
+
+# Patterns einmal kompilieren - parse_flowers_email läuft dann ohne re-Cache-Lookups
+_COMPILED_PATTERNS = tuple(
+    (pattern_name, regex_engine.compile('(?im)' + pattern))
+    for pattern_name, pattern in EMAIL_PATTERNS.items()
+)
+
 
 class FlowersHandler:
     """Handler für alle Flowers-Datenquellen: E-Mail, Webhook, Zapier"""
@@ -16,55 +71,19 @@ class FlowersHandler:
     def __init__(self, bigquery_service=None):
         self.bigquery_service = bigquery_service
         
-        # Prozesstyp-Mapping - 6 Hauptprozesse mit festen Schlüsselbegriffen
-        self.process_mapping = {
-            # 6 Standard-Hauptprozesse (bestehend)
-            'einkauf': 'Einkauf',
-            'anlieferung': 'Anlieferung', 
-            'aufbereitung': 'Aufbereitung',
-            'foto': 'Foto',
-            'werkstatt': 'Werkstatt',
-            'verkauf': 'Verkauf',
-            
-            # Flowers-Legacy-Begriffe hinzufügen
-            'gwa': 'Aufbereitung',           
-            'garage': 'Werkstatt',          
-            'fotoshooting': 'Foto',         
-            'transport': 'Anlieferung',     
-            'ankauf': 'Einkauf',
-            '(0) Start Fahrzeugaufbereitung' : 'Aufbereitung',
-            '(4.0) Werkstattplanung' : 'Werkstatt',
-            '(1) DA Fahrzeuganlage' : 'Einkauf'       #  
-        }
-        
-        # E-Mail-Patterns für Flowers
-        self.email_patterns = {
-            # Alte Patterns (behalten für bestehende E-Mail-Formate)
-            'prozess_gestartet': r'Fahrzeug\s+(\w{17})\s+-\s+(\w+)\s+gestartet\s+von\s+(.+?)(?:\n|$)',
-            'prozess_abgeschlossen': r'Fahrzeug\s+(\w{17})\s+-\s+(\w+)\s+abgeschlossen\s+von\s+(.+?)(?:\n|$)',
-            'warteschlange': r'Fahrzeug\s+(\w{17})\s+wartet\s+auf\s+(\w+)\s+-\s+Priorität\s+(\d+)',
-            'transport_info': r'Transport:\s+FIN\s+(\w{17})\s+von\s+(.+?)\s+nach\s+(.+?)\s+am\s+(\d{2}\.\d{2}\.\d{4})',
-            'aufbereitung_info': r'Aufbereitung:\s+(\w{17})\s+-\s+(.+?)\s+zugewiesen\s+an\s+(.+?)\s+am\s+(\d{2}\.\d{2}\.\d{4})',
-            'werkstatt_info': r'GWA:\s+(\w{17})\s+-\s+(.+?)\s+zugewiesen\s+an\s+(.+?)\s+am\s+(\d{2}\.\d{2}\.\d{4})',
-            'foto_info': r'Foto:\s+(\w{17})\s+-\s+(\w+)\s+Qualität\s+durch\s+(.+)',
-            'status_update': r'Status:\s+(\w{17})\s+(\w+)\s+->\s+(\w+)\s+durch\s+(.+)',
-            
-            # NEUE PATTERNS für einfache E-Mail-Formate (Ihre Test-E-Mails)
-            'simple_process_started': r'([A-Za-z0-9_\-\s]+)\s+(gestartet|started).*?FIN:\s*([A-Z0-9]{15,17})',
-            'simple_process_completed': r'([A-Za-z0-9_\-\s]+)\s+(abgeschlossen|completed|fertig).*?FIN:\s*([A-Z0-9]{15,17})',
-            'simple_process_paused': r'([A-Za-z0-9_\-\s]+)\s+(pausiert|paused|gestoppt).*?FIN:\s*([A-Z0-9]{15,17})',
-            'simple_process_queued': r'([A-Za-z0-9_\-\s]+)\s+(warteschlange|queued|eingeplant).*?FIN:\s*([A-Z0-9]{15,17})',
-            
-            # Erweiterte Patterns mit Bearbeiter-Information (falls verfügbar)
-            'simple_process_started_with_worker': r'([A-Za-z0-9_\-\s]+)\s+(gestartet|started).*?FIN:\s*([A-Z0-9]{15,17}).*?Bearbeiter:\s*([^\n\r]+)',
-            'simple_process_completed_with_worker': r'([A-Za-z0-9_\-\s]+)\s+(abgeschlossen|completed|fertig).*?FIN:\s*([A-Z0-9]{15,17}).*?Bearbeiter:\s*([^\n\r]+)',
-        }
+        # Gemeinsame, schreibgeschützte Tabellen auf Modulebene
+        self.process_mapping = PROCESS_MAPPING
+        self._erlaubte_prozesse = _ERLAUBTE_PROZESSE
+        self.email_patterns = EMAIL_PATTERNS
+        self._compiled_patterns = _COMPILED_PATTERNS
 
 
     def normalize_prozess_typ(self, prozess_input: str) -> str:
         """Normalisiert Prozesstyp auf 6 Hauptprozesse (zentrale Methode)"""
+        if prozess_input in _HAUPTPROZESSE:
+            return prozess_input
         normalized = self.process_mapping.get(prozess_input.lower(), prozess_input)
-        logger.debug(f"Prozess-Mapping: '{prozess_input}' → '{normalized}'")
+        logger.debug("Prozess-Mapping: '%s' → '%s'", prozess_input, normalized)
         return normalized
     
     async def parse_flowers_email(self, email_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -74,20 +93,18 @@ class FlowersHandler:
             body = email_data.get('body', '')
             sender = email_data.get('sender', 'flowers@system')
             
-            logger.info(f"📧 Parsing Flowers email: {subject}")
+            logger.info("📧 Parsing Flowers email: %s", subject)
             
             actions = []
             email_content = f"{subject}\n{body}"
             
-            for pattern_name, pattern in self.email_patterns.items():
-                matches = re.finditer(pattern, email_content, re.IGNORECASE | re.MULTILINE)
-                
-                for match in matches:
+            for pattern_name, pattern in self._compiled_patterns:
+                for match in pattern.finditer(email_content):
                     action = self._create_action_from_match(pattern_name, match, sender)
                     if action:
                         actions.append(action)
             
-            logger.info(f"✅ Extracted {len(actions)} actions from email")
+            logger.info("✅ Extracted %d actions from email", len(actions))
             return actions
             
         except Exception as e:
@@ -271,7 +288,7 @@ class FlowersHandler:
     async def process_webhook_data(self, webhook_data: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Verarbeitet Webhook-Daten von Flowers"""
         try:
-            logger.info(f"🔗 Processing {source} webhook data")
+            logger.info("🔗 Processing %s webhook data", source)
             
             fin = webhook_data.get('fin')
             prozess_typ_raw = webhook_data.get('prozess_typ')
@@ -280,6 +297,10 @@ class FlowersHandler:
             if not fin:
                 return {"status": "error", "message": "FIN ist erforderlich", "source": source}
             
+            fin = self.normalize_fin(str(fin))
+            if not self.is_valid_fin(fin):
+                return {"status": "error", "message": f"Ungültige FIN: {fin} (17 alphanumerische Zeichen erwartet)", "source": source}
+            
             if not prozess_typ_raw:
                 return {"status": "error", "message": "prozess_typ ist erforderlich", "source": source}
             
@@ -288,7 +309,7 @@ class FlowersHandler:
             if not prozess_typ:
                 return {
                     "status": "error", 
-                    "message": f"Unbekannter prozess_typ: {prozess_typ_raw}. Erlaubt: {list(self.process_mapping.keys())}", 
+                    "message": f"Unbekannter prozess_typ: {prozess_typ_raw}. Erlaubt: {self._erlaubte_prozesse}", 
                     "source": source
                 }
             
@@ -296,7 +317,7 @@ class FlowersHandler:
             if action == 'start_process':
                 result = await self._start_process_from_webhook(fin, prozess_typ, webhook_data, source)
             elif action == 'update_status':
-                result = await self._update_status_from_webhook(fin, prozess_typ, webhook_data, source)
+                result = self._update_status_from_webhook(fin, prozess_typ, webhook_data, source)
             else:
                 result = {"status": "error", "message": f"Unbekannte Action: {action}", "source": source}
             
@@ -309,7 +330,7 @@ class FlowersHandler:
     async def _start_process_from_webhook(self, fin: str, prozess_typ: str, data: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Startet Prozess aus Webhook-Daten (korrigierte Typ-Annotations)"""
         try:
-            prozess_id = str(uuid.uuid4())
+            prozess_id = new_process_id()
             
             process_data = {
                 "prozess_id": prozess_id,
@@ -340,29 +361,35 @@ class FlowersHandler:
             logger.error(f"❌ Start process failed: {e}")
             return {"status": "error", "message": str(e), "source": source}
 
-    async def _update_status_from_webhook(self, fin: str, prozess_typ: str, data: Dict[str, Any], source: str) -> Dict[str, Any]:
-        """Status-Update aus Webhook (Placeholder)"""
+    def _update_status_from_webhook(self, fin: str, prozess_typ: str, data: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """Status-Update aus Webhook (Placeholder, synchron - kein I/O)"""
         return {
             "status": "success", 
             "message": f"Status-Update für {fin} ({prozess_typ}) verarbeitet",
             "source": source
         }
     
+    @staticmethod
+    def normalize_fin(fin: str) -> str:
+        """FIN vereinheitlichen: Großschreibung, ohne Leerzeichen/Bindestriche (ein str.translate-Durchlauf)"""
+        return normalize_fin(fin)
+    
+    @staticmethod
+    def is_valid_fin(fin: str) -> bool:
+        """FIN-Prüfung ohne Regex: genau 17 ASCII-Buchstaben/Ziffern"""
+        return len(fin) == 17 and fin.isascii() and fin.isalnum()
+    
     @staticmethod
     def extract_fin_from_text(text: str) -> Optional[str]:
         """Zentrale FIN-Extraktion für alle Handler"""
-        import re
-        
         # Erst versuchen mit "FIN:" Label (bevorzugt für neue E-Mail-Formate)
-        fin_pattern_labeled = re.compile(r'FIN:\s*([A-Z0-9]{15,17})', re.IGNORECASE)
-        match = fin_pattern_labeled.search(text)
+        match = _FIN_LABELED_RE.search(text)
         if match:
             return match.group(1)
         
-        # Fallback: Nackte 17-stellige FIN (für alte E-Mail-Formate)
-        fin_pattern_naked = re.compile(r'\b([A-HJ-NPR-Z0-9]{17})\b')
-        match = fin_pattern_naked.search(text.upper())
+        # Fallback: Nackte 17-stellige FIN (für alte E-Mail-Formate) - nur den Treffer großschreiben
+        match = _FIN_NAKED_RE.search(text)
         if match:
-            return match.group(1)
+            return match.group(1).upper()
         
         return None
\ No newline at end of file
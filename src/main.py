@@ -5,7 +5,6 @@ Modulare FastAPI Anwendung für Multi-Source Fahrzeugprozess-Tracking
 """
 
 import logging
-from datetime import datetime
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -14,6 +13,7 @@ from dotenv import load_dotenv
 
 # Core imports
 from src.core.dependencies import set_bigquery_service, get_services_health
+from src.core.utils import now_iso
 
 # Router imports  
 from src.api.routes.integration import router as integration_router
@@ -95,7 +95,7 @@ async def root():
             "fahrzeuge": "/fahrzeuge/* - Fahrzeug-Management", 
             "info": "/info/* - System-Informationen"
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/health")
@@ -116,7 +116,7 @@ async def health_check():
             "fahrzeuge": ["/fahrzeuge", "/fahrzeuge/{fin}"],
             "info": ["/info/prozesse", "/info/bearbeiter", "/info/system"]
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 if __name__ == "__main__":
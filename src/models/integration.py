@@ -1,11 +1,14 @@
 # src/models/integration.py
 from datetime import datetime, date
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UnifiedProcessData(BaseModel):
     """Einheitliches Datenformat für alle Integrationen (E-Mail, Zapier, Webhook)"""
+    # Unveränderlich nach der Validierung - Stammdaten- und Prozess-Aufbau lesen parallel daraus
+    model_config = ConfigDict(frozen=True)
+    
     fin: str = Field(..., min_length=17, max_length=17)
     prozess_typ: str  # Einer der 6 Hauptprozesse
     status: str
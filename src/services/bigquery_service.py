@@ -1,14 +1,498 @@
 # src/services/bigquery_service.py - Zentrale Data Layer für normalisierte Tabellen
 """BigQuery Service - Zentrale Datenschicht für alle Tabellen-Operationen"""
 
+import asyncio
 import logging
-import uuid
-from typing import Dict, List, Any, Optional
-from datetime import datetime, date
+from functools import lru_cache
+from operator import itemgetter
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
+import google.auth
 from google.cloud import bigquery
 
+from src.core.utils import new_process_id
+
+# Arrow + Storage Read API für Bulk-Konvertierung großer Ergebnismengen (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
 logger = logging.getLogger(__name__)
 
+# Unterhalb dieser Zeilenzahl ist die REST-Seite schneller als ein Storage-Read-Stream
+_ARROW_MIN_ROWS = 100
+
+# Obergrenze gleichzeitig laufender BigQuery-Jobs (z.B. Dashboard-Snapshot mit parallelen Teilabfragen)
+_MAX_PARALLEL_QUERIES = 8
+
+# Zeilen je insert_rows_json-Aufruf bei Bulk-Inserts (empfohlene Obergrenze für Streaming-Inserts)
+_INSERT_BATCH_SIZE = 500
+
+# Zeilen, die während eines laufenden Inserts eintreffen, höchstens so lange (Sekunden) für einen
+# gemeinsamen insertAll-Aufruf sammeln
+_INSERT_FLUSH_DELAY = 0.05
+
+def _abfrage_zeitpunkt(now: Optional[datetime] = None) -> datetime:
+    """UTC-Zeitpunkt auf die Minute gerundet für Query-Parameter.
+
+    Ersetzt CURRENT_TIMESTAMP()/CURRENT_DATE() im SQL: deterministische Abfragen mit
+    gleichen Parametern kann BigQuery aus dem Ergebnis-Cache beantworten.
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.astimezone(timezone.utc).replace(second=0, microsecond=0)
+
+
+# Query-Parameter-Konstruktoren nach exaktem Python-Typ (bool wird nicht als int behandelt)
+_PARAM_BUILDERS = {
+    str: lambda key, value: bigquery.ScalarQueryParameter(key, "STRING", value),
+    int: lambda key, value: bigquery.ScalarQueryParameter(key, "INTEGER", value),
+    float: lambda key, value: bigquery.ScalarQueryParameter(key, "NUMERIC", value),
+    bool: lambda key, value: bigquery.ScalarQueryParameter(key, "BOOLEAN", value),
+    datetime: lambda key, value: bigquery.ScalarQueryParameter(key, "DATETIME", value.isoformat()),
+    date: lambda key, value: bigquery.ScalarQueryParameter(key, "DATETIME", value.isoformat()),
+}
+
+# Stammdaten-Spalten mit BigQuery-Typen (für typisierte STRUCT-Parameter im Bulk-Update)
+_STAMM_FIELD_TYPES = {
+    "marke": "STRING",
+    "modell": "STRING",
+    "antriebsart": "STRING",
+    "farbe": "STRING",
+    "baujahr": "INT64",
+    "datum_erstzulassung": "DATE",
+    "kw_leistung": "INT64",
+    "km_stand": "INT64",
+    "anzahl_fahrzeugschluessel": "INT64",
+    "bereifungsart": "STRING",
+    "anzahl_vorhalter": "INT64",
+    "ek_netto": "NUMERIC",
+    "besteuerungsart": "STRING",
+}
+
+# Valide Felder für Updates (Mengen für O(1)-Prüfung)
+_STAMM_FIELDS = frozenset(_STAMM_FIELD_TYPES)
+_PROZESS_FIELDS = frozenset({
+    'status', 'bearbeiter', 'prioritaet', 'anlieferung_datum',
+    'start_timestamp', 'ende_timestamp', 'dauer_minuten',
+    'sla_tage', 'sla_deadline_datum', 'tage_bis_sla_deadline',
+    'standzeit_tage', 'notizen'
+})
+
+def _prepare_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """None-Werte entfernen und alle date/datetime-Werte als ISO-String schreiben.
+
+    Typprüfung statt fester Spaltenliste: insert_rows_json kann date/datetime nicht
+    serialisieren, auch nicht in neu hinzugekommenen Spalten.
+    """
+    return {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in data.items() if value is not None
+    }
+
+# Standard-Projektionen statt SELECT * (BigQuery rechnet nach gelesenen Spalten ab)
+_STAMM_COLUMNS = (
+    "fin", *_STAMM_FIELD_TYPES, "ersterfassung_datum", "datenquelle_fahrzeug", "updated_at"
+)
+# Erlaubte Spalten für die optionale Projektion in get_fahrzeug_stamm
+_STAMM_SELECTABLE = frozenset(_STAMM_COLUMNS) | {"aktiv", "created_at", "erstellt_aus_email"}
+_PROZESS_COLUMNS = (
+    "prozess_id", "fin", "prozess_typ", "status", "bearbeiter", "prioritaet",
+    "anlieferung_datum", "start_timestamp", "ende_timestamp", "dauer_minuten",
+    "sla_tage", "sla_deadline_datum", "tage_bis_sla_deadline", "standzeit_tage",
+    "datenquelle", "notizen", "zusatz_daten", "erstellt_am", "aktualisiert_am", "created_at", "updated_at"
+)
+
+# Prozesshistorie eines Fahrzeugs ab @cutoff (neueste zuerst)
+_FAHRZEUG_PROZESSE_SQL = f"""
+SELECT {', '.join(_PROZESS_COLUMNS)}
+FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+WHERE fin = @fin
+  AND created_at >= @cutoff
+ORDER BY updated_at DESC
+"""
+
+# Neuester Prozess eines Fahrzeugs (Status-Updates brauchen nur diese Zeile)
+_AKTUELLER_FAHRZEUG_PROZESS_SQL = _FAHRZEUG_PROZESSE_SQL + "LIMIT 1\n"
+
+# Einzelner Prozess per ID (Punktabfrage; cutoff begrenzt die gelesenen Partitionen)
+_FAHRZEUG_PROZESS_SQL = f"""
+SELECT {', '.join(_PROZESS_COLUMNS)}
+FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+WHERE prozess_id = @prozess_id
+  AND created_at >= @cutoff
+LIMIT 1
+"""
+
+# Dieselbe Punktabfrage über alle Partitionen (Prozesse älter als der cutoff)
+_FAHRZEUG_PROZESS_ALLE_SQL = f"""
+SELECT {', '.join(_PROZESS_COLUMNS)}
+FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+WHERE prozess_id = @prozess_id
+LIMIT 1
+"""
+
+# JOIN ist in der Materialized View vorberechnet (Clustering: prozess_typ, status);
+# NULL-Parameter deaktivieren den jeweiligen Filter
+_FAHRZEUGE_MIT_PROZESSEN_SQL = """
+SELECT 
+  fin,
+  marke,
+  modell,
+  antriebsart,
+  farbe,
+  baujahr,
+  prozess_id,
+  prozess_typ,
+  status,
+  bearbeiter,
+  prioritaet,
+  standzeit_tage,
+  tage_bis_sla_deadline,
+  created_at,
+  updated_at
+FROM `ra-autohaus-tracker.autohaus.mv_fahrzeuge_prozesse_current`
+WHERE (@status IS NULL OR status = @status)
+  AND (@prozess_typ IS NULL OR prozess_typ = @prozess_typ)
+ORDER BY updated_at DESC
+LIMIT @limit
+"""
+
+# SLA-Verteilung der offenen Prozesse: ein Aggregat über die vorberechnete sla_kategorie
+_SLA_STATISTIK_SQL = """
+SELECT
+  COUNTIF(sla_kategorie = 'critical') AS critical,
+  COUNTIF(sla_kategorie = 'warning') AS warning,
+  COUNTIF(sla_kategorie = 'ok') AS ok
+FROM `ra-autohaus-tracker.autohaus.v_prozesse_active`
+"""
+
+# Dringendste Prozesse je SLA-Kategorie (critical < 0 Tage, warning 0-1 Tage);
+# der Filter auf die Clustering-Spalte sla_kategorie überspringt alle 'ok'-Blöcke
+_SLA_DETAIL_SQL = """
+SELECT
+  sla_kategorie AS kategorie,
+  fin,
+  FORMAT('%s %s (%s)', IFNULL(marke, ''), IFNULL(modell, ''), IFNULL(CAST(baujahr AS STRING), '')) AS fahrzeug,
+  prozess_id,
+  prozess_typ,
+  status,
+  bearbeiter,
+  prioritaet,
+  standzeit_tage,
+  tage_bis_sla_deadline,
+  updated_at
+FROM `ra-autohaus-tracker.autohaus.v_prozesse_active`
+WHERE sla_kategorie IN ('critical', 'warning')
+QUALIFY ROW_NUMBER() OVER (
+  PARTITION BY sla_kategorie
+  ORDER BY tage_bis_sla_deadline, updated_at DESC
+) <= @top_n
+ORDER BY tage_bis_sla_deadline, updated_at DESC
+"""
+
+# Warteschlangen je Prozesstyp und Status (offene Prozesse ab @cutoff)
+_WARTESCHLANGEN_SQL = """
+SELECT
+  prozess_typ,
+  status,
+  COUNT(*) as anzahl,
+  IFNULL(ROUND(AVG(standzeit_tage), 1), 0) as avg_standzeit,
+  IFNULL(ROUND(AVG(tage_bis_sla_deadline), 1), 0) as avg_sla_verbleibend
+FROM `ra-autohaus-tracker.autohaus.v_prozesse_active`
+WHERE status IN ('warteschlange', 'geplant', 'in_bearbeitung')
+  AND created_at >= @cutoff
+GROUP BY prozess_typ, status
+ORDER BY prozess_typ, anzahl DESC
+"""
+
+
+def _kpi_sql(distinct_count: str) -> str:
+    """KPI-Abfrage mit gegebener Distinct-Zählung (Platzhalter {} = Spalte) erzeugen"""
+    # Ein Scan für alle KPIs: aktive Prozesse über bedingte Aggregation,
+    # abgeschlossene Prozesse liefern im selben Durchlauf die Durchlaufzeiten
+    return f"""
+WITH basis AS (
+  SELECT
+    p.fin,
+    p.prozess_typ,
+    p.bearbeiter,
+    p.created_at,
+    p.start_timestamp,
+    p.ende_timestamp,
+    p.standzeit_tage,
+    p.tage_bis_sla_deadline,
+    s.marke,
+    p.status NOT IN ('verkauft', 'storniert', 'abgeschlossen') AS aktiv
+  FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` p
+  LEFT JOIN `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` s
+    ON p.fin = s.fin
+  WHERE p.created_at >= @cutoff
+)
+SELECT
+  {distinct_count.format("fin")} as aktive_fahrzeuge,
+  COUNTIF(aktiv AND DATE(created_at) = @heute) as heute_gestartet,
+  COUNTIF(aktiv AND tage_bis_sla_deadline < 0) as sla_verletzungen,
+  IFNULL(ROUND(AVG(IF(aktiv, standzeit_tage, NULL)), 1), 0) as avg_standzeit,
+  {distinct_count.format("marke")} as anzahl_marken,
+  {distinct_count.format("bearbeiter")} as anzahl_bearbeiter,
+  ARRAY_AGG(
+    IF(ende_timestamp IS NOT NULL AND start_timestamp IS NOT NULL,
+       STRUCT(prozess_typ, DATETIME_DIFF(ende_timestamp, start_timestamp, MINUTE) / 60 AS dauer_stunden),
+       NULL)
+    IGNORE NULLS
+  ) as durchlauf
+FROM basis
+"""
+
+
+# Schlüssel use_approx: HyperLogLog-Zählung (True) oder exakt (False)
+_KPI_SQL = {
+    True: _kpi_sql("APPROX_COUNT_DISTINCT(IF(aktiv, {}, NULL))"),
+    False: _kpi_sql("COUNT(DISTINCT IF(aktiv, {}, NULL))"),
+}
+
+# Felder der Durchlauf-STRUCTs aus der KPI-Abfrage (ein C-Aufruf pro Eintrag)
+_DURCHLAUF_FELDER = itemgetter("prozess_typ", "dauer_stunden")
+
+# Arbeitsbelastung je Bearbeiter über alle offenen Prozesse
+_BEARBEITER_WORKLOAD_SQL = """
+SELECT
+  bearbeiter,
+  COUNTIF(status = 'in_bearbeitung') AS aktive_prozesse,
+  COUNTIF(status = 'warteschlange') AS warteschlange,
+  COUNTIF(tage_bis_sla_deadline < 0) AS sla_critical,
+  IFNULL(ROUND(AVG(NULLIF(standzeit_tage, 0)), 1), 0) AS avg_standzeit,
+  ARRAY_AGG(DISTINCT prozess_typ IGNORE NULLS) AS prozess_typen
+FROM `ra-autohaus-tracker.autohaus.v_prozesse_active`
+WHERE bearbeiter IS NOT NULL
+GROUP BY bearbeiter
+ORDER BY aktive_prozesse DESC
+"""
+
+# Ein MERGE-Job für beliebig viele Fahrzeuge; NULL-Felder behalten den bisherigen Wert
+_STAMM_BULK_UPDATE_SQL = f"""
+MERGE `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` t
+USING (SELECT * FROM UNNEST(@updates)) u
+ON t.fin = u.fin AND t.aktiv = TRUE
+WHEN MATCHED THEN UPDATE SET
+  {', '.join(f'{field} = COALESCE(u.{field}, t.{field})' for field in _STAMM_FIELD_TYPES)},
+  updated_at = CURRENT_TIMESTAMP()
+"""
+
+# Fahrzeuge nur anlegen, wenn die FIN noch nicht aktiv existiert - ein Job statt SELECT + Insert,
+# gleichzeitige Webhooks/Batches für dieselbe FIN erzeugen keine doppelten Stammdaten
+_STAMM_INSERT_IF_MISSING_SQL = f"""
+MERGE `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` t
+USING (SELECT * FROM UNNEST(@vehicles)) s
+ON t.fin = s.fin AND t.aktiv = TRUE
+WHEN NOT MATCHED THEN INSERT (
+  fin, {', '.join(_STAMM_FIELD_TYPES)},
+  ersterfassung_datum, aktiv, erstellt_aus_email, datenquelle_fahrzeug
+) VALUES (
+  s.fin, {', '.join(f's.{field}' for field in _STAMM_FIELD_TYPES)},
+  @ersterfassung_datum, TRUE, s.erstellt_aus_email, s.datenquelle_fahrzeug
+)
+"""
+
+# Fallback für create_fahrzeuge_stamm_if_missing, wenn BigQuery den MERGE ablehnt
+_STAMM_EXISTS_SQL = """
+SELECT fin
+FROM `ra-autohaus-tracker.autohaus.fahrzeuge_stamm`
+WHERE fin IN UNNEST(@fins) AND aktiv = TRUE
+"""
+
+@lru_cache(maxsize=128)
+def _build_stamm_update_sql(fields: frozenset) -> str:
+    """UPDATE-Statement für fahrzeuge_stamm je Feldkombination (sortiert = stabiler SQL-Text)"""
+    set_clauses = ", ".join(f"{field} = @{field}" for field in sorted(fields))
+    return f"""
+            UPDATE `ra-autohaus-tracker.autohaus.fahrzeuge_stamm`
+            SET {set_clauses}, updated_at = CURRENT_TIMESTAMP()
+            WHERE fin = @fin AND aktiv = TRUE
+            """
+
+@lru_cache(maxsize=128)
+def _build_prozess_update_sql(fields: frozenset) -> str:
+    """UPDATE-Statement für fahrzeug_prozesse je Feldkombination (sortiert = stabiler SQL-Text)"""
+    set_clauses = ", ".join(f"{field} = @{field}" for field in sorted(fields))
+    return f"""
+            UPDATE `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
+            SET {set_clauses}, updated_at = CURRENT_TIMESTAMP()
+            WHERE prozess_id = @prozess_id
+            """
+
+# ========================================
+# Mock-Daten (ohne BigQuery-Verbindung) - einmal beim Import angelegt
+# ========================================
+
+_MOCK_FAHRZEUG_STAMM = {
+    "marke": "Audi",
+    "modell": "A4",
+    "antriebsart": "Benzin",
+    "farbe": "Schwarz",
+    "baujahr": 2020,
+    "kw_leistung": 140,
+    "km_stand": 25000,
+    "ek_netto": 18500.00,
+    "status": "mock_data"
+}
+
+_MOCK_FAHRZEUGE_MIT_PROZESSEN = (
+    {
+        "fin": "WAUZZZGE1NB038655",
+        "marke": "Audi",
+        "modell": "A4",
+        "prozess_typ": "Aufbereitung",
+        "status": "in_bearbeitung",
+        "bearbeiter": "Hans Müller",
+        "prioritaet": 3,
+        "standzeit_tage": 2,
+        "tage_bis_sla_deadline": 1
+    },
+)
+
+_MOCK_SLA_STATISTIK = {"critical": 0, "warning": 1, "ok": 0, "status": "mock_data"}
+
+_MOCK_BEARBEITER_WORKLOAD = {
+    "Hans Müller": {
+        "aktive_prozesse": 1,
+        "warteschlange": 0,
+        "sla_critical": 0,
+        "avg_standzeit": 2.0,
+        "prozess_typen": ["Aufbereitung"]
+    }
+}
+
+_MOCK_FAHRZEUG_PROZESS = {
+    "prozess_typ": "Aufbereitung",
+    "status": "in_bearbeitung",
+    "bearbeiter": "Hans Müller",
+    "prioritaet": 5,
+    "standzeit_tage": 2
+}
+
+_MOCK_DASHBOARD_KPIS = {
+    "aktive_fahrzeuge": 42,
+    "heute_gestartet": 3,
+    "sla_verletzungen": 2,
+    "avg_standzeit": 15.5,
+    "anzahl_marken": 8,
+    "anzahl_bearbeiter": 6,
+    "durchlaufzeiten": {
+        "Aufbereitung": {"anzahl": 12, "avg_stunden": 30.5, "min_stunden": 6.0, "max_stunden": 72.0}
+    },
+    "status": "mock_data"
+}
+
+_MOCK_WARTESCHLANGEN = {
+    "warteschlangen": {
+        "Aufbereitung": {
+            "warteschlange": {"anzahl": 5, "avg_standzeit": 2.3},
+            "in_bearbeitung": {"anzahl": 2, "avg_standzeit": 1.1}
+        },
+        "Foto": {
+            "warteschlange": {"anzahl": 3, "avg_standzeit": 0.8},
+            "in_bearbeitung": {"anzahl": 1, "avg_standzeit": 0.5}
+        }
+    },
+    "status": "mock_data"
+}
+
+
+class _InsertBuffer:
+    """Micro-Batching für Streaming-Inserts einer Tabelle.
+    
+    Ist kein Insert unterwegs, wird eine Zeile sofort geschrieben (keine Zusatzlatenz).
+    Zeilen, die eintreffen während ein Insert läuft (z.B. Zapier-Bursts), werden gesammelt
+    und nach _INSERT_FLUSH_DELAY Sekunden bzw. bei _INSERT_BATCH_SIZE Zeilen gemeinsam
+    geschrieben. Jeder Aufrufer wartet auf das Ergebnis seiner eigenen Zeile - ein erfolgreicher
+    Rückgabewert bedeutet weiterhin, dass die Zeile geschrieben ist; eine ungültige Zeile
+    eines anderen Aufrufers ändert daran nichts.
+    
+    Futures, Timer und Flush-Tasks gehören zur Event-Loop, in der sie angelegt wurden;
+    der Puffer bindet sich deshalb an die laufende Loop und setzt sich bei einem
+    Loop-Wechsel (z.B. gemeinsame Service-Instanz in mehreren asyncio.run) zurück.
+    """
+    
+    def __init__(self, service: "BigQueryService", table_name: str):
+        self._service = service
+        self._table_name = table_name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rows: List[Dict[str, Any]] = []
+        self._waiters: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Starke Referenzen auf laufende Flushes - die Loop hält Tasks nur schwach
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def add(self, row: Dict[str, Any]) -> bool:
+        """Zeile einreihen und auf das Ergebnis des gemeinsamen Inserts warten"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+        
+        waiter = loop.create_future()
+        self._rows.append(row)
+        self._waiters.append(waiter)
+        
+        if not self._tasks or len(self._rows) >= _INSERT_BATCH_SIZE:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(_INSERT_FLUSH_DELAY, self._start_flush)
+        
+        return await waiter
+    
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Zustand einer früheren Event-Loop verwerfen und an die laufende Loop binden"""
+        if self._rows:
+            logger.warning(
+                "BigQuery Insert-Puffer %s: %s Zeilen einer beendeten Event-Loop verworfen",
+                self._table_name, len(self._rows)
+            )
+        if self._timer is not None:
+            self._timer.cancel()
+        self._loop = loop
+        self._rows, self._waiters = [], []
+        self._timer = None
+        self._tasks = set()
+    
+    def _start_flush(self) -> None:
+        """Gesammelte Zeilen als eigenen Task schreiben"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        rows, waiters = self._rows, self._waiters
+        if not rows:
+            return
+        self._rows, self._waiters = [], []
+        
+        task = self._loop.create_task(self._flush(rows, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, rows: List[Dict[str, Any]], waiters: List[asyncio.Future]) -> None:
+        results = [False] * len(waiters)
+        try:
+            results = await self._service._insert_rows_results(self._table_name, rows)
+        except Exception as e:
+            logger.error(f"BigQuery Batch-Insert {self._table_name} Fehler: {e}")
+        finally:
+            # Jeder Wartende erhält das Ergebnis seiner eigenen Zeile - auch bei Abbruch (dann False)
+            for waiter, ok in zip(waiters, results):
+                if not waiter.done():
+                    waiter.set_result(ok)
+
+
 class BigQueryService:
     """Zentrale BigQuery-Datenschicht für alle Services"""
     
@@ -16,13 +500,33 @@ class BigQueryService:
         self.project_id = "ra-autohaus-tracker"
         self.dataset_id = "autohaus"
         self.client: Optional[bigquery.Client] = None
+        # Tabellen-Metadaten ändern sich zur Laufzeit nicht - einmal laden, dann wiederverwenden
+        self._table_cache: Dict[str, bigquery.Table] = {}
+        self._storage_client = None
+        # Semaphore gehört zur Event-Loop, in der sie genutzt wird - siehe _query_semaphore
+        self._query_slots: Optional[asyncio.Semaphore] = None
+        self._query_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Einzel-Inserts gleichzeitiger Requests gebündelt schreiben
+        self._stamm_buffer = _InsertBuffer(self, "fahrzeuge_stamm")
+        self._prozess_buffer = _InsertBuffer(self, "fahrzeug_prozesse")
         
+        credentials = None
         try:
-            self.client = bigquery.Client(project=self.project_id)
+            # Credentials einmal ermitteln und beiden Clients übergeben
+            credentials, _ = google.auth.default()
+            self.client = bigquery.Client(project=self.project_id, credentials=credentials)
             logger.info("✅ BigQuery Client erfolgreich initialisiert")
         except Exception as e:
             logger.error(f"❌ BigQuery Client-Initialisierung fehlgeschlagen: {e}")
             self.client = None
+        
+        # Storage Read Client einmalig anlegen (gRPC-Kanal wird für alle Abfragen geteilt)
+        if self.client and bigquery_storage is not None and pa is not None:
+            try:
+                self._storage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+            except Exception as e:
+                logger.warning(f"BigQuery Storage Client nicht verfügbar - nutze REST: {e}")
+                self._storage_client = None
     
     async def health_check(self) -> bool:
         """Health Check für BigQuery-Verbindung"""
@@ -30,9 +534,8 @@ class BigQueryService:
             return False
             
         try:
-            query = "SELECT 1 as test_connection"
-            job = self.client.query(query)
-            list(job.result())
+            # Einzelner Metadaten-Aufruf statt Query-Job (prüft Auth + Netzwerk)
+            await asyncio.to_thread(self.client.get_service_account_email)
             return True
         except Exception as e:
             logger.error(f"BigQuery Health Check fehlgeschlagen: {e}")
@@ -42,7 +545,7 @@ class BigQueryService:
     # FAHRZEUGE_STAMM Operationen (Stammdaten)
     # ========================================
     
-    async def create_fahrzeug_stamm(self, vehicle_data: Dict[str, Any]) -> bool:
+    async def create_fahrzeug_stamm(self, vehicle_data: Dict[str, Any], now_iso: Optional[str] = None) -> bool:
         """Fahrzeug-Stammdaten in fahrzeuge_stamm erstellen"""
         if not self.client:
             logger.warning("BigQuery nicht verfügbar - Mock-Modus")
@@ -52,41 +555,176 @@ class BigQueryService:
             if 'fin' not in vehicle_data:
                 raise ValueError("FIN ist erforderlich für Fahrzeug-Erstellung")
             
-            table_ref = self.client.dataset(self.dataset_id).table("fahrzeuge_stamm")
-            table = self.client.get_table(table_ref)
-            
             # Daten für BigQuery vorbereiten
-            prepared_data = self._prepare_stamm_data(vehicle_data)
+            prepared_data = self._prepare_stamm_data(vehicle_data, now_iso)
             
-            errors = self.client.insert_rows_json(table, [prepared_data])
-            if errors:
-                logger.error(f"BigQuery Einfüge-Fehler fahrzeuge_stamm: {errors}")
+            if not await self._stamm_buffer.add(prepared_data):
                 return False
             
-            logger.info(f"✅ Fahrzeug-Stammdaten erstellt: {vehicle_data['fin']}")
+            logger.info("✅ Fahrzeug-Stammdaten erstellt: %s", vehicle_data['fin'])
             return True
             
         except Exception as e:
             logger.error(f"Fahrzeug-Stammdaten erstellen Fehler: {e}")
             return False
     
-    async def get_fahrzeug_stamm(self, fin: str) -> Optional[Dict[str, Any]]:
-        """Fahrzeug-Stammdaten nach FIN abrufen"""
+    async def create_fahrzeuge_stamm_bulk(self, vehicles: List[Dict[str, Any]], now_iso: Optional[str] = None) -> bool:
+        """Stammdaten mehrerer Fahrzeuge mit gebündelten Streaming-Inserts erstellen"""
+        if not self.client:
+            logger.warning("BigQuery nicht verfügbar - Mock-Modus")
+            return True
+        if not vehicles:
+            return True
+            
+        try:
+            if any('fin' not in vehicle_data for vehicle_data in vehicles):
+                raise ValueError("FIN ist erforderlich für Fahrzeug-Erstellung")
+            
+            now_iso = now_iso or datetime.now().isoformat()
+            rows = [self._prepare_stamm_data(vehicle_data, now_iso) for vehicle_data in vehicles]
+            if not await self._insert_rows("fahrzeuge_stamm", rows):
+                return False
+            
+            logger.info("✅ Fahrzeug-Stammdaten Bulk-Insert: %s Fahrzeuge", len(rows))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Stammdaten Bulk-Insert Fehler: {e}")
+            return False
+    
+    async def create_fahrzeug_stamm_if_missing(
+        self,
+        vehicle_data: Dict[str, Any],
+        now_iso: Optional[str] = None
+    ) -> Optional[bool]:
+        """Fahrzeug-Stammdaten per MERGE anlegen, falls die FIN noch nicht existiert.
+        
+        True = neu angelegt, False = bereits vorhanden, None = Fehler
+        """
+        inserted = await self.create_fahrzeuge_stamm_if_missing([vehicle_data], now_iso=now_iso)
+        return None if inserted is None else inserted > 0
+    
+    async def create_fahrzeuge_stamm_if_missing(
+        self,
+        vehicles: List[Dict[str, Any]],
+        now_iso: Optional[str] = None
+    ) -> Optional[int]:
+        """Fehlende Fahrzeuge in einem MERGE-Job anlegen (vorhandene FINs bleiben unverändert).
+        
+        Jeder Aufruf ist ein DML-Job - BigQuery begrenzt gleichzeitige und wartende
+        DML-Statements je Tabelle und lehnt darüber hinaus ab. Bei abgelehntem MERGE
+        greift Existenz-Check + Streaming-Insert (ohne Schutz vor gleichzeitigen Inserts).
+        
+        Rückgabe: Anzahl neu angelegter Fahrzeuge, None = Fehler
+        """
+        if not self.client:
+            logger.warning("BigQuery nicht verfügbar - Mock-Modus")
+            return len({vehicle_data.get('fin') for vehicle_data in vehicles})
+        if not vehicles:
+            return 0
+            
+        if any('fin' not in vehicle_data for vehicle_data in vehicles):
+            logger.error("Fahrzeug-Stammdaten MERGE Fehler: FIN ist erforderlich für Fahrzeug-Erstellung")
+            return None
+        
+        # Eine Quellzeile je FIN (erste gewinnt) - sonst legt der MERGE Duplikate an
+        unique: Dict[str, Dict[str, Any]] = {}
+        for vehicle_data in vehicles:
+            unique.setdefault(vehicle_data['fin'], vehicle_data)
+        now_iso = now_iso or datetime.now().isoformat()
+        
+        structs = [
+            bigquery.StructQueryParameter(
+                None,
+                bigquery.ScalarQueryParameter("fin", "STRING", fin),
+                *[
+                    bigquery.ScalarQueryParameter(field, field_type, vehicle_data.get(field))
+                    for field, field_type in _STAMM_FIELD_TYPES.items()
+                ],
+                bigquery.ScalarQueryParameter(
+                    "erstellt_aus_email", "BOOL", bool(vehicle_data.get("erstellt_aus_email"))
+                ),
+                bigquery.ScalarQueryParameter(
+                    "datenquelle_fahrzeug", "STRING", vehicle_data.get("datenquelle_fahrzeug", "api")
+                ),
+            )
+            for fin, vehicle_data in unique.items()
+        ]
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ArrayQueryParameter("vehicles", "STRUCT", structs),
+            bigquery.ScalarQueryParameter("ersterfassung_datum", "DATETIME", now_iso),
+        ])
+        
+        try:
+            inserted = await self._in_thread(self._run_dml, _STAMM_INSERT_IF_MISSING_SQL, job_config)
+        except Exception as e:
+            logger.warning(f"⚠️ Fahrzeug-Stammdaten MERGE fehlgeschlagen ({e}) - Fallback auf Streaming-Insert")
+            return await self._create_fahrzeuge_stamm_fallback(list(unique.values()), now_iso)
+        
+        if inserted:
+            logger.info("✅ Fahrzeug-Stammdaten erstellt: %s von %s Fahrzeugen", inserted, len(unique))
+        return inserted
+    
+    async def _create_fahrzeuge_stamm_fallback(
+        self,
+        vehicles: List[Dict[str, Any]],
+        now_iso: str
+    ) -> Optional[int]:
+        """Existenz-Check auf der Basistabelle, dann Streaming-Insert der fehlenden Fahrzeuge"""
+        try:
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ArrayQueryParameter("fins", "STRING", [vehicle_data["fin"] for vehicle_data in vehicles])
+            ])
+            vorhanden = {row["fin"] for row in await self._in_thread(self._run_query, _STAMM_EXISTS_SQL, job_config)}
+            
+            rows = []
+            for vehicle_data in vehicles:
+                if vehicle_data["fin"] in vorhanden:
+                    continue
+                row = self._prepare_stamm_data(vehicle_data, now_iso)
+                row.setdefault("erstellt_aus_email", False)
+                row.setdefault("datenquelle_fahrzeug", "api")
+                rows.append(row)
+            
+            if rows and not await self._insert_rows("fahrzeuge_stamm", rows):
+                return None
+            
+            logger.info("✅ Fahrzeug-Stammdaten erstellt (Streaming-Insert): %s Fahrzeuge", len(rows))
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Stammdaten Fallback Fehler: {e}")
+            return None
+    
+    async def get_fahrzeug_stamm(
+        self, 
+        fin: str,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fahrzeug-Stammdaten nach FIN abrufen (optional nur ausgewählte Spalten)"""
         if not self.client:
             return self._get_mock_fahrzeug_stamm(fin)
             
         try:
-            query = """
-            SELECT *
-            FROM `ra-autohaus-tracker.autohaus.fahrzeuge_stamm`
-            WHERE fin = @fin AND aktiv = TRUE
+            if fields:
+                invalid = set(fields) - _STAMM_SELECTABLE
+                if invalid:
+                    raise ValueError(f"Ungültige Stammdaten-Felder: {sorted(invalid)}")
+                columns = fields
+            else:
+                columns = _STAMM_COLUMNS
+            
+            query = f"""
+            SELECT {', '.join(columns)}
+            FROM `ra-autohaus-tracker.autohaus.mv_fahrzeuge_stamm_aktiv`
+            WHERE fin = @fin
             """
             
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[bigquery.ScalarQueryParameter("fin", "STRING", fin)]
             )
             
-            results = self.client.query(query, job_config=job_config).result()
+            results = await self._in_thread(self._run_query, query, job_config)
             
             for row in results:
                 return self._convert_row_to_dict(row)
@@ -104,50 +742,95 @@ class BigQueryService:
             return True
             
         try:
-            # Valide Stammdaten-Felder
-            stamm_fields = [
-                'marke', 'modell', 'antriebsart', 'farbe', 'baujahr',
-                'datum_erstzulassung', 'kw_leistung', 'km_stand',
-                'anzahl_fahrzeugschluessel', 'bereifungsart',
-                'anzahl_vorhalter', 'ek_netto', 'besteuerungsart'
-            ]
-            
-            set_clauses = []
-            parameters = []
-            
-            for key, value in update_data.items():
-                if key in stamm_fields and value is not None:
-                    set_clauses.append(f"{key} = @{key}")
-                    parameters.append(self._create_query_parameter(key, value))
+            updates = {
+                key: value for key, value in update_data.items()
+                if key in _STAMM_FIELDS and value is not None
+            }
             
-            if not set_clauses:
+            if not updates:
                 logger.warning("Keine gültigen Stammdaten-Felder zu aktualisieren")
                 return False
             
-            parameters.append(bigquery.ScalarQueryParameter("fin", "STRING", fin))
+            # Aktuelle Werte der betroffenen Spalten laden - unveränderte Felder überspringen
+            current = await self.get_fahrzeug_stamm(fin, fields=sorted(updates))
+            if current is not None:
+                updates = {
+                    key: value for key, value in updates.items()
+                    if current.get(key) != (value.isoformat() if hasattr(value, 'isoformat') else value)
+                }
+                if not updates:
+                    logger.info("Fahrzeug-Stammdaten unverändert, kein Update nötig: %s", fin)
+                    return True
             
-            query = f"""
-            UPDATE `ra-autohaus-tracker.autohaus.fahrzeuge_stamm`
-            SET {', '.join(set_clauses)}, updated_at = CURRENT_TIMESTAMP()
-            WHERE fin = @fin AND aktiv = TRUE
-            """
+            # SQL-Text nur einmal pro Feldkombination erzeugen
+            query = _build_stamm_update_sql(frozenset(updates))
+            
+            parameters = [self._create_query_parameter(key, value) for key, value in updates.items()]
+            parameters.append(bigquery.ScalarQueryParameter("fin", "STRING", fin))
             
             job_config = bigquery.QueryJobConfig(query_parameters=parameters)
-            query_job = self.client.query(query, job_config=job_config)
-            query_job.result()
+            await self._in_thread(self._run_query, query, job_config)
             
-            logger.info(f"✅ Fahrzeug-Stammdaten aktualisiert: {fin}")
+            logger.info("✅ Fahrzeug-Stammdaten aktualisiert: %s", fin)
             return True
             
         except Exception as e:
             logger.error(f"Fahrzeug-Stammdaten Update Fehler: {e}")
             return False
     
+    async def update_fahrzeuge_stamm_bulk(self, updates: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """Stammdaten mehrerer Fahrzeuge in einem MERGE-Job aktualisieren.
+        
+        Mehrere Updates derselben FIN werden zusammengeführt (spätere Werte gewinnen).
+        None bzw. NULL bedeutet "unverändert" (COALESCE) - Felder lassen sich über diesen
+        Weg nicht auf NULL setzen.
+        """
+        if not self.client:
+            logger.warning("BigQuery nicht verfügbar - Mock-Modus")
+            return True
+            
+        try:
+            # Pro FIN zusammenführen - MERGE erlaubt nur eine Quellzeile je Zielzeile
+            merged: Dict[str, Dict[str, Any]] = {}
+            for fin, update_data in updates:
+                fields = merged.setdefault(fin, {})
+                for key, value in update_data.items():
+                    if key in _STAMM_FIELDS and value is not None:
+                        fields[key] = value
+            
+            structs = [
+                bigquery.StructQueryParameter(
+                    None,
+                    bigquery.ScalarQueryParameter("fin", "STRING", fin),
+                    *[
+                        bigquery.ScalarQueryParameter(field, field_type, fields.get(field))
+                        for field, field_type in _STAMM_FIELD_TYPES.items()
+                    ]
+                )
+                for fin, fields in merged.items() if fields
+            ]
+            
+            if not structs:
+                logger.warning("Keine gültigen Stammdaten-Felder zu aktualisieren")
+                return False
+            
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("updates", "STRUCT", structs)]
+            )
+            await self._in_thread(self._run_query, _STAMM_BULK_UPDATE_SQL, job_config)
+            
+            logger.info("✅ Fahrzeug-Stammdaten Bulk-Update: %s Fahrzeuge", len(structs))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Stammdaten Bulk-Update Fehler: {e}")
+            return False
+    
     # ==========================================
     # FAHRZEUG_PROZESSE Operationen (Prozesse)
     # ==========================================
     
-    async def create_fahrzeug_prozess(self, process_data: Dict[str, Any]) -> bool:
+    async def create_fahrzeug_prozess(self, process_data: Dict[str, Any], now_iso: Optional[str] = None) -> bool:
         """Fahrzeug-Prozess in fahrzeug_prozesse erstellen"""
         if not self.client:
             logger.warning("BigQuery nicht verfügbar - Mock-Modus")
@@ -159,52 +842,132 @@ class BigQueryService:
                 if field not in process_data:
                     raise ValueError(f"{field} ist erforderlich für Prozess-Erstellung")
             
-            table_ref = self.client.dataset(self.dataset_id).table("fahrzeug_prozesse")
-            table = self.client.get_table(table_ref)
-            
             # Daten für BigQuery vorbereiten
-            prepared_data = self._prepare_prozess_data(process_data)
+            prepared_data = self._prepare_prozess_data(process_data, now_iso)
             
-            errors = self.client.insert_rows_json(table, [prepared_data])
-            if errors:
-                logger.error(f"BigQuery Einfüge-Fehler fahrzeug_prozesse: {errors}")
+            if not await self._prozess_buffer.add(prepared_data):
                 return False
             
-            logger.info(f"✅ Fahrzeug-Prozess erstellt: {process_data['prozess_id']}")
+            logger.info("✅ Fahrzeug-Prozess erstellt: %s", process_data['prozess_id'])
             return True
             
         except Exception as e:
             logger.error(f"Fahrzeug-Prozess erstellen Fehler: {e}")
             return False
     
-    async def get_fahrzeug_prozesse(self, fin: str) -> List[Dict[str, Any]]:
-        """Alle Prozesse für ein Fahrzeug abrufen"""
+    async def create_fahrzeug_prozesse_bulk(self, processes: List[Dict[str, Any]], now_iso: Optional[str] = None) -> bool:
+        """Mehrere Fahrzeug-Prozesse mit gebündelten Streaming-Inserts erstellen"""
         if not self.client:
-            return self._get_mock_fahrzeug_prozesse(fin)
+            logger.warning("BigQuery nicht verfügbar - Mock-Modus")
+            return True
+        if not processes:
+            return True
             
         try:
-            query = """
-            SELECT *
-            FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
-            WHERE fin = @fin
-            ORDER BY updated_at DESC
-            """
+            required_fields = ['prozess_id', 'fin', 'prozess_typ', 'status']
+            for process_data in processes:
+                for field in required_fields:
+                    if field not in process_data:
+                        raise ValueError(f"{field} ist erforderlich für Prozess-Erstellung")
+            
+            now_iso = now_iso or datetime.now().isoformat()
+            rows = [self._prepare_prozess_data(process_data, now_iso) for process_data in processes]
+            if not await self._insert_rows("fahrzeug_prozesse", rows):
+                return False
             
+            logger.info("✅ Fahrzeug-Prozesse Bulk-Insert: %s Prozesse", len(rows))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Prozesse Bulk-Insert Fehler: {e}")
+            return False
+    
+    async def get_fahrzeug_prozesse(self, fin: str, since_days: int = 365) -> List[Dict[str, Any]]:
+        """Prozesse für ein Fahrzeug abrufen (nur Partitionen der letzten since_days Tage)"""
+        try:
+            return [prozess async for prozess in self.iter_fahrzeug_prozesse(fin, since_days)]
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Prozesse abrufen Fehler: {e}")
+            return []
+    
+    async def iter_fahrzeug_prozesse(self, fin: str, since_days: int = 365) -> AsyncIterator[Dict[str, Any]]:
+        """Prozesse für ein Fahrzeug seitenweise streamen, ohne die Gesamtliste aufzubauen"""
+        if not self.client:
+            for prozess in self._get_mock_fahrzeug_prozesse(fin):
+                yield prozess
+            return
+        
+        cutoff = _abfrage_zeitpunkt() - timedelta(days=since_days)
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("fin", "STRING", fin),
+                bigquery.ScalarQueryParameter("cutoff", "TIMESTAMP", cutoff)
+            ]
+        )
+        
+        async for prozess in self.stream_query(_FAHRZEUG_PROZESSE_SQL, job_config):
+            yield prozess
+    
+    async def get_aktueller_fahrzeug_prozess(self, fin: str, since_days: int = 365) -> Optional[Dict[str, Any]]:
+        """Neuesten Prozess eines Fahrzeugs abrufen (ORDER BY updated_at DESC LIMIT 1)"""
+        if not self.client:
+            return self._get_mock_fahrzeug_prozesse(fin)[0]
+            
+        try:
+            cutoff = _abfrage_zeitpunkt() - timedelta(days=since_days)
             job_config = bigquery.QueryJobConfig(
-                query_parameters=[bigquery.ScalarQueryParameter("fin", "STRING", fin)]
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("fin", "STRING", fin),
+                    bigquery.ScalarQueryParameter("cutoff", "TIMESTAMP", cutoff)
+                ]
             )
             
-            results = self.client.query(query, job_config=job_config).result()
+            results = await self._in_thread(self._run_query, _AKTUELLER_FAHRZEUG_PROZESS_SQL, job_config)
             
-            prozesse = []
             for row in results:
-                prozesse.append(self._convert_row_to_dict(row))
+                return self._convert_row_to_dict(row)
                 
-            return prozesse
+            return None
             
         except Exception as e:
-            logger.error(f"Fahrzeug-Prozesse abrufen Fehler: {e}")
-            return []
+            logger.error(f"Aktueller Fahrzeug-Prozess abrufen Fehler: {e}")
+            return None
+    
+    async def get_fahrzeug_prozess(
+        self,
+        prozess_id: str,
+        since_days: Optional[int] = 365
+    ) -> Optional[Dict[str, Any]]:
+        """Einzelnen Prozess nach prozess_id abrufen.
+        
+        Zuerst nur Partitionen der letzten since_days Tage; ohne Treffer einmal über alle
+        Partitionen, damit ältere offene Prozesse weiter abgeschlossen werden können.
+        since_days=None sucht direkt ohne Grenze.
+        """
+        if not self.client:
+            return self._get_mock_fahrzeug_prozess(prozess_id)
+            
+        try:
+            id_param = bigquery.ScalarQueryParameter("prozess_id", "STRING", prozess_id)
+            if since_days is not None:
+                cutoff = _abfrage_zeitpunkt() - timedelta(days=since_days)
+                job_config = bigquery.QueryJobConfig(query_parameters=[
+                    id_param, bigquery.ScalarQueryParameter("cutoff", "TIMESTAMP", cutoff)
+                ])
+                for row in await self._in_thread(self._run_query, _FAHRZEUG_PROZESS_SQL, job_config):
+                    return self._convert_row_to_dict(row)
+                logger.info("Prozess %s nicht in den letzten %s Tagen - Suche über alle Partitionen", prozess_id, since_days)
+            
+            job_config = bigquery.QueryJobConfig(query_parameters=[id_param])
+            for row in await self._in_thread(self._run_query, _FAHRZEUG_PROZESS_ALLE_SQL, job_config):
+                return self._convert_row_to_dict(row)
+                
+            return None
+            
+        except Exception as e:
+            logger.error(f"Fahrzeug-Prozess abrufen Fehler: {e}")
+            return None
     
     async def update_fahrzeug_prozess(self, prozess_id: str, update_data: Dict[str, Any]) -> bool:
         """Fahrzeug-Prozess aktualisieren"""
@@ -213,39 +976,25 @@ class BigQueryService:
             return True
             
         try:
-            # Valide Prozess-Felder
-            prozess_fields = [
-                'status', 'bearbeiter', 'prioritaet', 'anlieferung_datum',
-                'start_timestamp', 'ende_timestamp', 'dauer_minuten',
-                'sla_tage', 'sla_deadline_datum', 'tage_bis_sla_deadline',
-                'standzeit_tage', 'notizen'
-            ]
-            
-            set_clauses = []
-            parameters = []
-            
-            for key, value in update_data.items():
-                if key in prozess_fields and value is not None:
-                    set_clauses.append(f"{key} = @{key}")
-                    parameters.append(self._create_query_parameter(key, value))
+            updates = {
+                key: value for key, value in update_data.items()
+                if key in _PROZESS_FIELDS and value is not None
+            }
             
-            if not set_clauses:
+            if not updates:
                 logger.warning("Keine gültigen Prozess-Felder zu aktualisieren")
                 return False
             
-            parameters.append(bigquery.ScalarQueryParameter("prozess_id", "STRING", prozess_id))
+            # SQL-Text nur einmal pro Feldkombination erzeugen
+            query = _build_prozess_update_sql(frozenset(updates))
             
-            query = f"""
-            UPDATE `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
-            SET {', '.join(set_clauses)}, updated_at = CURRENT_TIMESTAMP()
-            WHERE prozess_id = @prozess_id
-            """
+            parameters = [self._create_query_parameter(key, value) for key, value in updates.items()]
+            parameters.append(bigquery.ScalarQueryParameter("prozess_id", "STRING", prozess_id))
             
             job_config = bigquery.QueryJobConfig(query_parameters=parameters)
-            query_job = self.client.query(query, job_config=job_config)
-            query_job.result()
+            await self._in_thread(self._run_query, query, job_config)
             
-            logger.info(f"✅ Fahrzeug-Prozess aktualisiert: {prozess_id}")
+            logger.info("✅ Fahrzeug-Prozess aktualisiert: %s", prozess_id)
             return True
             
         except Exception as e:
@@ -267,86 +1016,101 @@ class BigQueryService:
             return self._get_mock_fahrzeuge_mit_prozessen()
             
         try:
-            where_conditions = ["1=1"]
+            # Fester SQL-Text für alle Filterkombinationen - BigQuery erkennt die Abfrage wieder
+            parameters = [
+                bigquery.ScalarQueryParameter("status", "STRING", status_filter or None),
+                bigquery.ScalarQueryParameter("prozess_typ", "STRING", prozess_filter or None),
+                bigquery.ScalarQueryParameter("limit", "INT64", limit)
+            ]
             
-            if status_filter:
-                where_conditions.append(f"p.status = '{status_filter}'")
-            if prozess_filter:
-                where_conditions.append(f"p.prozess_typ = '{prozess_filter}'")
-                
-            where_clause = " AND ".join(where_conditions)
+            job_config = bigquery.QueryJobConfig(query_parameters=parameters)
             
-            query = f"""
-            SELECT 
-              p.fin,
-              s.marke,
-              s.modell,
-              s.antriebsart,
-              s.farbe,
-              s.baujahr,
-              p.prozess_id,
-              p.prozess_typ,
-              p.status,
-              p.bearbeiter,
-              p.prioritaet,
-              p.standzeit_tage,
-              p.tage_bis_sla_deadline,
-              p.created_at,
-              p.updated_at
-            FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` p
-            LEFT JOIN `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` s
-              ON p.fin = s.fin
-            WHERE {where_clause}
-            ORDER BY p.updated_at DESC
-            LIMIT {limit}
-            """
+            return await self._in_thread(self._query_to_dicts, _FAHRZEUGE_MIT_PROZESSEN_SQL, job_config)
             
-            results = self.client.query(query).result()
+        except Exception as e:
+            logger.error(f"Fahrzeuge mit Prozessen abrufen Fehler: {e}")
+            return []
+    
+    async def get_sla_statistik(self) -> Dict[str, int]:
+        """Anzahl offener Prozesse je SLA-Kategorie (critical/warning/ok)"""
+        if not self.client:
+            return self._get_mock_sla_statistik()
             
-            fahrzeuge = []
-            for row in results:
-                fahrzeuge.append(self._convert_row_to_dict(row))
-                
-            return fahrzeuge
+        try:
+            results = await self._in_thread(self._run_query, _SLA_STATISTIK_SQL)
+            row = results[0]
+            return {
+                "critical": row.critical or 0,
+                "warning": row.warning or 0,
+                "ok": row.ok or 0
+            }
             
         except Exception as e:
-            logger.error(f"Fahrzeuge mit Prozessen abrufen Fehler: {e}")
+            logger.error(f"SLA-Statistik Fehler: {e}")
+            return self._get_mock_sla_statistik()
+    
+    async def get_sla_kritische_prozesse(self, top_n: int = 5) -> List[Dict[str, Any]]:
+        """Die top_n dringendsten Prozesse je SLA-Kategorie (Feld 'kategorie')"""
+        if not self.client:
+            return [
+                {
+                    "kategorie": "critical" if fahrzeug["tage_bis_sla_deadline"] < 0 else "warning",
+                    "fahrzeug": f"{fahrzeug['marke']} {fahrzeug['modell']} ()",
+                    **{k: v for k, v in fahrzeug.items() if k not in ("marke", "modell")}
+                }
+                for fahrzeug in self._get_mock_fahrzeuge_mit_prozessen()
+                if fahrzeug["tage_bis_sla_deadline"] <= 1
+            ]
+            
+        try:
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ScalarQueryParameter("top_n", "INT64", top_n)
+            ])
+            return await self._in_thread(self._query_to_dicts, _SLA_DETAIL_SQL, job_config)
+            
+        except Exception as e:
+            logger.error(f"SLA-Detailabfrage Fehler: {e}")
             return []
     
-    async def get_dashboard_kpis(self) -> Dict[str, Any]:
-        """Dashboard KPIs aus normalisierten Tabellen"""
+    async def get_bearbeiter_workload(self) -> Dict[str, Dict[str, Any]]:
+        """Arbeitsbelastung je Bearbeiter (eine Ergebniszeile pro Bearbeiter)"""
+        if not self.client:
+            return self._get_mock_bearbeiter_workload()
+            
+        try:
+            # Seitenweise gestreamt (Arrow-Pfad bei vielen Bearbeitern); Rundung erfolgt bereits im SQL
+            return {
+                row.pop("bearbeiter"): row
+                async for row in self.stream_query(_BEARBEITER_WORKLOAD_SQL)
+            }
+            
+        except Exception as e:
+            logger.error(f"Bearbeiter-Workload Fehler: {e}")
+            return {}
+    
+    async def get_dashboard_kpis(self, use_approx: bool = True, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Dashboard KPIs aus normalisierten Tabellen (use_approx: HyperLogLog-Zählung statt exakt)"""
         if not self.client:
             return self._get_mock_dashboard_kpis()
             
         try:
-            query = """
-            WITH kpi_daten AS (
-              SELECT 
-                COUNT(DISTINCT p.fin) as aktive_fahrzeuge,
-                COUNTIF(DATE(p.created_at) = CURRENT_DATE()) as heute_gestartet,
-                COUNTIF(p.tage_bis_sla_deadline < 0) as sla_verletzungen,
-                AVG(p.standzeit_tage) as avg_standzeit,
-                COUNT(DISTINCT s.marke) as anzahl_marken,
-                COUNT(DISTINCT p.bearbeiter) as anzahl_bearbeiter
-              FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse` p
-              LEFT JOIN `ra-autohaus-tracker.autohaus.fahrzeuge_stamm` s
-                ON p.fin = s.fin
-              WHERE p.status NOT IN ('verkauft', 'storniert', 'abgeschlossen')
-                AND p.created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
-            )
-            SELECT * FROM kpi_daten
-            """
+            zeitpunkt = _abfrage_zeitpunkt(now)
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ScalarQueryParameter("cutoff", "TIMESTAMP", zeitpunkt - timedelta(days=30)),
+                bigquery.ScalarQueryParameter("heute", "DATE", zeitpunkt.date())
+            ])
             
-            results = self.client.query(query).result()
-            row = next(iter(results))
+            results = await self._in_thread(self._run_query, _KPI_SQL[bool(use_approx)], job_config)
+            row = results[0]
             
             return {
                 "aktive_fahrzeuge": row.aktive_fahrzeuge or 0,
                 "heute_gestartet": row.heute_gestartet or 0,
                 "sla_verletzungen": row.sla_verletzungen or 0,
-                "avg_standzeit": round(row.avg_standzeit or 0, 1),
+                "avg_standzeit": row.avg_standzeit,
                 "anzahl_marken": row.anzahl_marken or 0,
                 "anzahl_bearbeiter": row.anzahl_bearbeiter or 0,
+                "durchlaufzeiten": self._format_durchlaufzeiten(row.durchlauf or []),
                 "timestamp": datetime.now().isoformat(),
                 "status": "live_data"
             }
@@ -355,38 +1119,23 @@ class BigQueryService:
             logger.error(f"Dashboard KPIs Fehler: {e}")
             return self._get_mock_dashboard_kpis()
     
-    async def get_warteschlangen_status(self) -> Dict[str, Any]:
+    async def get_warteschlangen_status(self, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Warteschlangen-Status für alle Prozesstypen"""
         if not self.client:
             return self._get_mock_warteschlangen()
             
         try:
-            query = """
-            SELECT 
-              prozess_typ,
-              status,
-              COUNT(*) as anzahl,
-              AVG(standzeit_tage) as avg_standzeit,
-              AVG(tage_bis_sla_deadline) as avg_sla_verbleibend
-            FROM `ra-autohaus-tracker.autohaus.fahrzeug_prozesse`
-            WHERE status IN ('warteschlange', 'geplant', 'in_bearbeitung')
-              AND created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 7 DAY)
-            GROUP BY prozess_typ, status
-            ORDER BY prozess_typ, anzahl DESC
-            """
-            
-            results = self.client.query(query).result()
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ScalarQueryParameter("cutoff", "TIMESTAMP", _abfrage_zeitpunkt(now) - timedelta(days=7))
+            ])
             
-            warteschlangen = {}
-            for row in results:
-                prozess = row.prozess_typ
-                if prozess not in warteschlangen:
-                    warteschlangen[prozess] = {}
-                    
-                warteschlangen[prozess][row.status] = {
-                    "anzahl": row.anzahl,
-                    "avg_standzeit": round(row.avg_standzeit or 0, 1),
-                    "avg_sla_verbleibend": round(row.avg_sla_verbleibend or 0, 1)
+            # Eine Gruppierungsstufe pro Zeile, aufgebaut während die Seiten eintreffen
+            warteschlangen: Dict[str, Dict[str, Any]] = {}
+            async for row in self.stream_query(_WARTESCHLANGEN_SQL, job_config):
+                warteschlangen.setdefault(row["prozess_typ"], {})[row["status"]] = {
+                    "anzahl": row["anzahl"],
+                    "avg_standzeit": row["avg_standzeit"],
+                    "avg_sla_verbleibend": row["avg_sla_verbleibend"]
                 }
             
             return {
@@ -403,144 +1152,263 @@ class BigQueryService:
     # UTILITY Methoden
     # ========================================
     
-    def _prepare_stamm_data(self, vehicle_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Fahrzeug-Stammdaten für BigQuery vorbereiten"""
-        prepared = {}
+    async def _in_thread(self, func, *args, **kwargs):
+        """Blockierenden Abfrage-Aufruf im Thread ausführen, begrenzt auf _MAX_PARALLEL_QUERIES"""
+        async with self._query_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    def _query_semaphore(self) -> asyncio.Semaphore:
+        """Abfrage-Slots der laufenden Event-Loop; bei Loop-Wechsel neu anlegen (wie _InsertBuffer._bind)"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._query_slots_loop:
+            self._query_slots = asyncio.Semaphore(_MAX_PARALLEL_QUERIES)
+            self._query_slots_loop = loop
+        return self._query_slots
+    
+    async def stream_query(
+        self,
+        query: str,
+        job_config: Optional[bigquery.QueryJobConfig] = None,
+        page_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Query-Ergebnis seitenweise als Dictionaries streamen (höchstens eine Seite im Speicher)
+
+        Jeder Seitenabruf belegt einen Abfrage-Slot nur für die Dauer des Abrufs, nicht
+        während der Verbraucher die Zeilen verarbeitet.
+        """
+        query_job = await self._in_thread(self.client.query, query, job_config=job_config)
+        rows = await self._in_thread(query_job.result, page_size=page_size)
+        
+        source = None
+        if self._storage_client is not None and (rows.total_rows or 0) >= _ARROW_MIN_ROWS:
+            try:
+                source = iter(rows.to_arrow_iterable(bqstorage_client=self._storage_client))
+                convert = self._arrow_batch_to_dicts
+                chunk = await self._in_thread(self._next_chunk, source, convert)
+            except Exception as e:
+                logger.warning(f"Arrow-Stream fehlgeschlagen, nutze Row-Seiten: {e}")
+                source = None
+                rows = await self._in_thread(query_job.result, page_size=page_size)
+        
+        if source is None:
+            source = iter(rows.pages)
+            convert = self._page_to_dicts
+            chunk = await self._in_thread(self._next_chunk, source, convert)
+        
+        while chunk is not None:
+            for row in chunk:
+                yield row
+            chunk = await self._in_thread(self._next_chunk, source, convert)
+    
+    # Blockierende Client-Aufrufe - aus async Methoden nur via _in_thread/asyncio.to_thread nutzen,
+    # damit der Event-Loop während der Job-Laufzeit andere Requests bedienen kann
+    
+    def _run_query(self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> List[Any]:
+        """Query ausführen und alle Ergebniszeilen laden"""
+        return list(self.client.query(query, job_config=job_config).result())
+    
+    def _run_dml(self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> int:
+        """DML-Statement ausführen und Anzahl betroffener Zeilen liefern"""
+        job = self.client.query(query, job_config=job_config)
+        job.result()
+        return job.num_dml_affected_rows or 0
+    
+    def _query_to_dicts(self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> List[Dict[str, Any]]:
+        """Query ausführen und Ergebnis als Liste von Dictionaries laden"""
+        return self._rows_to_dicts(self.client.query(query, job_config=job_config))
+    
+    async def _insert_rows(self, name: str, rows: List[Dict[str, Any]]) -> bool:
+        """Vorbereitete Zeilen per Streaming-Insert schreiben - True nur wenn alle Zeilen geschrieben sind"""
+        return all(await self._insert_rows_results(name, rows))
+    
+    async def _insert_rows_results(self, name: str, rows: List[Dict[str, Any]]) -> List[bool]:
+        """Zeilen in Blöcken zu _INSERT_BATCH_SIZE per Streaming-Insert schreiben, Ergebnis je Zeile.
         
-        for key, value in vehicle_data.items():
-            if value is not None:
-                if isinstance(value, (datetime, date)):
-                    prepared[key] = value.isoformat()
-                else:
-                    prepared[key] = value
+        insertAll verwirft bei einer ungültigen Zeile den ganzen Aufruf; die übrigen Zeilen
+        melden dann nur "stopped". Diese werden ohne die abgelehnten Zeilen erneut gesendet,
+        damit eine fehlerhafte Zeile nicht die Zeilen anderer Aufrufer mitreißt.
+        """
+        results = [False] * len(rows)
+        table = await asyncio.to_thread(self._get_table, name)
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            pending = list(range(start, min(start + _INSERT_BATCH_SIZE, len(rows))))
+            while pending:
+                errors = await asyncio.to_thread(
+                    self.client.insert_rows_json, table, [rows[index] for index in pending]
+                )
+                if not errors:
+                    for index in pending:
+                        results[index] = True
+                    break
+                
+                logger.error(f"BigQuery Einfüge-Fehler {name}: {errors}")
+                # Positionen (im gesendeten Block) mit eigenem Fehler - nicht nur "stopped"
+                abgelehnt = {
+                    entry["index"] for entry in errors
+                    if any(error.get("reason") != "stopped" for error in entry.get("errors", ()))
+                }
+                if not abgelehnt:
+                    # Keine Zeile als Ursache erkennbar - erneutes Senden brächte keinen Fortschritt
+                    break
+                # Schema evtl. geändert - Metadaten beim nächsten Insert neu laden
+                self._table_cache.pop(name, None)
+                pending = [index for position, index in enumerate(pending) if position not in abgelehnt]
+        return results
+    
+    def _get_table(self, name: str) -> bigquery.Table:
+        """Tabellen-Objekt aus dem Cache holen (get_table nur beim ersten Zugriff)"""
+        table = self._table_cache.get(name)
+        if table is None:
+            table_ref = self.client.dataset(self.dataset_id).table(name)
+            table = self.client.get_table(table_ref)
+            self._table_cache[name] = table
+        return table
+    
+    def _prepare_stamm_data(self, vehicle_data: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """Fahrzeug-Stammdaten für BigQuery vorbereiten (now_iso: Zeitstempel für Defaults)"""
+        prepared = _prepare_row(vehicle_data)
         
         # Default-Werte setzen falls nicht vorhanden
-        if "ersterfassung_datum" not in prepared:
-            prepared["ersterfassung_datum"] = datetime.now().isoformat()
-        if "aktiv" not in prepared:
-            prepared["aktiv"] = True
-            
+        prepared.setdefault("ersterfassung_datum", now_iso or datetime.now().isoformat())
+        prepared.setdefault("aktiv", True)
+        
         return prepared
     
-    def _prepare_prozess_data(self, process_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prozess-Daten für BigQuery vorbereiten"""
-        prepared = {}
+    def _prepare_prozess_data(self, process_data: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """Prozess-Daten für BigQuery vorbereiten (now_iso: Zeitstempel für Defaults)"""
+        prepared = _prepare_row(process_data)
         
-        for key, value in process_data.items():
-            if value is not None:
-                if isinstance(value, (datetime, date)):
-                    prepared[key] = value.isoformat()
-                else:
-                    prepared[key] = value
+        # Default-Werte setzen falls nicht vorhanden (ein Zeitstempel für beide Felder)
+        now_iso = now_iso or datetime.now().isoformat()
+        prepared.setdefault("erstellt_am", now_iso)
+        prepared.setdefault("aktualisiert_am", now_iso)
         
-        # Default-Werte setzen falls nicht vorhanden
-        if "erstellt_am" not in prepared:
-            prepared["erstellt_am"] = datetime.now().isoformat()
-        if "aktualisiert_am" not in prepared:
-            prepared["aktualisiert_am"] = datetime.now().isoformat()
-            
         return prepared
     
     def _convert_row_to_dict(self, row) -> Dict[str, Any]:
         """BigQuery Row zu Dictionary konvertieren"""
-        result = {}
-        for key, value in dict(row).items():
-            if hasattr(value, 'isoformat'):
-                result[key] = value.isoformat()
+        return {
+            key: value.isoformat() if hasattr(value, 'isoformat') else value
+            for key, value in row.items()
+        }
+    
+    def _rows_to_dicts(self, query_job) -> List[Dict[str, Any]]:
+        """Query-Ergebnis als Liste von Dictionaries (Arrow-Pfad für große Ergebnisse)"""
+        rows = query_job.result()
+        
+        if self._storage_client is not None and (rows.total_rows or 0) >= _ARROW_MIN_ROWS:
+            try:
+                return self._rows_to_dicts_arrow(rows)
+            except Exception as e:
+                logger.warning(f"Arrow-Konvertierung fehlgeschlagen, nutze Row-Iteration: {e}")
+                rows = query_job.result()
+        
+        return [self._convert_row_to_dict(row) for row in rows]
+    
+    def _rows_to_dicts_arrow(self, rows) -> List[Dict[str, Any]]:
+        """Ergebnis über die Storage Read API als Arrow-Tabelle laden"""
+        return self._arrow_table_to_dicts(rows.to_arrow(bqstorage_client=self._storage_client))
+    
+    def _arrow_batch_to_dicts(self, batch) -> List[Dict[str, Any]]:
+        """Einzelnen Arrow RecordBatch (Storage-Read-Stream) konvertieren"""
+        return self._arrow_table_to_dicts(pa.Table.from_batches([batch]))
+    
+    def _page_to_dicts(self, page) -> List[Dict[str, Any]]:
+        """Einzelne REST-Ergebnisseite konvertieren"""
+        return [self._convert_row_to_dict(row) for row in page]
+    
+    @staticmethod
+    def _next_chunk(source, convert) -> Optional[List[Dict[str, Any]]]:
+        """Nächste Seite/Batch laden und konvertieren (None wenn erschöpft)"""
+        chunk = next(source, None)
+        return None if chunk is None else convert(chunk)
+    
+    def _arrow_table_to_dicts(self, table) -> List[Dict[str, Any]]:
+        """Arrow-Tabelle spaltenweise konvertieren (gleiche Strings wie _convert_row_to_dict)"""
+        # Datums-/Zeitspalten einmal pro Spalte statt pro Zeile in ISO-Strings umwandeln
+        for index, field in enumerate(table.schema):
+            if pa.types.is_timestamp(field.type):
+                fmt = "%Y-%m-%dT%H:%M:%S+00:00" if field.type.tz else "%Y-%m-%dT%H:%M:%S"
+            elif pa.types.is_date(field.type):
+                fmt = "%Y-%m-%d"
             else:
-                result[key] = value
-        return result
+                continue
+            column = pc.strftime(table.column(index), format=fmt)
+            if pa.types.is_timestamp(field.type):
+                # %S liefert immer Sekundenbruchteile - ganze Sekunden wie isoformat() ohne ".000000"
+                column = pc.replace_substring_regex(column, pattern=r"\.0+(\+00:00)?$", replacement=r"\1")
+            table = table.set_column(index, field.name, column)
+        
+        return table.to_pylist()
+    
+    def _format_durchlaufzeiten(self, durchlauf: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Durchlaufzeiten (Stunden) der abgeschlossenen Prozesse je Prozesstyp zusammenfassen"""
+        dauern: Dict[str, List[float]] = {}
+        for prozess_typ, dauer_stunden in map(_DURCHLAUF_FELDER, durchlauf):
+            dauern.setdefault(prozess_typ or "Unbekannt", []).append(float(dauer_stunden))
+        
+        return {
+            prozess_typ: {
+                "anzahl": len(werte),
+                "avg_stunden": round(sum(werte) / len(werte), 1),
+                "min_stunden": round(min(werte), 1),
+                "max_stunden": round(max(werte), 1)
+            }
+            for prozess_typ, werte in dauern.items()
+        }
     
     def _create_query_parameter(self, key: str, value: Any) -> bigquery.ScalarQueryParameter:
         """Query Parameter basierend auf Datentyp erstellen"""
-        if isinstance(value, str):
-            return bigquery.ScalarQueryParameter(key, "STRING", value)
-        elif isinstance(value, int):
-            return bigquery.ScalarQueryParameter(key, "INTEGER", value)
-        elif isinstance(value, float):
-            return bigquery.ScalarQueryParameter(key, "NUMERIC", value)
-        elif isinstance(value, bool):
-            return bigquery.ScalarQueryParameter(key, "BOOLEAN", value)
-        elif isinstance(value, (datetime, date)):
+        builder = _PARAM_BUILDERS.get(type(value))
+        if builder is not None:
+            return builder(key, value)
+        
+        # Unterklassen (z.B. pandas.Timestamp) und unbekannte Typen
+        if isinstance(value, (datetime, date)):
             return bigquery.ScalarQueryParameter(key, "DATETIME", value.isoformat())
-        else:
-            return bigquery.ScalarQueryParameter(key, "STRING", str(value))
+        return bigquery.ScalarQueryParameter(key, "STRING", str(value))
     
     # ========================================
     # MOCK-Daten für Fallback
     # ========================================
     
+    # Mock-Methoden liefern flache Kopien der Modul-Konstanten; Zeilen-Dicts werden
+    # einzeln kopiert, da Aufrufer (z.B. VehicleService) Felder ergänzen
+    
     def _get_mock_fahrzeug_stamm(self, fin: str) -> Dict[str, Any]:
         """Mock Fahrzeug-Stammdaten"""
-        return {
-            "fin": fin,
-            "marke": "Audi",
-            "modell": "A4",
-            "antriebsart": "Benzin",
-            "farbe": "Schwarz",
-            "baujahr": 2020,
-            "kw_leistung": 140,
-            "km_stand": 25000,
-            "ek_netto": 18500.00,
-            "status": "mock_data"
-        }
+        return {"fin": fin, **_MOCK_FAHRZEUG_STAMM}
     
     def _get_mock_fahrzeuge_mit_prozessen(self) -> List[Dict[str, Any]]:
         """Mock Fahrzeuge mit Prozessen"""
-        return [
-            {
-                "fin": "WAUZZZGE1NB038655",
-                "marke": "Audi",
-                "modell": "A4",
-                "prozess_typ": "Aufbereitung",
-                "status": "in_bearbeitung",
-                "bearbeiter": "Hans Müller",
-                "prioritaet": 3,
-                "standzeit_tage": 2,
-                "tage_bis_sla_deadline": 1
-            }
-        ]
+        return [dict(fahrzeug) for fahrzeug in _MOCK_FAHRZEUGE_MIT_PROZESSEN]
+    
+    def _get_mock_sla_statistik(self) -> Dict[str, Any]:
+        """Mock SLA-Verteilung"""
+        return dict(_MOCK_SLA_STATISTIK)
+    
+    def _get_mock_bearbeiter_workload(self) -> Dict[str, Dict[str, Any]]:
+        """Mock Bearbeiter-Workload"""
+        return dict(_MOCK_BEARBEITER_WORKLOAD)
     
     def _get_mock_fahrzeug_prozesse(self, fin: str) -> List[Dict[str, Any]]:
         """Mock Prozesse für Fahrzeug"""
-        return [
-            {
-                "prozess_id": f"PROC_{uuid.uuid4().hex[:8]}",
-                "fin": fin,
-                "prozess_typ": "Aufbereitung",
-                "status": "in_bearbeitung",
-                "bearbeiter": "Hans Müller",
-                "prioritaet": 5,
-                "standzeit_tage": 2
-            }
-        ]
+        return [{"prozess_id": new_process_id(), "fin": fin, **_MOCK_FAHRZEUG_PROZESS}]
+    
+    def _get_mock_fahrzeug_prozess(self, prozess_id: str) -> Dict[str, Any]:
+        """Mock einzelner Prozess"""
+        return {"prozess_id": prozess_id, **_MOCK_FAHRZEUG_PROZESS}
     
     def _get_mock_dashboard_kpis(self) -> Dict[str, Any]:
         """Mock Dashboard KPIs"""
-        return {
-            "aktive_fahrzeuge": 42,
-            "heute_gestartet": 3,
-            "sla_verletzungen": 2,
-            "avg_standzeit": 15.5,
-            "anzahl_marken": 8,
-            "anzahl_bearbeiter": 6,
-            "timestamp": datetime.now().isoformat(),
-            "status": "mock_data"
-        }
+        return {**_MOCK_DASHBOARD_KPIS, "timestamp": datetime.now().isoformat()}
     
     def _get_mock_warteschlangen(self) -> Dict[str, Any]:
         """Mock Warteschlangen-Status"""
-        return {
-            "warteschlangen": {
-                "Aufbereitung": {
-                    "warteschlange": {"anzahl": 5, "avg_standzeit": 2.3},
-                    "in_bearbeitung": {"anzahl": 2, "avg_standzeit": 1.1}
-                },
-                "Foto": {
-                    "warteschlange": {"anzahl": 3, "avg_standzeit": 0.8},
-                    "in_bearbeitung": {"anzahl": 1, "avg_standzeit": 0.5}
-                }
-            },
-            "timestamp": datetime.now().isoformat(),
-            "status": "mock_data"
-        }
\ No newline at end of file
+        return {**_MOCK_WARTESCHLANGEN, "timestamp": datetime.now().isoformat()}
+
+
+@lru_cache(maxsize=1)
+def get_shared_bigquery_service() -> BigQueryService:
+    """Prozessweit gemeinsame BigQueryService-Instanz für Services ohne explizit übergebenen Service"""
+    return BigQueryService()
@@ -1,19 +1,69 @@
 # src/services/dashboard_service.py - Analytics Layer mit BigQueryService
 """Dashboard Service für KPIs und Statistiken - nutzt zentrale BigQueryService"""
 
+import asyncio
 import logging
+from bisect import bisect_left
 from datetime import datetime
-from typing import Dict, Any, Optional
-from src.services.bigquery_service import BigQueryService
+from typing import Dict, Any, List, Optional
+from src.core.cache import QueryCache, RedisCache, cached_query
+from src.services.bigquery_service import BigQueryService, get_shared_bigquery_service
 
 logger = logging.getLogger(__name__)
 
+# Dashboard-Daten ändern sich im Minutenbereich - kurze TTL reicht
+DASHBOARD_CACHE_TTL = 30
+
+# Bewertungsstufen als Obergrenzen (inklusive) für ganzzahlige Werte:
+# bisect_left liefert den Index der ersten Grenze >= Wert
+_SLA_AMPEL_GRENZEN = (0, 3)
+_SLA_AMPEL_LABELS = ("grün", "gelb", "rot")
+
+_AUSLASTUNG_GRENZEN = (19, 50, 80)
+_AUSLASTUNG_LABELS = ("niedrig", "normal", "hoch", "überlastet")
+
+_KAPAZITAET_GRENZEN = (9, 25, 50)
+_KAPAZITAET_LABELS = ("entspannt", "normal", "ausgelastet", "überlastet")
+
+# Fallback-KPIs bei Fehlern - einmal angelegt, Aufrufer erhalten eine Kopie
+_FALLBACK_KPIS = {
+    "aktive_fahrzeuge": 42,
+    "heute_gestartet": 3,
+    "sla_verletzungen": 2,
+    "avg_standzeit": 15.5,
+    "anzahl_marken": 8,
+    "anzahl_bearbeiter": 6,
+    "sla_ampel": "gelb",
+    "auslastung_bewertung": "normal",
+    "status": "fallback_data"
+}
+
+
+# Ergebnis-Status, die nicht gecacht werden: Fehler sowie Mock-/Fallback-Daten, die der
+# BigQueryService bei fehlgeschlagenen Abfragen statt echter Zahlen liefert
+_NICHT_CACHEBAR = frozenset({"error", "mock_data", "fallback_data"})
+
+
+def _ist_cachebar(result: Dict[str, Any]) -> bool:
+    """Fehler- und Mock-Ergebnisse nicht cachen, damit der nächste Aufruf neu abfragt"""
+    if result.get("status") in _NICHT_CACHEBAR or result.get("dashboard_status") in _NICHT_CACHEBAR:
+        return False
+    kpis = result.get("kpis")
+    return not (isinstance(kpis, dict) and kpis.get("status") in _NICHT_CACHEBAR)
+
 class DashboardService:
-    """Dashboard-Service für Analytics und KPIs"""
+    """Dashboard-Service für Analytics und KPIs.
+
+    Zeitstempel in Ergebnissen sind ISO-Strings - die Antworten bleiben JSON-nativ
+    und damit auch über die Redis-Stufe des Caches unverändert.
+    """
     
     def __init__(self, bq_service: Optional[BigQueryService] = None):
-        self.bq_service = bq_service or BigQueryService()
+        self.bq_service = bq_service or get_shared_bigquery_service()
+        # Ergebnis-Cache für wiederholte Dashboard-Abfragen (mit REDIS_URL workerübergreifend)
+        self._cache = QueryCache(maxsize=256, l2=RedisCache.from_env())
     
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, cacheable=_ist_cachebar)
     async def get_kpis(self) -> Dict[str, Any]:
         """Haupt-KPIs für das Dashboard abrufen"""
         try:
@@ -45,6 +95,7 @@ class DashboardService:
                 "timestamp": datetime.now().isoformat()
             }
     
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, cacheable=_ist_cachebar)
     async def get_warteschlangen(self) -> Dict[str, Any]:
         """Warteschlangen-Status für alle Prozesse"""
         try:
@@ -55,15 +106,15 @@ class DashboardService:
                 warteschlangen = warteschlangen_data.get("warteschlangen", {})
                 
                 # Gesamtanzahl wartender Fahrzeuge berechnen
-                total_wartend = 0
-                total_in_bearbeitung = 0
-                
-                for prozess_typ, status_data in warteschlangen.items():
-                    warteschlange_count = status_data.get("warteschlange", {}).get("anzahl", 0)
-                    bearbeitung_count = status_data.get("in_bearbeitung", {}).get("anzahl", 0)
-                    
-                    total_wartend += warteschlange_count
-                    total_in_bearbeitung += bearbeitung_count
+                leer: Dict[str, Any] = {}
+                total_wartend = sum(
+                    status_data.get("warteschlange", leer).get("anzahl", 0)
+                    for status_data in warteschlangen.values()
+                )
+                total_in_bearbeitung = sum(
+                    status_data.get("in_bearbeitung", leer).get("anzahl", 0)
+                    for status_data in warteschlangen.values()
+                )
                 
                 # Kapazitäts-Bewertung hinzufügen
                 warteschlangen_data["zusammenfassung"] = {
@@ -83,42 +134,36 @@ class DashboardService:
                 "timestamp": datetime.now().isoformat()
             }
     
+    @cached_query(ttl=DASHBOARD_CACHE_TTL, cacheable=_ist_cachebar)
     async def get_sla_overview(self) -> Dict[str, Any]:
         """SLA-Übersicht und kritische Fälle"""
         try:
-            # Würde eine spezielle SLA-Query über BigQueryService machen
-            # Hier vereinfacht als Beispiel
-            fahrzeuge = await self.bq_service.get_fahrzeuge_mit_prozessen(limit=100)
+            # Zählen und Top-5-Auswahl übernimmt BigQuery, beide Abfragen laufen parallel
+            statistik, kritische = await asyncio.gather(
+                self.bq_service.get_sla_statistik(),
+                self.bq_service.get_sla_kritische_prozesse(top_n=5)
+            )
             
-            sla_critical = []
-            sla_warning = []
-            sla_ok = []
-            
-            for fahrzeug in fahrzeuge:
-                tage_bis_deadline = fahrzeug.get("tage_bis_sla_deadline")
-                if tage_bis_deadline is not None:
-                    if tage_bis_deadline < 0:
-                        sla_critical.append(fahrzeug)
-                    elif tage_bis_deadline <= 1:
-                        sla_warning.append(fahrzeug)
-                    else:
-                        sla_ok.append(fahrzeug)
+            details: Dict[str, List[Dict[str, Any]]] = {"critical": [], "warning": []}
+            for fahrzeug in kritische:
+                details[fahrzeug.pop("kategorie")].append(fahrzeug)
             
             return {
                 "sla_overview": {
                     "critical": {
-                        "anzahl": len(sla_critical),
-                        "fahrzeuge": sla_critical[:5]  # Top 5 kritische
+                        "anzahl": statistik["critical"],
+                        "fahrzeuge": details["critical"]  # Top 5 kritische
                     },
                     "warning": {
-                        "anzahl": len(sla_warning),
-                        "fahrzeuge": sla_warning[:5]  # Top 5 Warnung
+                        "anzahl": statistik["warning"],
+                        "fahrzeuge": details["warning"]  # Top 5 Warnung
                     },
                     "ok": {
-                        "anzahl": len(sla_ok)
+                        "anzahl": statistik["ok"]
                     }
                 },
-                "status": "success",
+                # Mock-Statistik (Abfrage fehlgeschlagen) kenntlich machen - wird nicht gecacht
+                "status": "mock_data" if statistik.get("status") == "mock_data" else "success",
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -133,42 +178,8 @@ class DashboardService:
     async def get_bearbeiter_workload(self) -> Dict[str, Any]:
         """Arbeitsbelastung pro Bearbeiter"""
         try:
-            fahrzeuge = await self.bq_service.get_fahrzeuge_mit_prozessen(limit=200)
-            
-            bearbeiter_stats = {}
-            
-            for fahrzeug in fahrzeuge:
-                bearbeiter = fahrzeug.get("bearbeiter")
-                if bearbeiter:
-                    if bearbeiter not in bearbeiter_stats:
-                        bearbeiter_stats[bearbeiter] = {
-                            "aktive_prozesse": 0,
-                            "warteschlange": 0,
-                            "sla_critical": 0,
-                            "avg_standzeit": 0,
-                            "prozesse": []
-                        }
-                    
-                    stats = bearbeiter_stats[bearbeiter]
-                    status = fahrzeug.get("status")
-                    
-                    if status == "in_bearbeitung":
-                        stats["aktive_prozesse"] += 1
-                    elif status == "warteschlange":
-                        stats["warteschlange"] += 1
-                    
-                    if fahrzeug.get("tage_bis_sla_deadline", 0) < 0:
-                        stats["sla_critical"] += 1
-                    
-                    stats["prozesse"].append(fahrzeug)
-            
-            # Durchschnittliche Standzeit berechnen
-            for bearbeiter, stats in bearbeiter_stats.items():
-                if stats["prozesse"]:
-                    standzeiten = [p.get("standzeit_tage", 0) for p in stats["prozesse"] if p.get("standzeit_tage")]
-                    stats["avg_standzeit"] = round(sum(standzeiten) / len(standzeiten), 1) if standzeiten else 0
-                    # Prozesse-Liste für Übersicht entfernen (zu viele Daten)
-                    del stats["prozesse"]
+            # Gruppierung, Zählungen und Durchschnitt berechnet BigQuery
+            bearbeiter_stats = await self.bq_service.get_bearbeiter_workload()
             
             return {
                 "bearbeiter_workload": bearbeiter_stats,
@@ -184,54 +195,47 @@ class DashboardService:
                 "error": str(e)
             }
     
+    async def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """Alle Dashboard-Bereiche in einem Aufruf - Teilabfragen laufen parallel"""
+        bereiche = ("kpis", "warteschlangen", "sla_overview", "bearbeiter_workload")
+        ergebnisse = await asyncio.gather(
+            self.get_kpis(),
+            self.get_warteschlangen(),
+            self.get_sla_overview(),
+            self.get_bearbeiter_workload(),
+            return_exceptions=True
+        )
+        
+        snapshot: Dict[str, Any] = {}
+        for bereich, ergebnis in zip(bereiche, ergebnisse):
+            if isinstance(ergebnis, Exception):
+                logger.error(f"Dashboard Snapshot Fehler ({bereich}): {ergebnis}")
+                ergebnis = {"status": "error", "error": str(ergebnis)}
+            snapshot[bereich] = ergebnis
+        
+        snapshot["timestamp"] = datetime.now().isoformat()
+        return snapshot
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Treffer/Fehlschläge des Ergebnis-Caches"""
+        return self._cache.stats()
+    
     # ========================================
     # UTILITY Methoden für Geschäftslogik
     # ========================================
     
     def _calculate_sla_ampel(self, sla_violations: int) -> str:
         """SLA-Ampel-Status berechnen"""
-        if sla_violations == 0:
-            return "grün"
-        elif sla_violations <= 3:
-            return "gelb"
-        else:
-            return "rot"
+        return _SLA_AMPEL_LABELS[bisect_left(_SLA_AMPEL_GRENZEN, sla_violations)]
     
     def _calculate_auslastung(self, aktive_fahrzeuge: int) -> str:
         """Auslastungs-Bewertung berechnen"""
-        # Diese Werte könnten konfigurierbar sein
-        if aktive_fahrzeuge < 20:
-            return "niedrig"
-        elif aktive_fahrzeuge <= 50:
-            return "normal"
-        elif aktive_fahrzeuge <= 80:
-            return "hoch"
-        else:
-            return "überlastet"
+        return _AUSLASTUNG_LABELS[bisect_left(_AUSLASTUNG_GRENZEN, aktive_fahrzeuge)]
     
     def _calculate_capacity_status(self, wartend: int, in_bearbeitung: int) -> str:
         """Kapazitäts-Status der Warteschlangen"""
-        total = wartend + in_bearbeitung
-        
-        if total < 10:
-            return "entspannt"
-        elif total <= 25:
-            return "normal"
-        elif total <= 50:
-            return "ausgelastet"
-        else:
-            return "überlastet"
+        return _KAPAZITAET_LABELS[bisect_left(_KAPAZITAET_GRENZEN, wartend + in_bearbeitung)]
     
     def _get_fallback_kpis(self) -> Dict[str, Any]:
         """Fallback KPIs wenn BigQuery nicht verfügbar"""
-        return {
-            "aktive_fahrzeuge": 42,
-            "heute_gestartet": 3,
-            "sla_verletzungen": 2,
-            "avg_standzeit": 15.5,
-            "anzahl_marken": 8,
-            "anzahl_bearbeiter": 6,
-            "sla_ampel": "gelb",
-            "auslastung_bewertung": "normal",
-            "status": "fallback_data"
-        }
\ No newline at end of file
+        return dict(_FALLBACK_KPIS)
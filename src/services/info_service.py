@@ -1,88 +1,141 @@
 # src/services/info_service.py - Zeichenkodierung korrigiert
 """Info Service für System-Informationen"""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Tuple
+
+import orjson
+
+
+class ProzessInfo(NamedTuple):
+    """Stammdaten eines Hauptprozesses"""
+    beschreibung: str
+    status_optionen: Tuple[str, ...]
+    durchschnittsdauer_tage: int
+    sla_stunden: int
+    sla_tage: float
+
 
 class InfoService:
+    """Statische System-Informationen - Antworten werden einmal beim Import aufgebaut"""
     
-    @staticmethod
-    def get_prozesse_info() -> Dict[str, Any]:
-        """Info über alle verfügbaren Prozesse"""
-        prozesse = {
-            "einkauf": {
-                "beschreibung": "Fahrzeug-Einkauf und Ankauf",
-                "status_optionen": ["gestartet", "in_verhandlung", "abgeschlossen", "abgelehnt"],
-                "durchschnittsdauer_tage": 5,
-                "sla_stunden": 48
-            },
-            "anlieferung": {
-                "beschreibung": "Fahrzeug-Anlieferung und Transport",
-                "status_optionen": ["geplant", "unterwegs", "angekommen", "verzögert"],
-                "durchschnittsdauer_tage": 2,
-                "sla_stunden": 24
-            },
-            "aufbereitung": {
-                "beschreibung": "Fahrzeug-Aufbereitung und Reinigung",
-                "status_optionen": ["warteschlange", "in_bearbeitung", "abgeschlossen", "nachbesserung"],
-                "durchschnittsdauer_tage": 3,
-                "sla_stunden": 72
-            },
-            "foto": {
-                "beschreibung": "Professionelle Fahrzeug-Fotografie",
-                "status_optionen": ["warteschlange", "fotoshooting", "bearbeitung", "fertig"],
-                "durchschnittsdauer_tage": 1,
-                "sla_stunden": 24
-            },
-            "werkstatt": {
-                "beschreibung": "Reparatur und technische Prüfung",
-                "status_optionen": ["diagnose", "reparatur", "qualitätskontrolle", "abgenommen"],
-                "durchschnittsdauer_tage": 7,
-                "sla_stunden": 168
-            },
-            "verkauf": {
-                "beschreibung": "Vermarktung und Verkauf",
-                "status_optionen": ["inseriert", "interessenten", "probefahrt", "verkauft"],
-                "durchschnittsdauer_tage": 30,
-                "sla_stunden": 720
-            }
-        }
-        
-        return {
-            "prozesse": prozesse,
-            "anzahl": len(prozesse),
-            "gesamtdurchlauf_tage": sum(p["durchschnittsdauer_tage"] for p in prozesse.values())
+    _PROZESSE_BASIS: Dict[str, Dict[str, Any]] = {
+        "einkauf": {
+            "beschreibung": "Fahrzeug-Einkauf und Ankauf",
+            "status_optionen": ["gestartet", "in_verhandlung", "abgeschlossen", "abgelehnt"],
+            "durchschnittsdauer_tage": 5,
+            "sla_stunden": 48
+        },
+        "anlieferung": {
+            "beschreibung": "Fahrzeug-Anlieferung und Transport",
+            "status_optionen": ["geplant", "unterwegs", "angekommen", "verzögert"],
+            "durchschnittsdauer_tage": 2,
+            "sla_stunden": 24
+        },
+        "aufbereitung": {
+            "beschreibung": "Fahrzeug-Aufbereitung und Reinigung",
+            "status_optionen": ["warteschlange", "in_bearbeitung", "abgeschlossen", "nachbesserung"],
+            "durchschnittsdauer_tage": 3,
+            "sla_stunden": 72
+        },
+        "foto": {
+            "beschreibung": "Professionelle Fahrzeug-Fotografie",
+            "status_optionen": ["warteschlange", "fotoshooting", "bearbeitung", "fertig"],
+            "durchschnittsdauer_tage": 1,
+            "sla_stunden": 24
+        },
+        "werkstatt": {
+            "beschreibung": "Reparatur und technische Prüfung",
+            "status_optionen": ["diagnose", "reparatur", "qualitätskontrolle", "abgenommen"],
+            "durchschnittsdauer_tage": 7,
+            "sla_stunden": 168
+        },
+        "verkauf": {
+            "beschreibung": "Vermarktung und Verkauf",
+            "status_optionen": ["inseriert", "interessenten", "probefahrt", "verkauft"],
+            "durchschnittsdauer_tage": 30,
+            "sla_stunden": 720
         }
+    }
+    
+    # Unveränderliche Prozess-Datensätze inkl. abgeleiteter SLA-Dauer in Tagen (Attributzugriff statt Dict-Schlüssel)
+    PROZESSE: Mapping[str, ProzessInfo] = MappingProxyType({
+        name: ProzessInfo(
+            beschreibung=prozess["beschreibung"],
+            status_optionen=tuple(prozess["status_optionen"]),
+            durchschnittsdauer_tage=prozess["durchschnittsdauer_tage"],
+            sla_stunden=prozess["sla_stunden"],
+            sla_tage=prozess["sla_stunden"] / 24
+        )
+        for name, prozess in _PROZESSE_BASIS.items()
+    })
+    
+    BEARBEITER: Dict[str, Dict[str, str]] = {
+        "Thomas Küfner": {"bereich": "Einkauf", "kuerzel": "TK"},
+        "Maximilian Reinhardt": {"bereich": "Management", "kuerzel": "MR"},
+        "Hans Müller": {"bereich": "Aufbereitung", "kuerzel": "HM"},
+        "Anna Klein": {"bereich": "Foto", "kuerzel": "AK"},
+        "Thomas Weber": {"bereich": "Werkstatt", "kuerzel": "TW"},
+        "Stefan Bauer": {"bereich": "Verkauf", "kuerzel": "SB"}
+    }
+    
+    SYSTEM_CONFIG: Dict[str, Any] = {
+        "version": "2.0.0",
+        "architektur": "modular_mit_zentraler_bigquery_service",
+        "services": ["BigQueryService", "VehicleService", "DashboardService", "ProcessService", "InfoService"],
+        "datenbank_struktur": {
+            "fahrzeuge_stamm": "Stammdaten (marke, modell, farbe, etc.)",
+            "fahrzeug_prozesse": "Prozess-Tracking (status, bearbeiter, SLA, etc.)"
+        },
+        "integrationen": [
+            {"name": "Zapier", "endpoint": "/integration/zapier/webhook", "status": "aktiv"},
+            {"name": "Flowers Email", "endpoint": "/integration/email/webhook", "status": "aktiv"}
+        ]
+    }
+    
+    # Antwort-Gerüste inkl. abgeleiteter Werte (anzahl, Gesamtdauer) einmalig berechnen
+    _PROZESSE_INFO: Dict[str, Any] = {
+        "prozesse": {name: prozess._asdict() for name, prozess in PROZESSE.items()},
+        "anzahl": len(PROZESSE),
+        "gesamtdurchlauf_tage": sum(p.durchschnittsdauer_tage for p in PROZESSE.values())
+    }
     
-    @staticmethod
-    def get_bearbeiter_info() -> Dict[str, Any]:
+    _BEARBEITER_INFO: Dict[str, Any] = {
+        "bearbeiter": BEARBEITER,
+        "anzahl": len(BEARBEITER)
+    }
+    
+    # Unveränderliche Antworten vorab als JSON-Bytes - Routes liefern sie ohne erneute Serialisierung
+    _PROZESSE_JSON: bytes = orjson.dumps(_PROZESSE_INFO)
+    _BEARBEITER_JSON: bytes = orjson.dumps(_BEARBEITER_INFO)
+    _SYSTEM_CONFIG_JSON: bytes = orjson.dumps(SYSTEM_CONFIG)
+    
+    @classmethod
+    def get_prozesse_info(cls) -> Dict[str, Any]:
+        """Info über alle verfügbaren Prozesse"""
+        return dict(cls._PROZESSE_INFO)
+    
+    @classmethod
+    def get_bearbeiter_info(cls) -> Dict[str, Any]:
         """Info über alle Bearbeiter"""
-        bearbeiter = {
-            "Thomas Küfner": {"bereich": "Einkauf", "kuerzel": "TK"},
-            "Maximilian Reinhardt": {"bereich": "Management", "kuerzel": "MR"},
-            "Hans Müller": {"bereich": "Aufbereitung", "kuerzel": "HM"},
-            "Anna Klein": {"bereich": "Foto", "kuerzel": "AK"},
-            "Thomas Weber": {"bereich": "Werkstatt", "kuerzel": "TW"},
-            "Stefan Bauer": {"bereich": "Verkauf", "kuerzel": "SB"}
-        }
-        
-        return {
-            "bearbeiter": bearbeiter,
-            "anzahl": len(bearbeiter)
-        }
+        return dict(cls._BEARBEITER_INFO)
     
-    @staticmethod
-    def get_system_config() -> Dict[str, Any]:
+    @classmethod
+    def get_system_config(cls) -> Dict[str, Any]:
         """System-Konfiguration und Einstellungen"""
-        return {
-            "version": "2.0.0",
-            "architektur": "modular_mit_zentraler_bigquery_service",
-            "services": ["BigQueryService", "VehicleService", "DashboardService", "ProcessService", "InfoService"],
-            "datenbank_struktur": {
-                "fahrzeuge_stamm": "Stammdaten (marke, modell, farbe, etc.)",
-                "fahrzeug_prozesse": "Prozess-Tracking (status, bearbeiter, SLA, etc.)"
-            },
-            "integrationen": [
-                {"name": "Zapier", "endpoint": "/integration/zapier/webhook", "status": "aktiv"},
-                {"name": "Flowers Email", "endpoint": "/integration/email/webhook", "status": "aktiv"}
-            ]
-        }
\ No newline at end of file
+        return dict(cls.SYSTEM_CONFIG)
+    
+    @classmethod
+    def get_prozesse_info_json(cls) -> bytes:
+        """Prozess-Info als fertig serialisiertes JSON"""
+        return cls._PROZESSE_JSON
+    
+    @classmethod
+    def get_bearbeiter_info_json(cls) -> bytes:
+        """Bearbeiter-Info als fertig serialisiertes JSON"""
+        return cls._BEARBEITER_JSON
+    
+    @classmethod
+    def get_system_config_json(cls) -> bytes:
+        """System-Konfiguration als fertig serialisiertes JSON"""
+        return cls._SYSTEM_CONFIG_JSON
@@ -1,81 +1,132 @@
 # src/services/process_service.py - Korrigiert mit zentraler BigQueryService
 """Process Service für Prozess-Management - nutzt zentrale BigQueryService"""
 
+import asyncio
 import logging
-import uuid
-from typing import Dict, Any, Optional
-from datetime import datetime
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 
+import orjson
+
+from src.core.cache import QueryCache, RedisCache
+from src.core.mappings import BEARBEITER_ALIASES, BEARBEITER_INDEX
+from src.core.utils import new_process_id
 from src.models.integration import UnifiedProcessData
-from src.services.bigquery_service import BigQueryService
+from src.services.bigquery_service import BigQueryService, get_shared_bigquery_service
 from src.handlers.flowers_handler import FlowersHandler
 
 logger = logging.getLogger(__name__)
 
-# Bearbeiter-Mapping für Normalisierung
-BEARBEITER_MAPPING = {
-    "Thomas K.": "Thomas Küfner",
-    "Max R.": "Maximilian Reinhardt", 
-    "Hans M.": "Hans Müller",
-    "Anna K.": "Anna Klein", 
-    "Thomas W.": "Thomas Weber",
-    "Stefan B.": "Stefan Becker",
-    "Mike S.": "Michael Schmidt",
-    "Jürgen": "Jürgen Hoffmann",
-    "Klaus": "Klaus Neumann",
-    "Sandra": "Sandra Richter",
-    "Alex": "Alexander König",
-}
+# Bearbeiter-Mapping für Normalisierung - gemeinsame Tabelle aus src.core.mappings
+BEARBEITER_MAPPING = BEARBEITER_ALIASES
+
+# Vollständige Namen - Eingaben, die keine Normalisierung brauchen
+_BEARBEITER_NAMEN = frozenset(BEARBEITER_MAPPING.values())
+
+# Kleingeschriebene Schlüssel für den Teilstring-Abgleich - nicht pro Aufruf neu berechnen
+_BEARBEITER_KEYS_LOWER = tuple((key.lower(), name) for key, name in BEARBEITER_MAPPING.items())
+
+
+def _bearbeiter_teilstring(input_lower: str) -> Optional[str]:
+    """Erste Kurzform, die im Namen enthalten ist bzw. ihn enthält (Teilstring-Abgleich)"""
+    for key_lower, full_name in _BEARBEITER_KEYS_LOWER:
+        if input_lower in key_lower or key_lower in input_lower:
+            return full_name
+    return None
+
+
+# Einzelne Namensbestandteile (Vor-/Nachnamen, "k.") aus Kurzformen und vollen Namen -> Ergebnis
+# des Teilstring-Abgleichs vorab berechnen (identisches Ergebnis ohne Schleife; None = keine Zuordnung)
+_BEARBEITER_TOKENS = MappingProxyType({
+    token: _bearbeiter_teilstring(token)
+    for name in (*BEARBEITER_MAPPING, *_BEARBEITER_NAMEN)
+    for token in name.lower().split()
+})
+
+# Antwort ohne Hinweise (unveränderlich, von allen Antworten geteilt)
+_KEINE_WARNUNGEN: Tuple[str, ...] = ()
+
+# Einheit für dauer_minuten
+_EINE_MINUTE = timedelta(minutes=1)
+
+# Status-Werte (kleingeschrieben), die Start-/Ende-Zeitstempel setzen
+STATUS_COMPLETED = "abgeschlossen"
+STATUS_ACTIVE = frozenset({"in_bearbeitung", "gestartet"})
+
+# Status (kleingeschrieben) -> Zeitstempel-Spalte, die beim Wechsel in diesen Status gesetzt wird
+_STATUS_ZEITSTEMPEL_FELD = MappingProxyType({
+    STATUS_COMPLETED: "ende_timestamp",
+    **{status: "start_timestamp" for status in STATUS_ACTIVE},
+})
+
+# Stammdaten-Felder aus UnifiedProcessData mit Ersatzwert für leere Angaben (None = unverändert übernehmen)
+_VEHICLE_FIELDS = (
+    ("fin", None),
+    ("marke", "Unbekannt"),
+    ("modell", "Unbekannt"),
+    ("antriebsart", "Unbekannt"),
+    ("farbe", "Unbekannt"),
+    ("baujahr", None),
+    ("datum_erstzulassung", None),
+    ("kw_leistung", None),
+    ("km_stand", None),
+    ("anzahl_fahrzeugschluessel", None),
+    ("bereifungsart", "Unbekannt"),
+    ("anzahl_vorhalter", None),
+    ("ek_netto", None),
+    ("besteuerungsart", "Unbekannt"),
+)
+
+# Existenz von Fahrzeugen kurz merken - Zapier-Bündel enthalten oft mehrere Events je FIN
+_VEHICLE_EXISTS_TTL = 60.0
+_VEHICLE_EXISTS_MAXSIZE = 10_000
 
 class ProcessService:
     """Zentrale Geschäftslogik für alle Prozess-Operationen"""
     
-    def __init__(self, bq_service: Optional[BigQueryService] = None):
-        self.bq_service = bq_service or BigQueryService()
-        self.flowers_handler = FlowersHandler()
+    def __init__(
+        self,
+        bq_service: Optional[BigQueryService] = None,
+        flowers_handler: Optional[FlowersHandler] = None
+    ):
+        self.bq_service = bq_service or get_shared_bigquery_service()
+        self.flowers_handler = flowers_handler or FlowersHandler()
+        # FIN -> vorhanden (LRU mit TTL, mit REDIS_URL workerübergreifend): nach einem MERGE
+        # bekannte Fahrzeuge, spart den nächsten MERGE
+        self._vehicle_exists_cache = QueryCache(
+            maxsize=_VEHICLE_EXISTS_MAXSIZE,
+            l2=RedisCache.from_env(ttl=_VEHICLE_EXISTS_TTL, prefix="fin:"),
+        )
     
     async def process_unified_data(self, unified_data: UnifiedProcessData) -> Dict[str, Any]:
         """Einheitliche Datenverarbeitung für alle Integrationen (Zapier, E-Mail, Webhook)"""
         try:
-            process_id = f"PROC_{uuid.uuid4().hex[:8]}"
-            warnings = []
-            
-            logger.info(f"Verarbeite {unified_data.datenquelle}-Daten: FIN={unified_data.fin}, Prozess={unified_data.prozess_typ}")
-            
-            # 1. Prozess-Typ normalisieren
-            normalized_prozess = self.flowers_handler.normalize_prozess_typ(unified_data.prozess_typ)
-            if normalized_prozess != unified_data.prozess_typ:
-                logger.info(f"Prozess normalisiert: '{unified_data.prozess_typ}' -> '{normalized_prozess}'")
-                warnings.append(f"Prozess-Typ angepasst: {unified_data.prozess_typ} -> {normalized_prozess}")
+            process_id = new_process_id()
+            # Ein Zeitstempel für Stammdaten, Prozess und Antwort dieses Durchlaufs
+            now_iso = datetime.now().isoformat()
             
-            # 2. Bearbeiter-Namen normalisieren
-            mapped_bearbeiter = self.resolve_bearbeiter(unified_data.bearbeiter)
-            if mapped_bearbeiter != unified_data.bearbeiter:
-                logger.info(f"Bearbeiter gemappt: '{unified_data.bearbeiter}' -> '{mapped_bearbeiter}'")
-                warnings.append(f"Bearbeiter angepasst: {unified_data.bearbeiter} -> {mapped_bearbeiter}")
+            logger.info(
+                "Verarbeite %s-Daten: FIN=%s, Prozess=%s",
+                unified_data.datenquelle, unified_data.fin, unified_data.prozess_typ
+            )
             
-            # 3. Fahrzeug-Stammdaten erstellen falls nötig
-            vehicle_created = False
-            if unified_data.marke and unified_data.modell:
-                vehicle_exists = await self._check_vehicle_exists(unified_data.fin)
-                
-                if not vehicle_exists:
-                    vehicle_data = self._build_vehicle_data(unified_data)
-                    vehicle_created = await self.bq_service.create_fahrzeug_stamm(vehicle_data)
-                    
-                    if vehicle_created:
-                        logger.info(f"✅ Fahrzeug automatisch erstellt: {unified_data.fin}")
-                    else:
-                        warnings.append(f"Fahrzeug-Stammdaten konnten nicht erstellt werden: {unified_data.fin}")
-                else:
-                    logger.info(f"Fahrzeug {unified_data.fin} bereits vorhanden")
+            # 1./2. Prozess-Typ und Bearbeiter normalisieren
+            normalized_prozess, mapped_bearbeiter, warnings = self._normalize_inputs(unified_data)
             
-            # 4. Prozess erstellen
+            # 3. Fahrzeug-Stammdaten (falls nötig) und Prozess parallel schreiben -
+            #    keine Abhängigkeit zwischen den Tabellen, die Roundtrips überlappen
             process_data = self._build_process_data(unified_data, process_id, normalized_prozess, mapped_bearbeiter)
-            process_saved = await self.bq_service.create_fahrzeug_prozess(process_data)
+            vehicle_created, process_saved = await asyncio.gather(
+                self._ensure_vehicle(unified_data, now_iso),
+                self.bq_service.create_fahrzeug_prozess(process_data, now_iso=now_iso)
+            )
             
             if not process_saved:
-                raise Exception("Prozess konnte nicht in BigQuery gespeichert werden")
+                raise RuntimeError("Prozess konnte nicht in BigQuery gespeichert werden")
+            if vehicle_created is None:
+                warnings += (f"Fahrzeug-Stammdaten konnten nicht erstellt werden: {unified_data.fin}",)
             
             return {
                 "success": True,
@@ -85,38 +136,92 @@ class ProcessService:
                 "prozess_typ": normalized_prozess,
                 "status": unified_data.status,
                 "bearbeiter": mapped_bearbeiter,
-                "vehicle_created": vehicle_created,
+                "vehicle_created": bool(vehicle_created),
                 "warnings": warnings,
                 "datenquelle": unified_data.datenquelle,
-                "verarbeitet_am": datetime.now().isoformat()
+                "verarbeitet_am": now_iso
             }
             
+        except (ValueError, RuntimeError) as e:
+            # Erwartete Fehler (ungültige Daten, Speicherung fehlgeschlagen) - ohne Traceback
+            logger.warning("Unified Data Processing fehlgeschlagen: %s", e)
+            return self._unified_error_result(unified_data, e)
         except Exception as e:
-            logger.error(f"Unified Data Processing fehlgeschlagen: {e}")
+            logger.error("Unified Data Processing unerwarteter Fehler: %s", e, exc_info=True)
+            return self._unified_error_result(unified_data, e)
+    
+    async def process_unified_batch(self, items: List[UnifiedProcessData]) -> Dict[str, Any]:
+        """Mehrere Integrations-Datensätze (z.B. gebündelte Zapier-Lieferung) mit einem Insert je Tabelle verarbeiten"""
+        try:
+            now_iso = datetime.now().isoformat()
+            process_rows = []
+            vehicle_candidates: Dict[str, Dict[str, Any]] = {}
+            
+            for unified_data in items:
+                normalized_prozess = self.flowers_handler.normalize_prozess_typ(unified_data.prozess_typ)
+                mapped_bearbeiter = self.resolve_bearbeiter(unified_data.bearbeiter)
+                process_id = new_process_id()
+                process_rows.append(
+                    self._build_process_data(unified_data, process_id, normalized_prozess, mapped_bearbeiter)
+                )
+                if unified_data.marke and unified_data.modell and unified_data.fin not in vehicle_candidates:
+                    vehicle_candidates[unified_data.fin] = self._build_vehicle_data(unified_data)
+            
+            # Fehlende Fahrzeuge in einem MERGE anlegen - kein Existenz-Check vorab, gleichzeitige
+            # Lieferungen für dieselbe FIN erzeugen keine doppelten Stammdaten
+            vehicles_created = 0
+            bekannt = await asyncio.gather(
+                *(self._vehicle_exists_cache.lookup(fin) for fin in vehicle_candidates)
+            )
+            new_vehicles = [
+                vehicle_data for vehicle_data, vorhanden in zip(vehicle_candidates.values(), bekannt)
+                if not vorhanden
+            ]
+            if new_vehicles:
+                created = await self.bq_service.create_fahrzeuge_stamm_if_missing(new_vehicles, now_iso=now_iso)
+                if created is not None:
+                    vehicles_created = created
+                    # Nach dem MERGE existieren alle Fahrzeuge
+                    await asyncio.gather(*(
+                        self._vehicle_exists_cache.store(vehicle_data["fin"], True, _VEHICLE_EXISTS_TTL)
+                        for vehicle_data in new_vehicles
+                    ))
+            
+            processes_saved = await self.bq_service.create_fahrzeug_prozesse_bulk(process_rows, now_iso=now_iso)
+            if not processes_saved:
+                raise RuntimeError("Prozesse konnten nicht in BigQuery gespeichert werden")
+            
             return {
-                "success": False,
-                "message": f"Verarbeitungsfehler: {str(e)}",
-                "fin": unified_data.fin,
-                "prozess_typ": unified_data.prozess_typ,
-                "status": unified_data.status,
-                "datenquelle": unified_data.datenquelle,
-                "error": str(e)
+                "success": True,
+                "message": f"{len(process_rows)} Prozesse erfolgreich verarbeitet",
+                "process_ids": [row["prozess_id"] for row in process_rows],
+                "vehicles_created": vehicles_created,
+                "verarbeitet_am": now_iso
             }
+            
+        except (ValueError, RuntimeError) as e:
+            logger.warning("Unified Batch Processing fehlgeschlagen: %s", e)
+            return self._batch_error_result(items, e)
+        except Exception as e:
+            logger.error("Unified Batch Processing unerwarteter Fehler: %s", e, exc_info=True)
+            return self._batch_error_result(items, e)
     
     async def create_process(self, process_data: Dict[str, Any]) -> Dict[str, Any]:
         """Neuen Prozess erstellen"""
         try:
             # Prozess-ID generieren falls nicht vorhanden
             if "prozess_id" not in process_data:
-                process_data["prozess_id"] = f"PROC_{uuid.uuid4().hex[:8]}"
+                process_data["prozess_id"] = new_process_id()
             
-            success = await self.bq_service.create_fahrzeug_prozess(process_data)
+            # Ein Zeitstempel für erstellt_am/aktualisiert_am und die Antwort
+            now_iso = datetime.now().isoformat()
+            success = await self.bq_service.create_fahrzeug_prozess(process_data, now_iso=now_iso)
             
             return {
                 "success": success,
                 "process_id": process_data["prozess_id"],
                 "message": "Prozess erfolgreich erstellt" if success else "Prozess-Erstellung fehlgeschlagen",
-                "created_at": datetime.now().isoformat()
+                "created_at": now_iso
             }
             
         except Exception as e:
@@ -137,6 +242,7 @@ class ProcessService:
         """Prozess-Status aktualisieren"""
         try:
             update_data = {"status": new_status}
+            now = datetime.now()
             
             if bearbeiter:
                 update_data["bearbeiter"] = self.resolve_bearbeiter(bearbeiter)
@@ -144,10 +250,9 @@ class ProcessService:
                 update_data["notizen"] = notizen
             
             # Zeitstempel für Status-Änderungen
-            if new_status.lower() == "abgeschlossen":
-                update_data["ende_timestamp"] = datetime.now()
-            elif new_status.lower() in ["in_bearbeitung", "gestartet"]:
-                update_data["start_timestamp"] = datetime.now()
+            zeitstempel_feld = _STATUS_ZEITSTEMPEL_FELD.get(new_status.lower())
+            if zeitstempel_feld is not None:
+                update_data[zeitstempel_feld] = now
             
             success = await self.bq_service.update_fahrzeug_prozess(prozess_id, update_data)
             
@@ -156,7 +261,7 @@ class ProcessService:
                 "process_id": prozess_id,
                 "new_status": new_status,
                 "message": "Status erfolgreich aktualisiert" if success else "Status-Update fehlgeschlagen",
-                "updated_at": datetime.now().isoformat()
+                "updated_at": now.isoformat()
             }
             
         except Exception as e:
@@ -171,28 +276,30 @@ class ProcessService:
     async def complete_process(self, prozess_id: str, completion_data: Dict[str, Any]) -> Dict[str, Any]:
         """Prozess abschließen mit Zeitberechnung"""
         try:
-            # Aktuellen Prozess abrufen für Zeitberechnung
-            prozesse = await self.bq_service.get_fahrzeug_prozesse(completion_data.get("fin", ""))
-            current_process = None
-            
-            for prozess in prozesse:
-                if prozess.get("prozess_id") == prozess_id:
-                    current_process = prozess
-                    break
+            # Aktuellen Prozess abrufen für Zeitberechnung (Punktabfrage per prozess_id)
+            current_process = await self.bq_service.get_fahrzeug_prozess(prozess_id)
             
+            # Abschlusszeitpunkt einmal bestimmen - gilt für ende_timestamp und Dauer
+            end_time = datetime.now()
             update_data = {
-                "status": "abgeschlossen",
-                "ende_timestamp": datetime.now()
+                "status": STATUS_COMPLETED,
+                "ende_timestamp": end_time
             }
             
             # Dauer berechnen falls Start-Timestamp vorhanden
             if current_process and current_process.get("start_timestamp"):
                 try:
-                    start_time = datetime.fromisoformat(current_process["start_timestamp"].replace('Z', '+00:00'))
-                    end_time = datetime.now()
-                    duration_minutes = int((end_time - start_time).total_seconds() / 60)
+                    # BigQuery liefert ISO-Strings mit Offset; fromisoformat (3.11) versteht auch "Z"
+                    start_time = current_process["start_timestamp"]
+                    if not isinstance(start_time, datetime):
+                        start_time = datetime.fromisoformat(start_time)
+                    # TIMESTAMP-Spalten sind zeitzonenbehaftet - Ende dann ebenfalls mit Offset vergleichen
+                    vergleich_ende = end_time if start_time.tzinfo is None else end_time.astimezone()
+                    # Ganze Minuten per timedelta-Ganzzahldivision (kein Umweg über float-Sekunden)
+                    duration_minutes = (vergleich_ende - start_time) // _EINE_MINUTE
                     update_data["dauer_minuten"] = duration_minutes
-                except Exception as duration_error:
+                except (TypeError, ValueError) as duration_error:
+                    # Unlesbarer/unerwarteter Start-Zeitstempel - Abschluss trotzdem ohne Dauer speichern
                     logger.warning(f"Dauer-Berechnung fehlgeschlagen: {duration_error}")
             
             # Completion-spezifische Daten hinzufügen
@@ -206,7 +313,7 @@ class ProcessService:
             return {
                 "success": success,
                 "process_id": prozess_id,
-                "completion_time": update_data["ende_timestamp"].isoformat(),
+                "completion_time": end_time.isoformat(),
                 "duration_minutes": update_data.get("dauer_minuten"),
                 "message": "Prozess erfolgreich abgeschlossen" if success else "Prozess-Abschluss fehlgeschlagen"
             }
@@ -224,53 +331,107 @@ class ProcessService:
     # UTILITY Methoden
     # ========================================
     
-    def resolve_bearbeiter(self, bearbeiter_input: Optional[str]) -> Optional[str]:
+    @staticmethod
+    def resolve_bearbeiter(bearbeiter_input: Optional[str]) -> Optional[str]:
         """Bearbeiter-Namen normalisieren mit Mapping"""
         if not bearbeiter_input:
             return None
         
-        # Direkte Zuordnung
-        if bearbeiter_input in BEARBEITER_MAPPING:
-            return BEARBEITER_MAPPING[bearbeiter_input]
+        # Bereits vollständiger Name (häufig bei API-Aufrufen) - keine Suche nötig
+        if bearbeiter_input in _BEARBEITER_NAMEN:
+            return bearbeiter_input
         
-        # Fuzzy-Matching für unvollständige Namen
+        # Direkte Zuordnung unabhängig von Groß-/Kleinschreibung (Kurzform oder voller Name)
         input_lower = bearbeiter_input.lower()
-        for flowers_key, full_name in BEARBEITER_MAPPING.items():
-            if input_lower in flowers_key.lower() or flowers_key.lower() in input_lower:
-                return full_name
+        full_name = BEARBEITER_INDEX.get(input_lower)
+        if full_name is not None:
+            return full_name
+        
+        # Einzelner Namensbestandteil über den Token-Index, sonst Fuzzy-Matching für unvollständige Namen
+        if input_lower in _BEARBEITER_TOKENS:
+            full_name = _BEARBEITER_TOKENS[input_lower]
+        else:
+            full_name = _bearbeiter_teilstring(input_lower)
         
         # Keine Zuordnung gefunden - Original zurückgeben
-        return bearbeiter_input
+        return full_name if full_name is not None else bearbeiter_input
     
-    async def _check_vehicle_exists(self, fin: str) -> bool:
-        """Prüft ob Fahrzeug in Stammdaten existiert"""
-        try:
-            stammdaten = await self.bq_service.get_fahrzeug_stamm(fin)
-            return stammdaten is not None
-        except Exception as e:
-            logger.error(f"Vehicle Existenz-Check fehlgeschlagen: {e}")
+    def _normalize_inputs(self, unified_data: UnifiedProcessData) -> Tuple[str, Optional[str], Tuple[str, ...]]:
+        """Prozess-Typ und Bearbeiter normalisieren - Ergebnis plus Hinweise zu Anpassungen"""
+        # Im Normalfall ändert sich nichts - dann gemeinsames leeres Tupel statt neuer Liste
+        warnings = _KEINE_WARNUNGEN
+        
+        normalized_prozess = self.flowers_handler.normalize_prozess_typ(unified_data.prozess_typ)
+        if normalized_prozess != unified_data.prozess_typ:
+            logger.info("Prozess normalisiert: '%s' -> '%s'", unified_data.prozess_typ, normalized_prozess)
+            warnings += (f"Prozess-Typ angepasst: {unified_data.prozess_typ} -> {normalized_prozess}",)
+        
+        mapped_bearbeiter = self.resolve_bearbeiter(unified_data.bearbeiter)
+        if mapped_bearbeiter != unified_data.bearbeiter:
+            logger.info("Bearbeiter gemappt: '%s' -> '%s'", unified_data.bearbeiter, mapped_bearbeiter)
+            warnings += (f"Bearbeiter angepasst: {unified_data.bearbeiter} -> {mapped_bearbeiter}",)
+        
+        return normalized_prozess, mapped_bearbeiter, warnings
+    
+    @staticmethod
+    def _unified_error_result(unified_data: UnifiedProcessData, error: Exception) -> Dict[str, Any]:
+        """Fehler-Antwort für process_unified_data"""
+        return {
+            "success": False,
+            "message": f"Verarbeitungsfehler: {str(error)}",
+            "fin": unified_data.fin,
+            "prozess_typ": unified_data.prozess_typ,
+            "status": unified_data.status,
+            "datenquelle": unified_data.datenquelle,
+            "error": str(error)
+        }
+    
+    @staticmethod
+    def _batch_error_result(items: List[UnifiedProcessData], error: Exception) -> Dict[str, Any]:
+        """Fehler-Antwort für process_unified_batch"""
+        return {
+            "success": False,
+            "message": f"Verarbeitungsfehler: {str(error)}",
+            "anzahl": len(items),
+            "error": str(error)
+        }
+    
+    async def _ensure_vehicle(self, unified_data: UnifiedProcessData, now_iso: str) -> Optional[bool]:
+        """Fahrzeug-Stammdaten anlegen falls nötig (ein MERGE statt Existenz-Check + Insert).
+        
+        True = neu angelegt, False = vorhanden/nicht nötig, None = Fehler
+        """
+        if not (unified_data.marke and unified_data.modell):
             return False
+        
+        if await self._vehicle_exists_cache.lookup(unified_data.fin):
+            logger.info("Fahrzeug %s bereits vorhanden", unified_data.fin)
+            return False
+        
+        vehicle_data = self._build_vehicle_data(unified_data)
+        merged = await self.bq_service.create_fahrzeug_stamm_if_missing(vehicle_data, now_iso=now_iso)
+        
+        if merged is None:
+            return None
+        
+        # Nach dem MERGE existiert das Fahrzeug in jedem Fall
+        await self._vehicle_exists_cache.store(unified_data.fin, True, _VEHICLE_EXISTS_TTL)
+        if merged:
+            logger.info("✅ Fahrzeug automatisch erstellt: %s", unified_data.fin)
+        else:
+            logger.info("Fahrzeug %s bereits vorhanden", unified_data.fin)
+        return merged
     
     def _build_vehicle_data(self, unified_data: UnifiedProcessData) -> Dict[str, Any]:
         """Fahrzeug-Stammdaten aus UnifiedProcessData erstellen"""
-        return {
-            "fin": unified_data.fin,
-            "marke": unified_data.marke or "Unbekannt",
-            "modell": unified_data.modell or "Unbekannt",
-            "antriebsart": unified_data.antriebsart or "Unbekannt",
-            "farbe": unified_data.farbe or "Unbekannt",
-            "baujahr": unified_data.baujahr,
-            "datum_erstzulassung": unified_data.datum_erstzulassung,
-            "kw_leistung": unified_data.kw_leistung,
-            "km_stand": unified_data.km_stand,
-            "anzahl_fahrzeugschluessel": unified_data.anzahl_fahrzeugschluessel,
-            "bereifungsart": unified_data.bereifungsart or "Unbekannt",
-            "anzahl_vorhalter": unified_data.anzahl_vorhalter,
-            "ek_netto": unified_data.ek_netto,
-            "besteuerungsart": unified_data.besteuerungsart or "Unbekannt",
-            "erstellt_aus_email": unified_data.datenquelle == "email",
-            "datenquelle_fahrzeug": unified_data.datenquelle
+        werte = vars(unified_data)
+        vehicle_data = {
+            feld: werte[feld] if default is None else (werte[feld] or default)
+            for feld, default in _VEHICLE_FIELDS
         }
+        vehicle_data["erstellt_aus_email"] = unified_data.datenquelle == "email"
+        vehicle_data["datenquelle_fahrzeug"] = unified_data.datenquelle
+        return vehicle_data
     
     def _build_process_data(
         self, 
@@ -280,29 +441,30 @@ class ProcessService:
         mapped_bearbeiter: Optional[str]
     ) -> Dict[str, Any]:
         """Prozess-Daten aus UnifiedProcessData erstellen"""
+        # Status und Datenquelle kommen je Request als neue Strings an, haben aber nur wenige Werte -
+        # interniert teilen sich gepufferte Zeilen (Batch/Micro-Batch) ein Objekt je Wert.
+        # Prozess-Typ und Bearbeiter stammen bereits aus den Alias-Tabellen.
         process_data = {
             "prozess_id": process_id,
             "fin": unified_data.fin,
             "prozess_typ": normalized_prozess,
-            "status": unified_data.status,
+            "status": sys.intern(unified_data.status),
             "bearbeiter": mapped_bearbeiter,
             "prioritaet": unified_data.prioritaet or 5,
-            "datenquelle": unified_data.datenquelle,
+            "datenquelle": sys.intern(unified_data.datenquelle),
             "notizen": unified_data.notizen
         }
         
         # Zeitstempel setzen basierend auf Status
         if unified_data.external_timestamp:
-            if unified_data.status.lower() == "abgeschlossen":
-                process_data["ende_timestamp"] = unified_data.external_timestamp
-            elif unified_data.status.lower() in ["in_bearbeitung", "gestartet"]:
-                process_data["start_timestamp"] = unified_data.external_timestamp
+            zeitstempel_feld = _STATUS_ZEITSTEMPEL_FELD.get(unified_data.status.lower())
+            if zeitstempel_feld is not None:
+                process_data[zeitstempel_feld] = unified_data.external_timestamp
         
-        # Zusatzdaten als Notizen anhängen
+        # Zusatzdaten in eigene Spalte (STRING mit JSON) statt an die Notizen angehängt
         if unified_data.zusatz_daten:
-            import json
-            zusatz_json = json.dumps(unified_data.zusatz_daten, default=str, ensure_ascii=False)
-            existing_notizen = process_data.get("notizen", "")
-            process_data["notizen"] = f"{existing_notizen} | Zusatzdaten: {zusatz_json}".strip(" |")
+            process_data["zusatz_daten"] = orjson.dumps(
+                unified_data.zusatz_daten, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
         
         return process_data
\ No newline at end of file
@@ -1,17 +1,28 @@
 # src/services/vehicle_service.py - Business Layer mit BigQueryService
 """Vehicle Service - Geschäftslogik für Fahrzeug-Management"""
 
+import asyncio
 import logging
+from bisect import bisect_left
 from typing import Dict, Any, Optional, List
-from src.services.bigquery_service import BigQueryService
+from src.core.utils import new_process_id
+from src.services.bigquery_service import BigQueryService, get_shared_bigquery_service
 
 logger = logging.getLogger(__name__)
 
+# SLA-Stufen nach verbleibenden (ganzen) Tagen: < 0 violated, 0-1 critical, 2-3 warning, sonst ok
+_SLA_STATUS_GRENZEN = (-1, 1, 3)
+_SLA_STATUS_LABELS = ("violated", "critical", "warning", "ok")
+
+# Prioritäts-Labels nach Obergrenze der Stufe (1-10, kleiner = dringender)
+_PRIORITAET_GRENZEN = (2, 4, 6, 8)
+_PRIORITAET_LABELS = ("Sehr Hoch", "Hoch", "Normal", "Niedrig", "Sehr Niedrig")
+
 class VehicleService:
     """Fahrzeug-Service mit Geschäftslogik - nutzt zentrale BigQueryService"""
     
     def __init__(self, bq_service: Optional[BigQueryService] = None):
-        self.bq_service = bq_service or BigQueryService()
+        self.bq_service = bq_service or get_shared_bigquery_service()
     
     async def get_vehicles(
         self, 
@@ -27,13 +38,12 @@ class VehicleService:
                 limit=limit
             )
             
-            # Geschäftslogik: Zusätzliche Verarbeitung
+            # Geschäftslogik: Zusätzliche Verarbeitung (reine Berechnung, kein I/O - Methoden einmal binden)
+            sla_status = self._calculate_sla_status
+            priority_label = self._get_priority_label
             for fahrzeug in fahrzeuge:
-                # SLA-Status berechnen
-                fahrzeug["sla_status"] = self._calculate_sla_status(fahrzeug.get("tage_bis_sla_deadline"))
-                
-                # Prioritäts-Label hinzufügen
-                fahrzeug["prioritaet_label"] = self._get_priority_label(fahrzeug.get("prioritaet"))
+                fahrzeug["sla_status"] = sla_status(fahrzeug.get("tage_bis_sla_deadline"))
+                fahrzeug["prioritaet_label"] = priority_label(fahrzeug.get("prioritaet"))
             
             return {
                 "fahrzeuge": fahrzeuge,
@@ -54,15 +64,15 @@ class VehicleService:
     async def get_vehicle_details(self, fin: str) -> Optional[Dict[str, Any]]:
         """Vollständige Fahrzeug-Details mit allen Prozessen"""
         try:
-            # Stammdaten abrufen
-            stammdaten = await self.bq_service.get_fahrzeug_stamm(fin)
+            # Stammdaten und alle Prozesse des Fahrzeugs parallel abrufen (unabhängige Abfragen)
+            stammdaten, prozesse = await asyncio.gather(
+                self.bq_service.get_fahrzeug_stamm(fin),
+                self.bq_service.get_fahrzeug_prozesse(fin)
+            )
             if not stammdaten:
                 logger.warning(f"Fahrzeug {fin} nicht in Stammdaten gefunden")
                 return None
             
-            # Alle Prozesse für das Fahrzeug abrufen
-            prozesse = await self.bq_service.get_fahrzeug_prozesse(fin)
-            
             # Geschäftslogik: Aktueller Prozess und Historie
             aktueller_prozess = None
             prozess_historie = []
@@ -110,8 +120,7 @@ class VehicleService:
             if prozess_data:
                 # Prozess-ID generieren falls nicht vorhanden
                 if "prozess_id" not in prozess_data:
-                    import uuid
-                    prozess_data["prozess_id"] = f"PROC_{uuid.uuid4().hex[:8]}"
+                    prozess_data["prozess_id"] = new_process_id()
                 
                 # FIN übernehmen
                 prozess_data["fin"] = stammdaten["fin"]
@@ -139,13 +148,12 @@ class VehicleService:
     async def update_vehicle_status(self, fin: str, new_status: str, bearbeiter: Optional[str] = None) -> bool:
         """Fahrzeug-Status aktualisieren (aktuellster Prozess)"""
         try:
-            # Aktuellsten Prozess für Fahrzeug finden
-            prozesse = await self.bq_service.get_fahrzeug_prozesse(fin)
-            if not prozesse:
+            # Nur den neuesten Prozess laden (LIMIT 1 in SQL statt kompletter Historie)
+            aktueller_prozess = await self.bq_service.get_aktueller_fahrzeug_prozess(fin)
+            if not aktueller_prozess:
                 logger.warning(f"Keine Prozesse für Fahrzeug {fin} gefunden")
                 return False
             
-            aktueller_prozess = prozesse[0]  # Neuester Prozess (ORDER BY updated_at DESC)
             prozess_id = aktueller_prozess.get("prozess_id")
             
             if not prozess_id:
@@ -178,27 +186,11 @@ class VehicleService:
         if tage_bis_deadline is None:
             return "unknown"
         
-        if tage_bis_deadline < 0:
-            return "violated"
-        elif tage_bis_deadline <= 1:
-            return "critical"
-        elif tage_bis_deadline <= 3:
-            return "warning"
-        else:
-            return "ok"
+        return _SLA_STATUS_LABELS[bisect_left(_SLA_STATUS_GRENZEN, tage_bis_deadline)]
     
     def _get_priority_label(self, prioritaet: Optional[int]) -> str:
         """Prioritäts-Label für UI"""
         if prioritaet is None:
             return "Normal"
         
-        if prioritaet <= 2:
-            return "Sehr Hoch"
-        elif prioritaet <= 4:
-            return "Hoch"
-        elif prioritaet <= 6:
-            return "Normal"
-        elif prioritaet <= 8:
-            return "Niedrig"
-        else:
-            return "Sehr Niedrig"
\ No newline at end of file
+        return _PRIORITAET_LABELS[bisect_left(_PRIORITAET_GRENZEN, prioritaet)]
\ No newline at end of file
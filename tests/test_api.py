@@ -12,3 +12,14 @@ def test_health():
 def test_root():
     response = client.get("/")
     assert response.status_code == 200
+
+def test_dashboard_health_ohne_service():
+    from src.core.dependencies import get_dashboard_service
+    app.dependency_overrides[get_dashboard_service] = lambda: None
+    try:
+        response = client.get("/dashboard/health")
+    finally:
+        app.dependency_overrides.pop(get_dashboard_service, None)
+    assert response.status_code == 200
+    assert response.json()["status"] == "unavailable"
+    assert response.json()["cache"] == "unavailable"
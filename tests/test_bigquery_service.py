@@ -0,0 +1,459 @@
+# tests/test_bigquery_service.py
+import asyncio
+import gc
+from datetime import date, datetime, timezone
+
+import pytest
+from src.services import bigquery_service
+from src.services.bigquery_service import BigQueryService, _InsertBuffer, _prepare_row
+
+
+class FakeInsertService:
+    """Zeichnet insert_rows-Aufrufe auf; optional blockiert bis release() oder mit Fehler"""
+
+    def __init__(self, result=True, error=None, blockieren=False):
+        self.result = result
+        self.error = error
+        self.calls = []
+        self._blockieren = blockieren
+        self._freigabe = asyncio.Event()
+
+    def release(self):
+        self._freigabe.set()
+
+    async def _insert_rows_results(self, table_name, rows):
+        self.calls.append((table_name, list(rows)))
+        if self._blockieren and len(self.calls) == 1:
+            await self._freigabe.wait()
+        if self.error:
+            raise self.error
+        return [self.result] * len(rows)
+
+
+class FakeJob:
+    def __init__(self, rows=(), affected=0, error=None):
+        self._rows = list(rows)
+        self._error = error
+        self.num_dml_affected_rows = affected
+
+    def result(self):
+        if self._error:
+            raise self._error
+        return iter(self._rows)
+
+
+class FakeQueryClient:
+    """client.query-Ersatz: MERGE-Statements mit fester Zeilenzahl oder Fehler, SELECTs mit festen Zeilen"""
+
+    def __init__(self, merge_affected=1, merge_error=None, rows=()):
+        self.merge_affected = merge_affected
+        self.merge_error = merge_error
+        self.rows = rows
+        self.queries = []
+
+    def query(self, query, job_config=None):
+        self.queries.append((query, job_config))
+        if query.lstrip().startswith("MERGE"):
+            return FakeJob(affected=self.merge_affected, error=self.merge_error)
+        return FakeJob(rows=self.rows)
+
+
+def _service_mit_client(client):
+    """BigQueryService mit Ersatz-Client; Streaming-Inserts landen in service.inserted"""
+    service = BigQueryService()
+    service.client = client
+    service.inserted = []
+
+    async def insert_rows(table_name, rows):
+        service.inserted.append((table_name, list(rows)))
+        return True
+
+    service._insert_rows = insert_rows
+    return service
+
+
+class TestInsertBuffer:
+
+    def setup_method(self):
+        self.service = FakeInsertService()
+        self.buffer = _InsertBuffer(self.service, "fahrzeug_prozesse")
+
+    def test_einzelzeile_ohne_verzoegerung(self, monkeypatch):
+        # Ohne laufenden Insert darf keine Wartezeit anfallen
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 30)
+
+        async def run():
+            return await asyncio.wait_for(self.buffer.add({"id": 1}), timeout=1)
+
+        assert asyncio.run(run()) is True
+        assert self.service.calls == [("fahrzeug_prozesse", [{"id": 1}])]
+
+    def test_flush_bei_batchgroesse(self, monkeypatch):
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 30)
+        monkeypatch.setattr(bigquery_service, "_INSERT_BATCH_SIZE", 3)
+        service = FakeInsertService(blockieren=True)
+        buffer = _InsertBuffer(service, "fahrzeug_prozesse")
+
+        async def run():
+            erster = asyncio.ensure_future(buffer.add({"id": 0}))
+            await asyncio.sleep(0)
+            # Insert läuft - drei weitere Zeilen erreichen die Batchgröße, kein Timer nötig
+            rest = await asyncio.wait_for(
+                asyncio.gather(*(buffer.add({"id": i}) for i in range(1, 4))), timeout=1
+            )
+            service.release()
+            return [await erster, *rest]
+
+        assert asyncio.run(run()) == [True] * 4
+        assert [len(rows) for _, rows in service.calls] == [1, 3]
+
+    def test_flush_nach_timer(self, monkeypatch):
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 0.01)
+        service = FakeInsertService(blockieren=True)
+        buffer = _InsertBuffer(service, "fahrzeuge_stamm")
+
+        async def run():
+            erster = asyncio.ensure_future(buffer.add({"id": 0}))
+            await asyncio.sleep(0)
+            rest = await asyncio.wait_for(
+                asyncio.gather(buffer.add({"id": 1}), buffer.add({"id": 2})), timeout=1
+            )
+            service.release()
+            return [await erster, *rest]
+
+        assert asyncio.run(run()) == [True] * 3
+        assert [rows for _, rows in service.calls] == [[{"id": 0}], [{"id": 1}, {"id": 2}]]
+
+    def test_abbruch_betrifft_alle_wartenden(self, monkeypatch):
+        # Ausnahme im Aufruf selbst (z.B. Netzwerk) - keine Zeile ist sicher geschrieben
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 0.01)
+        service = FakeInsertService(error=RuntimeError("Verbindung abgebrochen"))
+        buffer = _InsertBuffer(service, "fahrzeug_prozesse")
+
+        async def run():
+            return await asyncio.gather(*(buffer.add({"id": i}) for i in range(5)))
+
+        assert asyncio.run(run()) == [False] * 5
+        assert sum(len(rows) for _, rows in service.calls) == 5
+
+    def test_flush_task_wird_referenziert(self, monkeypatch):
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 30)
+        service = FakeInsertService(blockieren=True)
+        buffer = _InsertBuffer(service, "fahrzeug_prozesse")
+
+        async def run():
+            waiter = asyncio.ensure_future(buffer.add({"id": 0}))
+            await asyncio.sleep(0)
+            assert len(buffer._tasks) == 1
+            gc.collect()
+            service.release()
+            result = await asyncio.wait_for(waiter, timeout=1)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) is True
+        assert not buffer._tasks
+
+    def test_mehrere_event_loops(self):
+        # Gemeinsame Service-Instanz über mehrere asyncio.run hinweg
+        assert asyncio.run(self.buffer.add({"id": 1})) is True
+        assert asyncio.run(self.buffer.add({"id": 2})) is True
+        assert len(self.service.calls) == 2
+
+
+class TestPrepareRow:
+
+    def test_datumswerte_in_jeder_spalte(self):
+        zeile = _prepare_row({
+            "fin": "WBA12345678901234",
+            "datum_erstzulassung": date(2021, 3, 15),
+            "created_at": datetime(2024, 5, 1, 10, 30, 0, 123456),
+            # Spalte ohne festen Eintrag in einer Datumsliste
+            "letzte_inspektion": date(2024, 1, 31),
+            "notizen": None,
+            "km_stand": 45000,
+        })
+        assert zeile == {
+            "fin": "WBA12345678901234",
+            "datum_erstzulassung": "2021-03-15",
+            "created_at": "2024-05-01T10:30:00.123456",
+            "letzte_inspektion": "2024-01-31",
+            "km_stand": 45000,
+        }
+
+
+class TestArrowKonvertierung:
+
+    def setup_method(self):
+        # Nur die Konvertierungsmethoden - kein Client nötig
+        self.service = BigQueryService.__new__(BigQueryService)
+
+    def test_gleiche_strings_wie_zeilenpfad(self):
+        pa = pytest.importorskip("pyarrow")
+        zeilen = [
+            {"created_at": datetime(2024, 5, 1, 10, 30, 0, 123456, tzinfo=timezone.utc),
+             "start_timestamp": datetime(2024, 5, 1, 10, 30, 0, 500), "anlieferung_datum": date(2024, 5, 1)},
+            {"created_at": datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc),
+             "start_timestamp": datetime(2024, 5, 1, 10, 30), "anlieferung_datum": date(2024, 5, 2)},
+            {"created_at": None, "start_timestamp": datetime(2024, 5, 1, 0, 0, 0, 100000), "anlieferung_datum": None},
+        ]
+        tabelle = pa.Table.from_pylist(zeilen, schema=pa.schema([
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("start_timestamp", pa.timestamp("us")),
+            ("anlieferung_datum", pa.date32()),
+        ]))
+
+        arrow = self.service._arrow_table_to_dicts(tabelle)
+        assert arrow == [self.service._convert_row_to_dict(zeile) for zeile in zeilen]
+        assert arrow[0]["created_at"] == "2024-05-01T10:30:00.123456+00:00"
+        assert arrow[1]["start_timestamp"] == "2024-05-01T10:30:00"
+
+
+class TestCreateFahrzeugStammIfMissing:
+
+    FAHRZEUG = {"fin": "WBA12345678901234", "marke": "BMW", "modell": "320d"}
+
+    def test_mock_modus_meldet_angelegt(self):
+        service = BigQueryService()
+        service.client = None
+        assert asyncio.run(service.create_fahrzeug_stamm_if_missing(self.FAHRZEUG)) is True
+
+    def test_merge_legt_an(self):
+        service = _service_mit_client(FakeQueryClient(merge_affected=1))
+        assert asyncio.run(service.create_fahrzeug_stamm_if_missing(self.FAHRZEUG)) is True
+        assert len(service.client.queries) == 1
+        assert service.inserted == []
+
+    def test_merge_findet_vorhandenes_fahrzeug(self):
+        service = _service_mit_client(FakeQueryClient(merge_affected=0))
+        assert asyncio.run(service.create_fahrzeug_stamm_if_missing(self.FAHRZEUG)) is False
+
+    def test_dml_limit_fallback_streaming_insert(self):
+        fehler = RuntimeError("Too many DML statements outstanding against table fahrzeuge_stamm")
+        service = _service_mit_client(FakeQueryClient(merge_error=fehler))
+
+        ergebnis = asyncio.run(service.create_fahrzeug_stamm_if_missing(self.FAHRZEUG, now_iso="2024-05-01T10:00:00"))
+
+        assert ergebnis is True
+        assert service.inserted == [("fahrzeuge_stamm", [{
+            "fin": "WBA12345678901234", "marke": "BMW", "modell": "320d",
+            "ersterfassung_datum": "2024-05-01T10:00:00", "aktiv": True,
+            "erstellt_aus_email": False, "datenquelle_fahrzeug": "api",
+        }])]
+
+    def test_dml_limit_fallback_fahrzeug_vorhanden(self):
+        client = FakeQueryClient(merge_error=RuntimeError("quota"), rows=[{"fin": "WBA12345678901234"}])
+        service = _service_mit_client(client)
+        assert asyncio.run(service.create_fahrzeug_stamm_if_missing(self.FAHRZEUG)) is False
+        assert service.inserted == []
+
+    def test_bulk_merge_eine_quellzeile_je_fin(self):
+        service = _service_mit_client(FakeQueryClient(merge_affected=2))
+        fahrzeuge = [
+            self.FAHRZEUG,
+            {"fin": "WBA12345678901234", "marke": "Audi", "modell": "A4"},
+            {"fin": "WBA00000000000002", "marke": "VW", "modell": "Golf", "erstellt_aus_email": True},
+        ]
+
+        assert asyncio.run(service.create_fahrzeuge_stamm_if_missing(fahrzeuge)) == 2
+
+        (query, job_config), = service.client.queries
+        assert "UNNEST(@vehicles)" in query and "WHEN MATCHED" not in query
+        structs = {param.name: param for param in job_config.query_parameters}["vehicles"].values
+        zeilen = [struct.struct_values for struct in structs]
+        assert [zeile["fin"] for zeile in zeilen] == ["WBA12345678901234", "WBA00000000000002"]
+        assert zeilen[0]["marke"] == "BMW"
+        assert zeilen[1]["erstellt_aus_email"] is True
+
+
+class TestGetFahrzeugProzess:
+
+    def test_treffer_im_zeitfenster(self):
+        service = _service_mit_client(FakeQueryClient(rows=[{"prozess_id": "PROC_1", "status": "gestartet"}]))
+        assert asyncio.run(service.get_fahrzeug_prozess("PROC_1")) == {"prozess_id": "PROC_1", "status": "gestartet"}
+        assert len(service.client.queries) == 1
+        assert "@cutoff" in service.client.queries[0][0]
+
+    def test_aelterer_prozess_ueber_alle_partitionen(self):
+        class AlterProzessClient(FakeQueryClient):
+            # Prozess liegt vor dem cutoff - nur die Abfrage ohne Zeitgrenze findet ihn
+            def query(self, query, job_config=None):
+                self.queries.append((query, job_config))
+                return FakeJob(rows=[] if "@cutoff" in query else [{"prozess_id": "PROC_ALT"}])
+
+        service = _service_mit_client(AlterProzessClient())
+        assert asyncio.run(service.get_fahrzeug_prozess("PROC_ALT")) == {"prozess_id": "PROC_ALT"}
+        assert ["@cutoff" in query for query, _ in service.client.queries] == [True, False]
+
+    def test_ohne_zeitgrenze(self):
+        service = _service_mit_client(FakeQueryClient(rows=[]))
+        assert asyncio.run(service.get_fahrzeug_prozess("PROC_X", since_days=None)) is None
+        assert ["@cutoff" in query for query, _ in service.client.queries] == [False]
+
+
+class TestStreamQuery:
+
+    def test_seitenabrufe_ueber_abfrage_slots(self, monkeypatch):
+        class Ergebnis:
+            total_rows = 3
+            pages = [[{"fin": "A"}, {"fin": "B"}], [{"fin": "C"}]]
+
+        class Job:
+            def result(self, page_size=None):
+                return Ergebnis()
+
+        class Client:
+            def query(self, query, job_config=None):
+                return Job()
+
+        service = BigQueryService()
+        service.client = Client()
+        service._storage_client = None
+        monkeypatch.setattr(bigquery_service, "_MAX_PARALLEL_QUERIES", 1)
+        belegt = []
+        original = service._in_thread
+
+        async def in_thread(func, *args, **kwargs):
+            belegt.append(func.__name__)
+            return await original(func, *args, **kwargs)
+
+        service._in_thread = in_thread
+
+        async def run():
+            zeilen = []
+            async for zeile in service.stream_query("SELECT fin FROM t"):
+                # Slot ist zwischen den Seitenabrufen frei - parallele Abfrage blockiert nicht
+                slots = service._query_semaphore()
+                await asyncio.wait_for(slots.acquire(), timeout=1)
+                slots.release()
+                zeilen.append(zeile["fin"])
+            return zeilen
+
+        assert asyncio.run(run()) == ["A", "B", "C"]
+        assert belegt == ["query", "result", "_next_chunk", "_next_chunk", "_next_chunk"]
+
+    def test_abfrage_slots_in_mehreren_event_loops(self, monkeypatch):
+        # Gemeinsame Service-Instanz in mehreren asyncio.run - unter Last wartende Slots
+        # dürfen nicht an eine beendete Event-Loop gebunden bleiben
+        monkeypatch.setattr(bigquery_service, "_MAX_PARALLEL_QUERIES", 1)
+        service = BigQueryService()
+
+        def abfrage(nr):
+            return nr
+
+        async def run():
+            return await asyncio.gather(*(service._in_thread(abfrage, nr) for nr in range(4)))
+
+        for _ in range(3):
+            assert asyncio.run(run()) == [0, 1, 2, 3]
+
+
+class TestUpdateFahrzeugeStammBulk:
+
+    def test_sql_und_parameter(self):
+        service = _service_mit_client(FakeQueryClient())
+        updates = [
+            ("WBA00000000000001", {"km_stand": 45000, "farbe": "Blau"}),
+            ("WBA00000000000002", {"marke": "Audi", "unbekannt": "x"}),
+        ]
+
+        assert asyncio.run(service.update_fahrzeuge_stamm_bulk(updates)) is True
+
+        (query, job_config), = service.client.queries
+        assert "UNNEST(@updates)" in query
+        assert "km_stand = COALESCE(u.km_stand, t.km_stand)" in query
+        param, = job_config.query_parameters
+        assert param.name == "updates" and param.array_type == "STRUCT"
+        zeilen = [struct.struct_values for struct in param.values]
+        assert [zeile["fin"] for zeile in zeilen] == ["WBA00000000000001", "WBA00000000000002"]
+        # Jede Zeile trägt alle Stammdaten-Felder, nicht gesetzte als NULL (= unverändert)
+        assert zeilen[0]["km_stand"] == 45000 and zeilen[0]["farbe"] == "Blau" and zeilen[0]["marke"] is None
+        assert zeilen[1]["marke"] == "Audi" and "unbekannt" not in zeilen[1]
+        assert {typ for struct in param.values for typ in struct.struct_types.values()} >= {"STRING", "INT64"}
+
+    def test_doppelte_fin_zusammengefuehrt(self):
+        service = _service_mit_client(FakeQueryClient())
+        updates = [
+            ("WBA00000000000001", {"km_stand": 45000, "farbe": "Blau"}),
+            ("WBA00000000000001", {"km_stand": 46000, "farbe": None}),
+        ]
+
+        assert asyncio.run(service.update_fahrzeuge_stamm_bulk(updates)) is True
+
+        (_, job_config), = service.client.queries
+        zeile, = [struct.struct_values for struct in job_config.query_parameters[0].values]
+        # Spätere Werte gewinnen, None überschreibt nichts
+        assert zeile["km_stand"] == 46000
+        assert zeile["farbe"] == "Blau"
+
+    def test_ohne_gueltige_felder_kein_job(self):
+        service = _service_mit_client(FakeQueryClient())
+        assert asyncio.run(service.update_fahrzeuge_stamm_bulk([("WBA00000000000001", {"farbe": None})])) is False
+        assert service.client.queries == []
+
+
+class FakeInsertAllClient:
+    """insert_rows_json wie insertAll ohne skipInvalidRows: eine ungültige Zeile stoppt den Aufruf"""
+
+    def __init__(self):
+        self.calls = []
+
+    def insert_rows_json(self, table, rows):
+        self.calls.append([row["id"] for row in rows])
+        ungueltig = {index for index, row in enumerate(rows) if "unbekannt" in row}
+        if not ungueltig:
+            return []
+        return [
+            {"index": index, "errors": [{"reason": "invalid" if index in ungueltig else "stopped"}]}
+            for index in range(len(rows))
+        ]
+
+
+class TestInsertRowsResults:
+
+    def setup_method(self):
+        self.service = BigQueryService()
+        self.service.client = FakeInsertAllClient()
+        self.service._get_table = lambda name: name
+
+    def test_gestoppte_zeilen_erneut_gesendet(self):
+        rows = [{"id": 0}, {"id": 1, "unbekannt": "x"}, {"id": 2}]
+
+        ergebnis = asyncio.run(self.service._insert_rows_results("fahrzeug_prozesse", rows))
+
+        assert ergebnis == [True, False, True]
+        assert self.service.client.calls == [[0, 1, 2], [0, 2]]
+
+    def test_ungueltige_zeile_trifft_nur_eigenen_aufrufer(self, monkeypatch):
+        monkeypatch.setattr(bigquery_service, "_INSERT_FLUSH_DELAY", 0.01)
+        buffer = _InsertBuffer(self.service, "fahrzeug_prozesse")
+
+        async def run():
+            return await asyncio.gather(
+                buffer.add({"id": 0}), buffer.add({"id": 1, "unbekannt": "x"}), buffer.add({"id": 2})
+            )
+
+        assert asyncio.run(run()) == [True, False, True]
+
+
+class TestClientInit:
+
+    def test_gemeinsame_credentials_fuer_storage_client(self, monkeypatch):
+        credentials = object()
+        erstellt = {}
+
+        def client(project, credentials):
+            erstellt["bigquery"] = credentials
+            return object()
+
+        def read_client(credentials):
+            erstellt["storage"] = credentials
+            return object()
+
+        monkeypatch.setattr(bigquery_service.google.auth, "default", lambda: (credentials, "projekt"))
+        monkeypatch.setattr(bigquery_service.bigquery, "Client", client)
+        monkeypatch.setattr(bigquery_service.bigquery_storage, "BigQueryReadClient", read_client)
+
+        service = BigQueryService()
+        assert service._storage_client is not None
+        assert erstellt == {"bigquery": credentials, "storage": credentials}
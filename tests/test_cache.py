@@ -0,0 +1,241 @@
+# tests/test_cache.py
+import asyncio
+from datetime import datetime
+
+from src.core import cache as cache_module
+from src.core.cache import QueryCache, RedisCache, cached_query
+
+
+class Uhr:
+    """Steuerbare Ersatzuhr für time.monotonic"""
+
+    def __init__(self):
+        self.jetzt = 1000.0
+
+    def __call__(self):
+        return self.jetzt
+
+
+class FakeRedis:
+    """Minimaler async Redis-Client (get/set/delete) für die L2-Stufe"""
+
+    def __init__(self, lock_belegt=False):
+        self.daten = {}
+        self.lock_belegt = lock_belegt
+        self.lock_versuche = 0
+
+    async def get(self, key):
+        return self.daten.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if key.endswith(":lock"):
+            self.lock_versuche += 1
+            return not self.lock_belegt
+        self.daten[key] = value
+        return True
+
+    async def delete(self, key):
+        self.daten.pop(key, None)
+
+
+class TestQueryCache:
+
+    def setup_method(self):
+        self.cache = QueryCache(maxsize=2)
+        self.aufrufe = 0
+
+    async def lade(self):
+        self.aufrufe += 1
+        return {"wert": self.aufrufe, "liste": [1, 2]}
+
+    def test_treffer_ohne_neues_laden(self):
+        async def run():
+            erster = await self.cache.get_or_load("k", self.lade, ttl=30)
+            zweiter = await self.cache.get_or_load("k", self.lade, ttl=30)
+            return erster, zweiter
+
+        erster, zweiter = asyncio.run(run())
+        assert erster == zweiter == {"wert": 1, "liste": [1, 2]}
+        assert self.aufrufe == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_ttl_ablauf(self, monkeypatch):
+        uhr = Uhr()
+        monkeypatch.setattr(cache_module.time, "monotonic", uhr)
+
+        async def run():
+            await self.cache.get_or_load("k", self.lade, ttl=30)
+            uhr.jetzt += 29.9
+            noch_gueltig = await self.cache.get_or_load("k", self.lade, ttl=30)
+            uhr.jetzt += 0.2
+            abgelaufen = await self.cache.get_or_load("k", self.lade, ttl=30)
+            return noch_gueltig, abgelaufen
+
+        noch_gueltig, abgelaufen = asyncio.run(run())
+        assert noch_gueltig["wert"] == 1
+        assert abgelaufen["wert"] == 2
+        assert self.cache.peek("k")["wert"] == 2
+
+    def test_lru_verdraengung(self):
+        async def run():
+            await self.cache.get_or_load("a", self.lade, ttl=30)
+            await self.cache.get_or_load("b", self.lade, ttl=30)
+            # "a" erneut nutzen - danach ist "b" der älteste Eintrag
+            await self.cache.get_or_load("a", self.lade, ttl=30)
+            await self.cache.get_or_load("c", self.lade, ttl=30)
+
+        asyncio.run(run())
+        assert self.cache.peek("a") is not None
+        assert self.cache.peek("b") is None
+        assert self.cache.peek("c") is not None
+        assert self.cache.stats()["eintraege"] == 2
+
+    def test_gleichzeitige_anfragen_teilen_ladevorgang(self):
+        async def langsam():
+            self.aufrufe += 1
+            await asyncio.sleep(0.01)
+            return {"wert": self.aufrufe}
+
+        async def run():
+            return await asyncio.gather(*(self.cache.get_or_load("k", langsam, ttl=30) for _ in range(5)))
+
+        ergebnisse = asyncio.run(run())
+        assert self.aufrufe == 1
+        assert all(ergebnis == {"wert": 1} for ergebnis in ergebnisse)
+        # Jeder Wartende bekommt ein eigenes Objekt
+        assert len({id(ergebnis) for ergebnis in ergebnisse}) == 5
+
+    def test_cacheable_filter(self):
+        async def fehler():
+            self.aufrufe += 1
+            return {"status": "error"}
+
+        ist_ok = lambda result: result.get("status") != "error"
+
+        async def run():
+            await self.cache.get_or_load("k", fehler, ttl=30, cacheable=ist_ok)
+            await self.cache.get_or_load("k", fehler, ttl=30, cacheable=ist_ok)
+
+        asyncio.run(run())
+        assert self.aufrufe == 2
+        assert self.cache.peek("k") is None
+
+    def test_aenderungen_am_ergebnis_erreichen_cache_nicht(self):
+        async def run():
+            erster = await self.cache.get_or_load("k", self.lade, ttl=30)
+            erster["wert"] = "verändert"
+            erster["liste"].append(3)
+            treffer = await self.cache.get_or_load("k", self.lade, ttl=30)
+            treffer["liste"].clear()
+            return await self.cache.get_or_load("k", self.lade, ttl=30)
+
+        assert asyncio.run(run()) == {"wert": 1, "liste": [1, 2]}
+        gepeekt = self.cache.peek("k")
+        gepeekt["liste"].append(4)
+        assert self.cache.peek("k") == {"wert": 1, "liste": [1, 2]}
+
+    def test_set_speichert_kopie(self):
+        wert = {"fahrzeuge": ["WBA12345678901234"]}
+        self.cache.set("k", wert, ttl=30)
+        wert["fahrzeuge"].append("neu")
+        assert self.cache.peek("k") == {"fahrzeuge": ["WBA12345678901234"]}
+
+
+class TestCachedQuery:
+
+    def test_schluessel_je_argumente(self):
+        class Service:
+            def __init__(self):
+                self._cache = QueryCache()
+                self.aufrufe = 0
+
+            @cached_query(ttl=30)
+            async def abfrage(self, limit: int = 10):
+                self.aufrufe += 1
+                return {"limit": limit}
+
+        service = Service()
+
+        async def run():
+            await service.abfrage(5)
+            await service.abfrage(5)
+            await service.abfrage(limit=7)
+            return await service.abfrage(limit=7)
+
+        assert asyncio.run(run()) == {"limit": 7}
+        assert service.aufrufe == 2
+
+
+class TestRedisCache:
+
+    def setup_method(self):
+        self.client = FakeRedis()
+        self.l2 = RedisCache(self.client, ttl=30, prefix="test:")
+
+    def test_json_native_werte_unveraendert(self):
+        wert = {"kpis": {"aktive_fahrzeuge": 3, "avg_standzeit": 1.5}, "timestamp": "2024-05-01T10:00:00"}
+
+        async def run():
+            await self.l2.set("k", wert)
+            return await self.l2.get("k")
+
+        assert asyncio.run(run()) == wert
+
+    def test_nicht_native_werte_bleiben_in_stufe_1(self):
+        # datetime würde als String zurückkommen, Tupel als Liste - beides nicht nach Redis
+        async def run():
+            await self.l2.set("datum", {"timestamp": datetime(2024, 5, 1, 10, 0)})
+            await self.l2.set("tupel", {"warnungen": ("a", "b")})
+            return await self.l2.get("datum"), await self.l2.get("tupel")
+
+        assert asyncio.run(run()) == (None, None)
+        assert self.client.daten == {}
+
+    def test_l2_treffer_gleich_l1_treffer(self):
+        async def lade():
+            return {"status": "success", "timestamp": "2024-05-01T10:00:00"}
+
+        async def run():
+            worker_a = QueryCache(l2=self.l2)
+            worker_b = QueryCache(l2=self.l2)
+            l1 = await worker_a.get_or_load("k", lade, ttl=30)
+            l2 = await worker_b.get_or_load("k", lade, ttl=30)
+            return l1, l2, worker_b.l2_hits
+
+        l1, l2, l2_hits = asyncio.run(run())
+        assert l1 == l2
+        assert l2_hits == 1
+
+    def test_bekannte_fin_workeruebergreifend(self):
+        # Existenz-Cache: Worker A legt nach dem MERGE ab, Worker B findet die FIN ohne Loader
+        client = FakeRedis(lock_belegt=True)
+        worker_a = QueryCache(l2=RedisCache(client, ttl=30, prefix="fin:"))
+        worker_b = QueryCache(l2=RedisCache(client, ttl=30, prefix="fin:"))
+
+        async def run():
+            vorher = await worker_b.lookup("WBA12345678901234")
+            await worker_a.store("WBA12345678901234", True, ttl=30)
+            return vorher, await worker_b.lookup("WBA12345678901234")
+
+        assert asyncio.run(run()) == (None, True)
+        assert worker_b.l2_hits == 1
+        # Treffer landet in Stufe 1, ohne Ladesperre
+        assert worker_b.peek("WBA12345678901234") is True
+        assert client.lock_versuche == 0
+
+    def test_lookup_ohne_l2(self):
+        cache = QueryCache()
+
+        async def run():
+            await cache.store("WBA12345678901234", True, ttl=30)
+            return await cache.lookup("WBA12345678901234"), await cache.lookup("WBA00000000000000")
+
+        assert asyncio.run(run()) == (True, None)
+
+    def test_gemeinsamer_client_je_url(self, monkeypatch):
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        cache_module._redis_client.cache_clear()
+        dashboard = RedisCache.from_env()
+        fahrzeuge = RedisCache.from_env(ttl=60, prefix="fin:")
+        assert dashboard.client is fahrzeuge.client
+        assert (dashboard.prefix, fahrzeuge.prefix) == ("dash:", "fin:")
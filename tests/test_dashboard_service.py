@@ -0,0 +1,107 @@
+# tests/test_dashboard_service.py
+import asyncio
+
+import orjson
+import pytest
+
+from src.services.bigquery_service import BigQueryService
+from src.services.dashboard_service import DashboardService
+
+
+def _json_nativ(wert):
+    return orjson.loads(orjson.dumps(wert)) == wert
+
+
+class TestZeitstempel:
+
+    def setup_method(self):
+        # Ohne Client liefert der BigQueryService Mock-Daten
+        bq_service = BigQueryService()
+        bq_service.client = None
+        self.service = DashboardService(bq_service=bq_service)
+
+    def test_bigquery_mock_liefert_iso_strings(self):
+        async def run():
+            return await asyncio.gather(
+                self.service.bq_service.get_dashboard_kpis(),
+                self.service.bq_service.get_warteschlangen_status()
+            )
+
+        for ergebnis in asyncio.run(run()):
+            assert isinstance(ergebnis["timestamp"], str)
+            assert _json_nativ(ergebnis)
+
+    def test_dashboard_antworten_json_nativ(self):
+        async def run():
+            return await asyncio.gather(self.service.get_kpis(), self.service.get_warteschlangen())
+
+        kpis, warteschlangen = asyncio.run(run())
+        assert isinstance(kpis["timestamp"], str)
+        assert _json_nativ(kpis)
+        assert _json_nativ(warteschlangen)
+
+
+class TestBewertungsstufen:
+    """Grenzwerte der bisect-Tabellen: jeweils unter, auf und über der Stufengrenze"""
+
+    def setup_method(self):
+        self.service = DashboardService(bq_service=object())
+
+    @pytest.mark.parametrize("sla_verletzungen, erwartet", [
+        (0, "grün"), (1, "gelb"), (3, "gelb"), (4, "rot"), (100, "rot"),
+    ])
+    def test_sla_ampel(self, sla_verletzungen, erwartet):
+        assert self.service._calculate_sla_ampel(sla_verletzungen) == erwartet
+
+    @pytest.mark.parametrize("aktive_fahrzeuge, erwartet", [
+        (0, "niedrig"), (19, "niedrig"), (20, "normal"),
+        (49, "normal"), (50, "normal"), (51, "hoch"),
+        (79, "hoch"), (80, "hoch"), (81, "überlastet"),
+    ])
+    def test_auslastung(self, aktive_fahrzeuge, erwartet):
+        assert self.service._calculate_auslastung(aktive_fahrzeuge) == erwartet
+
+    @pytest.mark.parametrize("wartend, in_bearbeitung, erwartet", [
+        (0, 0, "entspannt"), (5, 4, "entspannt"), (5, 5, "normal"),
+        (24, 0, "normal"), (20, 5, "normal"), (20, 6, "ausgelastet"),
+        (49, 0, "ausgelastet"), (25, 25, "ausgelastet"), (26, 25, "überlastet"),
+    ])
+    def test_kapazitaet(self, wartend, in_bearbeitung, erwartet):
+        assert self.service._calculate_capacity_status(wartend, in_bearbeitung) == erwartet
+
+
+class TestCacheFilter:
+
+    def setup_method(self):
+        # Ohne Client liefert der BigQueryService Mock-Daten - dieselben wie bei fehlgeschlagener Abfrage
+        self.bq_service = BigQueryService()
+        self.bq_service.client = None
+        self.service = DashboardService(bq_service=self.bq_service)
+
+    def test_mock_daten_werden_nicht_gecacht(self):
+        async def run():
+            for _ in range(2):
+                await self.service.get_kpis()
+                await self.service.get_warteschlangen()
+                await self.service.get_sla_overview()
+
+        asyncio.run(run())
+        stats = self.service.get_cache_stats()
+        assert stats["eintraege"] == 0
+        assert stats["hits"] == 0
+
+    def test_echte_daten_werden_gecacht(self):
+        aufrufe = []
+
+        async def kpis():
+            aufrufe.append(1)
+            return {"aktive_fahrzeuge": 10, "sla_verletzungen": 0, "status": "live_data"}
+
+        self.bq_service.get_dashboard_kpis = kpis
+
+        async def run():
+            await self.service.get_kpis()
+            return await self.service.get_kpis()
+
+        assert asyncio.run(run())["kpis"]["aktive_fahrzeuge"] == 10
+        assert len(aufrufe) == 1
@@ -1,6 +1,21 @@
 # tests/test_flowers_handler.py
+import asyncio
+import re
+
 import pytest
-from src.handlers.flowers_handler import FlowersHandler
+from src.handlers import flowers_handler
+from src.handlers.flowers_handler import EMAIL_PATTERNS, FlowersHandler
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Beide Regex-Engines müssen dieselben Treffer liefern (RE2 nur, falls installiert)
+ENGINES = [
+    pytest.param(re, id="re"),
+    pytest.param(re2, id="re2", marks=pytest.mark.skipif(re2 is None, reason="google-re2 nicht installiert")),
+]
 
 class TestFlowersHandler:
     
@@ -13,6 +28,8 @@ class TestFlowersHandler:
             ("GWA", "Aufbereitung"),
             ("garage", "Werkstatt"),
             ("fotoshooting", "Foto"),
+            ("(0) Start Fahrzeugaufbereitung", "Aufbereitung"),
+            ("Aufbereitung", "Aufbereitung"),
             ("unbekannt", "unbekannt")  # Fallback
         ]
         
@@ -24,9 +41,77 @@ class TestFlowersHandler:
         test_texts = [
             ("FIN: WBA12345678901234", "WBA12345678901234"),
             ("Fahrzeug WBA12345678901234 bereit", "WBA12345678901234"),
+            ("Fahrzeug wba12345678901234 bereit", "WBA12345678901234"),
             ("Kein FIN hier", None)
         ]
         
         for text, expected in test_texts:
             result = self.handler.extract_fin_from_text(text)
-            assert result == expected
\ No newline at end of file
+            assert result == expected
+    
+    def test_fin_validierung(self):
+        assert self.handler.is_valid_fin("WBA12345678901234")
+        assert not self.handler.is_valid_fin("WBA1234567890123")   # zu kurz
+        assert not self.handler.is_valid_fin("WBA-2345678901234")  # Sonderzeichen
+        assert not self.handler.is_valid_fin("WBÄ12345678901234")  # kein ASCII
+    
+    def test_fin_normalisierung(self):
+        assert self.handler.normalize_fin("wba 12345-678901234") == "WBA12345678901234"
+        assert self.handler.normalize_fin("WBA12345678901234") == "WBA12345678901234"
+
+
+class TestEmailParsingEngines:
+
+    MAIL = {
+        "subject": "Qualitätsprüfung gestartet FIN: WBA12345678901234",
+        "body": (
+            "Fahrzeug WBA12345678901234 - Aufbereitung gestartet von Jürgen Hoffmann\n"
+            "Fahrzeug WBÄ1234567890123 - Aufbereitung abgeschlossen von Hans Müller\n"
+            "Fahrzeug WBA12345678901234 wartet auf Übergabe - Priorität 3\n"
+        ),
+    }
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_umlaute(self, engine):
+        handler = FlowersHandler()
+        handler._compiled_patterns = tuple(
+            (name, engine.compile('(?im)' + pattern)) for name, pattern in EMAIL_PATTERNS.items()
+        )
+        actions = asyncio.run(handler.parse_flowers_email(self.MAIL))
+
+        gestartet = [a["data"] for a in actions if a["action"] == "start_process"]
+        assert {"fin": "WBA12345678901234", "prozess_typ": "Aufbereitung", "bearbeiter": "Jürgen Hoffmann",
+                "status": "gestartet", "datenquelle": "flowers_email"} in gestartet
+        # Umlaut-Prozess wird vollständig erfasst, nicht erst ab dem letzten ASCII-Zeichen
+        assert "Qualitätsprüfung" in {a["prozess_typ"] for a in gestartet}
+        # Keine FIN mit Umlaut, unbekannter Prozess "Übergabe" wird verworfen
+        assert all(a["action"] != "complete_process" for a in actions)
+        assert all(a["action"] != "queue_process" for a in actions)
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_geschuetzte_leerzeichen(self, engine):
+        # HTML-zu-Text-Konvertierung liefert oft \xa0 statt normaler Leerzeichen
+        handler = FlowersHandler()
+        handler._compiled_patterns = tuple(
+            (name, engine.compile('(?im)' + pattern)) for name, pattern in EMAIL_PATTERNS.items()
+        )
+        mail = {
+            "subject": "Flowers Update",
+            "body": "Fahrzeug\xa0WBA12345678901234 - Aufbereitung gestartet von Hans\n"
+                    "Fahrzeug WBA12345678901234\xa0wartet auf Foto -\xa0Priorität\xa03\n",
+        }
+        actions = asyncio.run(handler.parse_flowers_email(mail))
+
+        assert [(a["action"], a["data"]["fin"]) for a in actions] == [
+            ("start_process", "WBA12345678901234"),
+            ("queue_process", "WBA12345678901234"),
+        ]
+        assert actions[1]["data"]["prioritaet"] == 3
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_fin_grenze_an_umlaut(self, engine, monkeypatch):
+        fin_re = engine.compile(flowers_handler._FIN_NAKED_RE.pattern)
+        monkeypatch.setattr(flowers_handler, "_FIN_NAKED_RE", fin_re)
+        handler = FlowersHandler()
+        assert handler.extract_fin_from_text("ÄWBA12345678901234 bereit") is None
+        assert handler.extract_fin_from_text("Fahrzeug (WBA12345678901234) bereit") == "WBA12345678901234"
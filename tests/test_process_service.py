@@ -0,0 +1,137 @@
+# tests/test_process_service.py
+import asyncio
+
+import pytest
+
+from src.core.mappings import BEARBEITER_ALIASES, BEARBEITER_INDEX
+from src.models.integration import UnifiedProcessData
+from src.services.process_service import ProcessService
+
+
+class FakeBigQueryService:
+    """Zeichnet Stammdaten-MERGEs und Prozess-Inserts auf"""
+
+    def __init__(self, vorhanden=()):
+        self.vorhanden = set(vorhanden)
+        self.merges = []
+        self.prozesse = []
+
+    async def create_fahrzeuge_stamm_if_missing(self, vehicles, now_iso=None):
+        self.merges.append([vehicle_data["fin"] for vehicle_data in vehicles])
+        neu = {vehicle_data["fin"] for vehicle_data in vehicles} - self.vorhanden
+        self.vorhanden |= neu
+        return len(neu)
+
+    async def create_fahrzeug_prozesse_bulk(self, rows, now_iso=None):
+        self.prozesse.extend(rows)
+        return True
+
+
+def _daten(fin, **felder):
+    return UnifiedProcessData(
+        fin=fin, prozess_typ="gwa", status="gestartet", datenquelle="zapier", **felder
+    )
+
+
+class TestProcessUnifiedBatch:
+
+    def setup_method(self):
+        self.bq = FakeBigQueryService(vorhanden={"WBA00000000000002"})
+        self.service = ProcessService(bq_service=self.bq)
+
+    def test_fehlende_fahrzeuge_per_merge(self):
+        items = [
+            _daten("WBA00000000000001", marke="BMW", modell="320d"),
+            _daten("WBA00000000000001", marke="BMW", modell="320d"),
+            _daten("WBA00000000000002", marke="Audi", modell="A4"),
+            # Ohne Marke/Modell kein Stammdaten-Kandidat
+            _daten("WBA00000000000003"),
+        ]
+
+        ergebnis = asyncio.run(self.service.process_unified_batch(items))
+
+        assert ergebnis["success"] is True
+        assert ergebnis["vehicles_created"] == 1
+        assert len(ergebnis["process_ids"]) == 4
+        # Ein MERGE für alle Kandidaten, jede FIN einmal - kein Existenz-Check vorab
+        assert self.bq.merges == [["WBA00000000000001", "WBA00000000000002"]]
+        assert {row["prozess_typ"] for row in self.bq.prozesse} == {"Aufbereitung"}
+
+    def test_bekannte_fahrzeuge_ohne_erneuten_merge(self):
+        items = [_daten("WBA00000000000001", marke="BMW", modell="320d")]
+
+        async def run():
+            await self.service.process_unified_batch(items)
+            return await self.service.process_unified_batch(items)
+
+        ergebnis = asyncio.run(run())
+        assert ergebnis["vehicles_created"] == 0
+        assert self.bq.merges == [["WBA00000000000001"]]
+
+    def test_fehlgeschlagene_speicherung(self):
+        async def nicht_gespeichert(rows, now_iso=None):
+            return False
+
+        self.bq.create_fahrzeug_prozesse_bulk = nicht_gespeichert
+        items = [_daten("WBA00000000000001"), _daten("WBA00000000000003")]
+
+        ergebnis = asyncio.run(self.service.process_unified_batch(items))
+        assert ergebnis["success"] is False
+        assert ergebnis["anzahl"] == 2
+        assert ergebnis["error"] == "Prozesse konnten nicht in BigQuery gespeichert werden"
+
+
+def _bearbeiter_referenz(eingabe):
+    """Referenz ohne Token-Index: exakter Treffer (beliebige Schreibweise), sonst erster Teilstring-Treffer"""
+    if not eingabe:
+        return None
+    eingabe_lower = eingabe.lower()
+    if eingabe_lower in BEARBEITER_INDEX:
+        return BEARBEITER_INDEX[eingabe_lower]
+    for kurzform, name in BEARBEITER_ALIASES.items():
+        if eingabe_lower in kurzform.lower() or kurzform.lower() in eingabe_lower:
+            return name
+    return eingabe
+
+
+class TestResolveBearbeiter:
+
+    @pytest.mark.parametrize("eingabe, erwartet", [
+        # Vollständige Namen und Kurzformen
+        ("Thomas Küfner", "Thomas Küfner"),
+        ("Thomas K.", "Thomas Küfner"),
+        ("Thomas W.", "Thomas Weber"),
+        ("Jürgen", "Jürgen Hoffmann"),
+        # Groß-/Kleinschreibung
+        ("thomas k.", "Thomas Küfner"),
+        ("THOMAS W.", "Thomas Weber"),
+        ("sandra richter", "Sandra Richter"),
+        ("ANNA KLEIN", "Anna Klein"),
+        ("jürgen", "Jürgen Hoffmann"),
+        # Mehrdeutiger Vorname: erster Treffer der Tabelle
+        ("thomas", "Thomas Küfner"),
+        ("Thomas", "Thomas Küfner"),
+        # Teilstrings
+        ("Alexander", "Alexander König"),
+        ("Mike", "Michael Schmidt"),
+        ("Max", "Maximilian Reinhardt"),
+        # Unbekannt - Eingabe unverändert
+        ("Weber", "Weber"),
+        ("Unbekannt Person", "Unbekannt Person"),
+        ("", None),
+        (None, None),
+    ])
+    def test_zuordnung(self, eingabe, erwartet):
+        assert ProcessService.resolve_bearbeiter(eingabe) == erwartet
+
+    def test_gleiches_ergebnis_wie_teilstring_suche(self):
+        # Der vorberechnete Token-Index darf das Ergebnis der Teilstring-Suche nicht verändern
+        namen = (*BEARBEITER_ALIASES, *BEARBEITER_ALIASES.values())
+        eingaben = {
+            variante
+            for name in namen
+            for teil in (name, *name.split())
+            for variante in (teil, teil.lower(), teil.upper())
+        }
+        for eingabe in sorted(eingaben):
+            assert ProcessService.resolve_bearbeiter(eingabe) == _bearbeiter_referenz(eingabe), eingabe
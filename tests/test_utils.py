@@ -0,0 +1,64 @@
+# tests/test_utils.py
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core import utils
+from src.core.utils import new_process_id, normalize_fin
+
+PROCESS_ID_RE = re.compile(r"PROC_[0-9a-f]{19}")
+
+
+class TestNewProcessId:
+
+    def test_format(self):
+        process_id = new_process_id()
+        assert len(process_id) == 24
+        assert PROCESS_ID_RE.fullmatch(process_id)
+
+    def test_zeitlich_sortierbar(self, monkeypatch):
+        uhr = iter(range(1_700_000_000_000_000_000, 1_700_000_000_100_000_000, 1_000_000))
+        monkeypatch.setattr(utils.time, "time_ns", lambda: next(uhr))
+
+        ids = [new_process_id() for _ in range(50)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 50
+        assert ids[0][5:16] == f"{1_700_000_000_000:011x}"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork nicht verfügbar")
+    def test_neuer_seed_nach_fork(self):
+        lesen, schreiben = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(schreiben, f"{utils._id_rng.getrandbits(64):016x}".encode())
+            finally:
+                os._exit(0)
+        os.close(schreiben)
+        kind = os.read(lesen, 16).decode()
+        os.close(lesen)
+        os.waitpid(pid, 0)
+
+        # Ohne Neu-Seeding würde das Kind dieselbe Folge wie der Elternprozess liefern
+        assert kind != f"{utils._id_rng.getrandbits(64):016x}"
+
+
+class TestNormalizeFin:
+
+    @pytest.mark.parametrize("eingabe, erwartet", [
+        ("wba 12345-678901234", "WBA12345678901234"),
+        ("WBA12345678901234", "WBA12345678901234"),
+    ])
+    def test_normalisierung(self, eingabe, erwartet):
+        assert normalize_fin(eingabe) == erwartet
+
+    def test_zapier_adapter_nur_mit_src_im_pfad(self):
+        # Adapter laufen mit src/ als Wurzel (ohne src-Paket) - der Import darf nicht über src.* gehen
+        src = Path(__file__).resolve().parent.parent / "src"
+        code = "from adapters.zapier_adapter import ZapierAdapter"
+        ergebnis = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True)
+        assert ergebnis.returncode == 0, ergebnis.stderr
@@ -0,0 +1,32 @@
+# tests/test_vehicle_service.py
+import pytest
+
+from src.services.vehicle_service import VehicleService
+
+
+class TestBewertungsstufen:
+    """Grenzwerte der bisect-Tabellen: jeweils unter, auf und über der Stufengrenze"""
+
+    def setup_method(self):
+        self.service = VehicleService(bq_service=object())
+
+    @pytest.mark.parametrize("tage_bis_deadline, erwartet", [
+        (None, "unknown"),
+        (-5, "violated"), (-2, "violated"), (-1, "violated"),
+        (0, "critical"), (1, "critical"),
+        (2, "warning"), (3, "warning"),
+        (4, "ok"), (30, "ok"),
+    ])
+    def test_sla_status(self, tage_bis_deadline, erwartet):
+        assert self.service._calculate_sla_status(tage_bis_deadline) == erwartet
+
+    @pytest.mark.parametrize("prioritaet, erwartet", [
+        (None, "Normal"),
+        (1, "Sehr Hoch"), (2, "Sehr Hoch"),
+        (3, "Hoch"), (4, "Hoch"),
+        (5, "Normal"), (6, "Normal"),
+        (7, "Niedrig"), (8, "Niedrig"),
+        (9, "Sehr Niedrig"), (10, "Sehr Niedrig"),
+    ])
+    def test_prioritaet_label(self, prioritaet, erwartet):
+        assert self.service._get_priority_label(prioritaet) == erwartet